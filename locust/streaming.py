@@ -30,6 +30,15 @@ def _(parser):
         required=True,
         help="Node name for streaming test (required)",
     )
+    parser.add_argument(
+        "--max-latency-ms",
+        type=float,
+        default=None,
+        help=(
+            "Fail the run (exit code 1) if the 95th percentile of any WS latency, "
+            "or the server-side mean publish or send latency, exceeds this"
+        ),
+    )
 
 
 @events.init.add_listener
@@ -47,6 +56,65 @@ def on_locust_init(environment, **kwargs):
     )
 
 
+@events.quitting.add_listener
+def check_latency(environment, **kwargs):
+    """Report server-side streaming metrics, and enforce --max-latency-ms."""
+    max_latency_ms = environment.parsed_options.max_latency_ms
+    failures = []
+
+    for name in [
+        "write_to_websocket_delivery",
+        "write_to_server_receipt",
+        "server_receipt_to_websocket_delivery",
+    ]:
+        stats = environment.stats.get(name, "WS")
+        if not stats.num_requests:
+            continue
+        p95 = stats.get_response_time_percentile(0.95)
+        logger.info(f"{name}: p95 {p95:.1f}ms over {stats.num_requests} messages")
+        if max_latency_ms is not None and p95 > max_latency_ms:
+            failures.append(f"{name} p95 {p95:.1f}ms")
+
+    for metric, mean in server_streaming_means(
+        environment.host, environment.parsed_options.api_key
+    ).items():
+        logger.info(f"server {metric}: mean {mean * 1000:.1f}ms")
+        if max_latency_ms is not None and mean * 1000 > max_latency_ms:
+            failures.append(f"server {metric} mean {mean * 1000:.1f}ms")
+
+    if failures:
+        logger.error(f"Latency above {max_latency_ms}ms: {', '.join(failures)}")
+        environment.process_exit_code = 1
+
+
+def server_streaming_means(host, api_key):
+    """Mean streaming latencies (seconds) from the server's Prometheus metrics"""
+    import httpx
+    from prometheus_client.parser import text_string_to_metric_families
+
+    response = httpx.get(
+        f"{host}/api/v1/metrics", headers={"Authorization": f"Apikey {api_key}"}
+    )
+    if response.status_code != 200:
+        logger.warning(f"Could not read server metrics: {response.status_code}")
+        return {}
+    means = {}
+    for family in text_string_to_metric_families(response.text):
+        if family.name not in {
+            "tiled_stream_publish_duration_seconds",
+            "tiled_stream_send_latency_seconds",
+        }:
+            continue
+        totals = {"_sum": 0.0, "_count": 0.0}
+        for sample in family.samples:
+            for suffix in totals:
+                if sample.name == family.name + suffix:
+                    totals[suffix] += sample.value
+        if totals["_count"]:
+            means[family.name] = totals["_sum"] / totals["_count"]
+    return means
+
+
 def create_streaming_node(host, api_key, node_name):
     """Create a streaming array node using Tiled client"""
     from tiled.client import from_uri
@@ -203,6 +271,25 @@ class StreamingUser(HttpUser):
                         exception=None,
                     )
 
+                    # Split the end-to-end latency at the moment the server
+                    # received the write, to tell the upload from the fan-out.
+                    server_received_at = data.get("server_received_at")
+                    if server_received_at is not None:
+                        events.request.fire(
+                            request_type="WS",
+                            name="write_to_server_receipt",
+                            response_time=(server_received_at - write_time) * 1000,
+                            response_length=0,
+                            exception=None,
+                        )
+                        events.request.fire(
+                            request_type="WS",
+                            name="server_receipt_to_websocket_delivery",
+                            response_time=(received_time - server_received_at) * 1000,
+                            response_length=len(message),
+                            exception=None,
+                        )
+
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             events.request.fire(
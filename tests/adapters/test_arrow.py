@@ -1,9 +1,14 @@
+import io
 import tempfile
 
+import pandas
 import pyarrow as pa
 import pytest
 
 from tiled.adapters.arrow import ArrowAdapter
+from tiled.adapters.mapping import MapAdapter
+from tiled.client import Context, from_context
+from tiled.server.app import build_app
 from tiled.storage import FileStorage
 from tiled.structures.core import StructureFamily
 from tiled.structures.data_source import DataSource, Management
@@ -88,3 +93,59 @@ def test_write_read(adapter: ArrowAdapter) -> None:
     # test adapter.write() raises NotImplementedError when there are more than 1 partitions
     with pytest.raises(NotImplementedError):
         adapter.write(batch0)
+
+
+def test_read_partition_table(adapter: ArrowAdapter) -> None:
+    adapter.write_partition(0, [batch0, batch1])
+    table = adapter.read_partition_table(0)
+    assert isinstance(table, pa.Table)
+    assert table == pa.Table.from_batches([batch0, batch1])
+    assert adapter.read_partition_table(0, ["f1"]) == table.select(["f1"])
+    with pytest.raises(KeyError):
+        adapter.read_partition_table(0, ["missing"])
+
+
+def test_read_partition_ipc(adapter: ArrowAdapter) -> None:
+    adapter.write_partition(0, [batch0, batch1])
+    arrow_file = adapter.read_partition_ipc(0)
+    table = pa.ipc.open_file(pa.BufferReader(arrow_file.data)).read_all()
+    assert table == pa.Table.from_batches([batch0, batch1])
+    # Rewriting the partition replaces the file, changing its ETag.
+    adapter.write_partition(0, batch2)
+    assert adapter.read_partition_ipc(0).etag != arrow_file.etag
+    # The bytes read before are still valid.
+    assert pa.ipc.open_file(pa.BufferReader(arrow_file.data)).read_all() == table
+
+
+def test_serve_ipc_file(adapter: ArrowAdapter) -> None:
+    adapter.write_partition(0, [batch0, batch1])
+    adapter.write_partition(1, batch2)
+    adapter.write_partition(2, batch0)
+    app = build_app(MapAdapter({"table": adapter}))
+    with Context.from_app(app) as context:
+        links = from_context(context)["table"].item["links"]
+        url = links["partition"].split("?")[0]
+        response = context.http_client.get(url, params={"partition": 0})
+        response.raise_for_status()
+        # The partition is sent as the file that stores it.
+        assert response.content == adapter.read_partition_ipc(0).data.to_pybytes()
+        etag = response.headers["ETag"]
+        response = context.http_client.get(
+            url, params={"partition": 0}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        # Other formats, and subsets of the columns, are serialized as before.
+        response = context.http_client.get(
+            url, params={"partition": 0, "format": "csv"}
+        )
+        response.raise_for_status()
+        actual = pandas.read_csv(io.StringIO(response.text))
+        assert list(actual["f0"]) == [*range(1, 13)]
+        response = context.http_client.get(url, params={"partition": 0, "column": "f1"})
+        response.raise_for_status()
+        actual = pa.ipc.open_file(pa.BufferReader(response.content)).read_all()
+        assert actual.column_names == ["f1"]
+        response = context.http_client.get(links["full"])
+        response.raise_for_status()
+        actual = pa.ipc.open_file(pa.BufferReader(response.content)).read_all()
+        assert actual == pa.Table.from_batches([batch0, batch1, batch2, batch0])
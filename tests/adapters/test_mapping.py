@@ -0,0 +1,206 @@
+import pytest
+
+from tiled.adapters.mapping import MapAdapter
+from tiled.queries import (
+    Comparison,
+    Contains,
+    Eq,
+    FullText,
+    In,
+    NotEq,
+    NotIn,
+    Regex,
+)
+
+
+class Child:
+    "Stands in for an adapter, counting reads of its metadata"
+
+    reads = 0
+
+    def __init__(self, metadata):
+        self._metadata = metadata
+
+    def metadata(self):
+        Child.reads += 1
+        return self._metadata
+
+
+@pytest.fixture
+def mapping():
+    Child.reads = 0
+    mapping = {
+        f"n{i}": Child(
+            {
+                "number": i,
+                "parity": "even" if i % 2 == 0 else "odd",
+                "tags": ["small" if i < 5 else "large", "Tag"],
+                "nested": {"text": f"Sample number{i}"},
+            }
+        )
+        for i in range(10)
+    }
+    mapping["nan"] = Child({"number": float("nan")})
+    mapping["list"] = Child({"parity": ["even", "odd"]})
+    mapping["empty"] = Child({})
+    return mapping
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (Eq("parity", "odd"), ["n1", "n3", "n5", "n7", "n9"]),
+        (Eq("parity", ["even", "odd"]), ["list"]),
+        (Eq("nested.text", "Sample number3"), ["n3"]),
+        (
+            NotEq("number", 3),
+            ["n0", "n1", "n2", "n4", "n5", "n6", "n7", "n8", "n9", "nan"],
+        ),
+        (In("number", [8, 1]), ["n1", "n8"]),
+        (NotIn("parity", ["even"]), ["n1", "n3", "n5", "n7", "n9", "list"]),
+        (Contains("tags", "small"), ["n0", "n1", "n2", "n3", "n4"]),
+        (Comparison("lt", "number", 2), ["n0", "n1"]),
+        (Comparison("le", "number", 2), ["n0", "n1", "n2"]),
+        (Comparison("gt", "number", 7.5), ["n8", "n9"]),
+        (Comparison("ge", "number", 8), ["n8", "n9"]),
+        (Comparison("gt", "nested.text", "Sample number7"), ["n8", "n9"]),
+        (FullText("number4 number6"), ["n4", "n6"]),
+        # Metadata is lowercased when searched; the query is not.
+        (FullText("Tag"), []),
+        (Regex("parity", "^o"), ["n1", "n3", "n5", "n7", "n9"]),
+    ],
+)
+def test_queries(mapping, query, expected):
+    assert list(MapAdapter(mapping).search(query)) == expected
+
+
+def test_indexes_are_reused(mapping):
+    tree = MapAdapter(mapping)
+    assert list(tree.search(Eq("parity", "odd")))
+    reads = Child.reads
+    assert reads == len(mapping)
+    # Further queries on the same key do not read the metadata again...
+    assert list(tree.search(Eq("parity", "even")))
+    assert list(tree.search(In("parity", ["odd"])))
+    assert Child.reads == reads
+    # ...nor do queries on the results, whose entries are intersected.
+    results = tree.search(Comparison("ge", "number", 4)).search(Eq("parity", "odd"))
+    assert Child.reads == reads + len(mapping)  # building the "number" index
+    assert list(results) == ["n5", "n7", "n9"]
+    assert list(results.search(Contains("tags", "large"))) == ["n5", "n7", "n9"]
+    assert list(results.search(Regex("nested.text", "7$"))) == ["n7"]
+
+
+def test_indexes_are_invalidated(mapping):
+    tree = MapAdapter(mapping)
+    assert list(tree.search(Eq("parity", "even"))) == ["n0", "n2", "n4", "n6", "n8"]
+    mapping["n10"] = Child({"parity": "even"})
+    assert list(tree.search(Eq("parity", "even")))[-1] == "n10"
+    reads = Child.reads
+    tree.must_revalidate = False
+    tree.search(Eq("parity", "even"))
+    assert Child.reads == reads + len(mapping)
+
+
+def test_indexes_are_invalidated_by_replaced_entries():
+    mapping = {"a": Child({"p": 1}), "b": Child({"p": 2})}
+    tree = MapAdapter(mapping)
+    assert list(tree.search(Eq("p", 2))) == ["b"]
+    # Replacing an entry in place...
+    mapping["a"] = Child({"p": 5})
+    assert list(tree.search(Eq("p", 5))) == ["a"]
+    # ...or removing one and adding another, of the same length
+    del mapping["b"]
+    mapping["c"] = Child({"p": 2})
+    assert list(tree.search(Eq("p", 2))) == ["c"]
+    assert list(tree.sort([("p", -1)])) == ["a", "c"]
+
+
+def test_comparison_of_mixed_types(mapping):
+    mapping["text"] = Child({"number": "three"})
+    with pytest.raises(TypeError):
+        MapAdapter(mapping).search(Comparison("gt", "number", 3))
+
+
+@pytest.fixture
+def sortable(mapping):
+    # A list does not compare with strings, nor NaN with numbers.
+    del mapping["list"], mapping["nan"]
+    return mapping
+
+
+def test_sort_orders_are_reused(sortable):
+    mapping = sortable
+    tree = MapAdapter(mapping)
+    sorting = [("parity", 1), ("number", -1)]
+    first = tree.sort(sorting)
+    reads = Child.reads
+    second = tree.sort(sorting)
+    assert Child.reads == reads
+    assert second._order is first._order
+    assert list(first.keys()) == list(second.keys())
+    # Entries without the key sort last; ties keep the given order.
+    assert list(first) == [
+        "n8", "n6", "n4", "n2", "n0", "n9", "n7", "n5", "n3", "n1", "empty"
+    ]  # fmt: skip
+    assert first.keys()[3:5] == ["n2", "n0"]
+    assert first.keys()[-1] == "empty"
+    assert first.keys()[-2] == "n1"
+    assert first.keys()[-3:-6:-1] == ["n3", "n5", "n7"]
+    assert list(first.items()[:2]) == [("n8", mapping["n8"]), ("n6", mapping["n6"])]
+    assert list(first.structure().keys)[:2] == ["n8", "n6"]
+    assert list(tree.sort([("_", -1)]))[:2] == ["empty", "n9"]
+
+
+def test_sort_with_queries(sortable):
+    mapping = sortable
+    tree = MapAdapter(mapping)
+    odd = Eq("parity", "odd")
+    descending = [("number", -1)]
+    expected = ["n9", "n7", "n5", "n3", "n1"]
+    assert list(tree.search(odd).sort(descending)) == expected
+    assert list(tree.sort(descending).search(odd)) == expected
+    assert tree.sort(descending).search(odd).keys()[1:3] == ["n7", "n5"]
+    # Sorting again keeps the current order among ties.
+    by_parity = tree.sort(descending).sort([("parity", 1)])
+    assert list(by_parity)[:6] == ["n8", "n6", "n4", "n2", "n0", "n9"]
+    # Entries added to the mapping are sorted into the views.
+    sorted_tree = tree.sort(descending)
+    mapping["n10"] = Child({"number": 10})
+    assert list(sorted_tree)[:3] == ["empty", "n10", "n9"]
+
+
+def test_sort_query_results_of_mixed_types():
+    "Only the values of the entries selected need to be comparable to sort them."
+    tree = MapAdapter(
+        {"a": Child({"p": 1}), "b": Child({"p": "x"}), "c": Child({"p": 0})}
+    )
+    assert list(tree.search(Eq("p", 1)).sort([("p", 1)])) == ["a"]
+    assert list(tree.search(NotEq("p", "x")).sort([("p", -1)])) == ["a", "c"]
+    with pytest.raises(TypeError):
+        tree.sort([("p", 1)])
+
+
+def test_index_from_the_end(mapping):
+    tree = MapAdapter(mapping)
+    assert tree.keys()[-1] == "empty"
+    assert tree.keys()[-2] == "list"
+    assert tree.keys()[-2:-4:-1] == ["list", "nan"]
+    assert tree.items()[-3] == ("nan", mapping["nan"])
+
+
+def test_comparison_after_filter():
+    "Only the values of the entries selected so far need to be comparable."
+    tree = MapAdapter(
+        {
+            "n1": Child({"kind": "num", "x": 1}),
+            "n2": Child({"kind": "num", "x": 2}),
+            "s": Child({"kind": "str", "x": "abc"}),
+            "n3": Child({"kind": "num", "x": 3}),
+        }
+    )
+    numbers = tree.search(Eq("kind", "num"))
+    assert list(numbers.search(Comparison("gt", "x", 1))) == ["n2", "n3"]
+    assert list(numbers.search(Comparison("le", "x", 2))) == ["n1", "n2"]
+    with pytest.raises(TypeError):
+        tree.search(Comparison("gt", "x", 1))
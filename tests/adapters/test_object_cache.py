@@ -0,0 +1,150 @@
+import os
+
+import numpy
+import pytest
+import zarr
+from prometheus_client import REGISTRY
+
+from tiled.adapters.object_cache import ObjectCache
+from tiled.adapters.zarr import ZARR_LIB_V2
+
+
+def requests_total(result):
+    return (
+        REGISTRY.get_sample_value(
+            "tiled_object_cache_requests_total", {"result": result}
+        )
+        or 0
+    )
+
+
+def test_hit_and_miss(tmp_path):
+    cache = ObjectCache(tmp_path)
+    hits, misses = requests_total("hit"), requests_total("miss")
+    assert cache.get("s3://bucket", "a/c/0", "", "v1") is None
+    cache.put("s3://bucket", "a/c/0", "", "v1", b"data")
+    assert cache.get("s3://bucket", "a/c/0", "", "v1") == b"data"
+    # Other ranges, objects, and buckets are distinct entries.
+    assert cache.get("s3://bucket", "a/c/0", "0-2", "v1") is None
+    assert cache.get("s3://bucket", "a/c/1", "", "v1") is None
+    assert cache.get("s3://other", "a/c/0", "", "v1") is None
+    assert requests_total("hit") - hits == 1
+    assert requests_total("miss") - misses == 4
+
+
+def test_changed_object_is_not_served(tmp_path):
+    cache = ObjectCache(tmp_path)
+    cache.put("s3://bucket", "key", "", "v1", b"old")
+    assert cache.get("s3://bucket", "key", "", "v2") is None
+    cache.put("s3://bucket", "key", "", "v2", b"new")
+    assert cache.get("s3://bucket", "key", "", "v2") == b"new"
+    # The entry for the old version was removed.
+    assert cache.get("s3://bucket", "key", "", "v1") is None
+    # Without an ETag, any version is served.
+    assert cache.get("s3://bucket", "key", "") == b"new"
+    cache.invalidate("s3://bucket", "key")
+    assert cache.get("s3://bucket", "key", "") is None
+
+
+def test_shared_between_processes(tmp_path):
+    "Caches (e.g. in separate worker processes) may share a directory."
+    ObjectCache(tmp_path).put("s3://bucket", "key", "", "v1", b"data")
+    assert ObjectCache(tmp_path).get("s3://bucket", "key", "", "v1") == b"data"
+    # No temporary files are left behind.
+    assert not [
+        name for _, _, names in os.walk(tmp_path) for name in names if name[0] == "."
+    ]
+
+
+def test_least_recently_used_evicted(tmp_path):
+    cache = ObjectCache(tmp_path, max_bytes=1000)
+    # Each entry is 290 bytes of data and a line holding the ETag.
+    for i, key in enumerate("abc"):
+        cache.put("s3://bucket", key, "", "v1", bytes(290))
+        path = cache._candidates("s3://bucket", key, "", "v1")[0]
+        os.utime(path, (i, i))
+    assert cache.evict() == 0
+    # Use "a", so that "b" is the least recently used.
+    assert cache.get("s3://bucket", "a", "", "v1") is not None
+    cache.put("s3://bucket", "d", "", "v1", bytes(290))  # over budget
+    assert cache.get("s3://bucket", "b", "", "v1") is None
+    for key in "acd":
+        assert cache.get("s3://bucket", key, "", "v1") is not None
+
+
+@pytest.mark.skipif(ZARR_LIB_V2, reason="requires zarr-python 3")
+def test_zarr_reads_through_cache(tmp_path):
+    from obstore.store import MemoryStore
+    from zarr.storage import ObjectStore
+
+    from tiled.adapters.zarr import CachingObjectStore
+
+    # An in-memory store stands in for a bucket.
+    store = ObjectStore(MemoryStore())
+    cache = ObjectCache(tmp_path)
+    cached_store = CachingObjectStore(store, cache, "memory://bucket")
+    expected = numpy.arange(100).reshape(10, 10)
+    array = zarr.create_array(cached_store, shape=(10, 10), chunks=(5, 5), dtype=int)
+    array[:] = expected
+
+    hits, misses = requests_total("hit"), requests_total("miss")
+    numpy.testing.assert_equal(array[:], expected)
+    assert requests_total("miss") - misses == 4  # one per chunk
+    numpy.testing.assert_equal(array[:], expected)
+    assert requests_total("hit") - hits == 4
+
+    # Writing through the wrapper invalidates the cached chunk...
+    array[:5, :5] = 0
+    expected[:5, :5] = 0
+    numpy.testing.assert_equal(array[:], expected)
+    # ...and writing around it changes the ETag.
+    other = zarr.open_array(store, mode="r+")
+    other[5:, 5:] = 1
+    expected[5:, 5:] = 1
+    numpy.testing.assert_equal(array[:], expected)
+
+
+@pytest.mark.skipif(ZARR_LIB_V2, reason="requires zarr-python 3")
+def test_zarr_revalidates_with_one_conditional_request(tmp_path, monkeypatch):
+    import obstore
+    from obstore.store import MemoryStore
+    from zarr.storage import ObjectStore
+
+    from tiled.adapters.zarr import CachingObjectStore
+
+    memory_store = MemoryStore()
+    cached_store = CachingObjectStore(
+        ObjectStore(memory_store), ObjectCache(tmp_path), "memory://bucket"
+    )
+    array = zarr.create_array(cached_store, shape=(4,), chunks=(4,), dtype=int)
+    array[:] = numpy.arange(4)
+
+    # Record the requests for the chunk. No HEAD requests are made.
+    requests = []
+    get_async = obstore.get_async
+
+    async def recording_get_async(store, key, options=None):
+        if key == "c/0":
+            requests.append((options or {}).get("if_none_match"))
+        return await get_async(store, key, options=options)
+
+    monkeypatch.setattr(obstore, "get_async", recording_get_async)
+    monkeypatch.delattr(obstore, "head_async")
+
+    numpy.testing.assert_equal(array[:], numpy.arange(4))
+    assert requests == [None]  # a miss
+    etag, _ = ObjectCache(tmp_path).lookup("memory://bucket", "c/0", "")
+    requests.clear()
+    hits = requests_total("hit")
+    numpy.testing.assert_equal(array[:], numpy.arange(4))
+    assert requests == [etag]  # one request, answered "Not Modified"
+    assert requests_total("hit") - hits == 1
+
+    # After the object changes, the data read is cached under its own ETag.
+    zarr.open_array(ObjectStore(memory_store), mode="r+")[:] = 7
+    numpy.testing.assert_equal(array[:], 7)
+    current = obstore.get(memory_store, "c/0")
+    assert current.meta["e_tag"] != etag
+    cached_etag, data = ObjectCache(tmp_path).lookup("memory://bucket", "c/0", "")
+    assert cached_etag == current.meta["e_tag"]
+    assert data == bytes(current.bytes())
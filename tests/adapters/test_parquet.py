@@ -0,0 +1,113 @@
+import numpy
+import pandas
+import pyarrow.dataset
+import pyarrow.parquet
+import pytest
+
+from tiled.adapters.parquet import ParquetDatasetAdapter
+from tiled.structures.table import TableStructure
+from tiled.table_filter import TableFilter
+from tiled.utils import ensure_uri
+
+df = pandas.DataFrame(
+    {
+        "x": numpy.arange(100),
+        "y": numpy.arange(100) * 0.5,
+        "label": [["a", "b", "c", "d"][i % 4] for i in range(100)],
+    }
+)
+
+
+@pytest.fixture
+def adapter(tmp_path) -> ParquetDatasetAdapter:
+    # Two partitions of 60 and 40 rows, in row groups of 25 rows
+    uris = []
+    for i, part in enumerate([df.iloc[:60], df.iloc[60:]]):
+        path = tmp_path / f"partition-{i}.parquet"
+        pyarrow.parquet.write_table(
+            pyarrow.Table.from_pandas(part, preserve_index=False),
+            path,
+            row_group_size=25,
+        )
+        uris.append(ensure_uri(path))
+    structure = TableStructure.from_pandas(df)
+    structure.npartitions = 2
+    return ParquetDatasetAdapter(uris, structure)
+
+
+def test_read(adapter: ParquetDatasetAdapter) -> None:
+    pandas.testing.assert_frame_equal(adapter.read(), df)
+    pandas.testing.assert_frame_equal(adapter.read(["y", "x"]), df[["y", "x"]])
+    pandas.testing.assert_frame_equal(
+        adapter.read_partition(1, ["label"]),
+        df[["label"]].iloc[60:].reset_index(drop=True),
+    )
+    with pytest.raises(KeyError):
+        adapter.read(["nope"])
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [slice(0, 10), slice(20, 30), slice(55, 70), slice(90, None), slice(None, 0)],
+)
+def test_read_rows(adapter: ParquetDatasetAdapter, rows: slice) -> None:
+    # Rows keep their positions (in the table, or in the partition) as index.
+    pandas.testing.assert_frame_equal(adapter.read_subset(rows=rows), df.iloc[rows])
+    pandas.testing.assert_frame_equal(
+        adapter.read_partition_subset(1, ["x"], rows=rows),
+        df[["x"]].iloc[60:].reset_index(drop=True).iloc[rows],
+    )
+
+
+@pytest.mark.parametrize(
+    "text, rows",
+    [
+        ("x >= 73", None),
+        ("label in ['a', 'c'] and y < 10", None),
+        ("not (x < 50) or label == 'b'", slice(40, 80)),
+    ],
+)
+def test_read_filter(adapter: ParquetDatasetAdapter, text: str, rows) -> None:
+    table_filter = TableFilter(text)
+    subset = df.iloc[rows] if rows is not None else df
+    expected = subset[table_filter.mask(subset)][["x"]]
+    actual = adapter.read_subset(["x"], rows, table_filter)
+    pandas.testing.assert_frame_equal(actual, expected)
+
+
+def test_read_rows_row_groups(adapter: ParquetDatasetAdapter) -> None:
+    "Only the row groups spanning the rows requested, and the filter, are read"
+    dataset = pyarrow.dataset.dataset(
+        [str(path) for path in adapter._existing_paths()], format="parquet"
+    )
+    _, positions, num_rows = adapter._read_row_groups(
+        dataset, None, slice(55, 70), None
+    )
+    # Rows 50-60 are the third row group of the first partition, and rows
+    # 60-85 the first row group of the second.
+    assert num_rows == 100
+    numpy.testing.assert_equal(positions, numpy.arange(50, 85))
+    # Row groups whose statistics exclude the filter are skipped.
+    expression = TableFilter("x >= 90").expression()
+    _, positions, _ = adapter._read_row_groups(dataset, None, None, expression)
+    numpy.testing.assert_equal(positions, numpy.arange(85, 100))
+
+
+def test_stored_index(tmp_path) -> None:
+    "An index stored with the data is kept"
+    path = tmp_path / "indexed.parquet"
+    indexed = df.set_index("label", drop=False)
+    indexed.to_parquet(path, row_group_size=25)
+    adapter = ParquetDatasetAdapter(
+        [ensure_uri(path)], TableStructure.from_pandas(indexed)
+    )
+    pandas.testing.assert_frame_equal(
+        adapter.read_subset(["x"], slice(10, 20)), indexed[["x"]].iloc[10:20]
+    )
+
+
+def test_bad_filter(adapter: ParquetDatasetAdapter) -> None:
+    with pytest.raises(ValueError):
+        adapter.read_subset(filter=TableFilter("label > 3"))
+    with pytest.raises(KeyError):
+        adapter.read_subset(["x"], filter=TableFilter("z > 3"))
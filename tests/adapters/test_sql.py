@@ -1,3 +1,4 @@
+from contextlib import closing
 from pathlib import Path
 from typing import Any, Callable, Generator, Optional, Union, cast
 
@@ -9,6 +10,7 @@ from tiled.adapters.sql import (
     COLUMN_NAME_PATTERN,
     TABLE_NAME_PATTERN,
     SQLAdapter,
+    _SQLExpression,
     is_safe_identifier,
 )
 from tiled.storage import (
@@ -20,6 +22,7 @@ from tiled.storage import (
 from tiled.structures.core import StructureFamily
 from tiled.structures.data_source import DataSource, Management
 from tiled.structures.table import TableStructure
+from tiled.table_filter import TableFilter
 from tiled.utils import UnsafeIdentifier
 
 names = ["f0", "f1", "f2", "f3"]
@@ -1273,3 +1276,176 @@ def test_column_name_too_long(data_uri: str, request: pytest.FixtureRequest) ->
         r'return_an_exception_because_it_is_over_sixty_three_characters": max bytes is 63+',
     ):
         SQLAdapter.init_storage(data_source=data_source, storage=storage)
+
+
+@pytest.mark.parametrize("data_uri", ["sqlite_uri", "duckdb_uri", "postgres_uri"])
+def test_read_batches(
+    data_uri: str,
+    data_source_from_init_storage: Callable[
+        [str, int, Optional[pa.Table]], DataSource[TableStructure]
+    ],
+    request: pytest.FixtureRequest,
+) -> None:
+    "Stream a table too large for one batch, cast to its original types."
+    n = 5000
+    table = pa.table(
+        {
+            "A": pa.array(np.arange(n) % 200, type=pa.uint8()),
+            "b": pa.array(np.arange(n, dtype=np.float32)),
+        }
+    )
+    data_source = data_source_from_init_storage(
+        request.getfixturevalue(data_uri), 2, table
+    )
+    adapter = adapter_from_data_source(data_source)
+    adapter.append_partition(0, table)
+    adapter.append_partition(1, table.slice(0, 10))
+
+    reader = adapter.read_batches()
+    assert reader.schema == table.schema
+    batches = list(reader)
+    assert len(batches) > 1
+    assert all(batch.schema == table.schema for batch in batches)
+    assert pa.Table.from_batches(batches) == pa.concat_tables(
+        [table, table.slice(0, 10)]
+    )
+    assert adapter.read_partition_batches(1, ["b"]).read_all() == table.slice(
+        0, 10
+    ).select(["b"])
+
+
+@pytest.mark.parametrize("data_uri", ["sqlite_uri", "duckdb_uri", "postgres_uri"])
+def test_read_subset(
+    data_uri: str,
+    data_source_from_init_storage: Callable[..., DataSource[TableStructure]],
+    request: pytest.FixtureRequest,
+) -> None:
+    "Rows selected by position and by value in the database"
+    data_source = data_source_from_init_storage(
+        request.getfixturevalue(data_uri),
+        2,
+        _ts_value_schema.empty_table(),
+        {"order_by_args": _order_by_ts_asc},
+    )
+    adapter = adapter_from_data_source(data_source, order_by_args=_order_by_ts_asc)
+    adapter.append_partition(
+        0, pa.table({"ts": [50, 30, 60], "value": [5.0, 3.0, 6.0]})
+    )
+    adapter.append_partition(
+        1, pa.table({"ts": [40, 10, 20], "value": [4.0, 1.0, 2.0]})
+    )
+
+    # By position, in the order given by the order_by_args
+    assert adapter.read_subset(rows=slice(1, 4))["ts"].tolist() == [20, 30, 40]
+    assert adapter.read_subset(rows=slice(4, None))["ts"].tolist() == [50, 60]
+    assert adapter.read_partition_subset(1, rows=slice(None, 2))["ts"].tolist() == [
+        10,
+        20,
+    ]
+    # By value, with literals as parameters
+    actual = adapter.read_subset(["value"], filter=TableFilter("ts > 25 and ts != 40"))
+    assert list(actual.columns) == ["value"]
+    assert actual["value"].tolist() == [3.0, 5.0, 6.0]
+    actual = adapter.read_partition_subset(
+        1, filter=TableFilter("45 > ts and not ts in [20]")
+    )
+    assert actual["ts"].tolist() == [10, 40]
+    # By position, and then by value
+    actual = adapter.read_subset(
+        ["value"], rows=slice(0, 3), filter=TableFilter("ts >= 50 or ts < 20")
+    )
+    assert actual["value"].tolist() == [1.0]
+    with pytest.raises(KeyError):
+        adapter.read_subset(filter=TableFilter("missing > 1"))
+    # From the end
+    assert adapter.read_subset(rows=slice(-2, None))["ts"].tolist() == [50, 60]
+    assert adapter.read_subset(rows=slice(-10, None))["ts"].tolist() == [
+        10,
+        20,
+        30,
+        40,
+        50,
+        60,
+    ]
+    assert adapter.read_subset(rows=slice(-4, 3))["ts"].tolist() == [30]
+    assert adapter.read_partition_subset(0, rows=slice(-1, None))["ts"].tolist() == [60]
+    actual = adapter.read_subset(
+        ["value"], rows=slice(-3, None), filter=TableFilter("ts != 50")
+    )
+    assert actual["value"].tolist() == [4.0, 6.0]
+
+
+@pytest.mark.parametrize("data_uri", ["sqlite_uri", "duckdb_uri", "postgres_uri"])
+def test_read_subset_without_ordering(
+    data_uri: str,
+    data_source_from_init_storage: Callable[..., DataSource[TableStructure]],
+    request: pytest.FixtureRequest,
+) -> None:
+    "Without order_by_args, positions follow the order in which rows were stored"
+    data_source = data_source_from_init_storage(
+        request.getfixturevalue(data_uri), 2, _ts_value_schema.empty_table()
+    )
+    adapter = adapter_from_data_source(data_source)
+    adapter.append_partition(
+        0, pa.table({"ts": [50, 30, 60], "value": [5.0, 3.0, 6.0]})
+    )
+    adapter.append_partition(
+        1, pa.table({"ts": [40, 10, 20], "value": [4.0, 1.0, 2.0]})
+    )
+    adapter.append_partition(0, pa.table({"ts": [70], "value": [7.0]}))
+
+    assert adapter.read_subset(rows=slice(2, 5))["ts"].tolist() == [60, 70, 40]
+    assert adapter.read_subset(rows=slice(-2, None))["ts"].tolist() == [10, 20]
+    assert adapter.read_partition_subset(0, rows=slice(-2, None))["ts"].tolist() == [
+        60,
+        70,
+    ]
+
+
+@pytest.mark.parametrize("data_uri", ["sqlite_uri", "duckdb_uri"])
+def test_ordering_index(
+    data_uri: str,
+    data_source_from_init_storage: Callable[..., DataSource[TableStructure]],
+    request: pytest.FixtureRequest,
+) -> None:
+    "init_storage indexes the rows of each dataset by partition and ordering"
+    data_source = data_source_from_init_storage(
+        request.getfixturevalue(data_uri),
+        1,
+        _ts_value_schema.empty_table(),
+        {"order_by_args": _order_by_ts_asc},
+    )
+    adapter = adapter_from_data_source(data_source, order_by_args=_order_by_ts_asc)
+    if data_uri == "sqlite_uri":
+        query = (
+            "SELECT sql FROM sqlite_master WHERE type = 'index' "
+            f"AND tbl_name = '{adapter.table_name}'"
+        )
+    else:
+        query = (
+            "SELECT sql FROM duckdb_indexes() "
+            f"WHERE table_name = '{adapter.table_name}'"
+        )
+    with closing(adapter.storage.connect()) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(query)
+            statements = [row[0] for row in cursor.fetchall()]
+    assert any(
+        "(_dataset_id,_partition_id,ts)" in statement.replace('"', "").replace(" ", "")
+        for statement in statements
+    )
+
+
+@pytest.mark.parametrize(
+    "dialect, expected",
+    [
+        ("sqlite", '(("a" > ?) AND ("b" IN (?, ?)))'),
+        ("postgresql", '(("a" > $1) AND ("b" IN ($2, $3)))'),
+    ],
+)
+def test_filter_to_sql(dialect: str, expected: str) -> None:
+    "Filters compile to SQL with the literals as parameters"
+    table_filter = TableFilter("1 < A and b in [\"x'; DROP TABLE t; --\", 'y']")
+    sql, params = table_filter.compile(_SQLExpression.column).render(dialect)
+    assert sql == expected
+    assert params == [1, "x'; DROP TABLE t; --", "y"]
@@ -0,0 +1,88 @@
+import threading
+from contextlib import closing
+from typing import Generator, List, cast
+
+import pyarrow as pa
+import pytest
+
+from tiled.adapters.sql_ingest import IngestBuffer
+from tiled.storage import (
+    SQLStorage,
+    parse_storage,
+    register_storage,
+    unregister_storage,
+)
+
+
+@pytest.fixture
+def storage(sqlite_uri: str) -> Generator[SQLStorage, None, None]:
+    storage = cast(SQLStorage, parse_storage(sqlite_uri))
+    register_storage(storage)
+    with closing(storage.connect()) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("CREATE TABLE t (a INTEGER)")
+            cursor.execute("CREATE UNIQUE INDEX t_a ON t(a)")
+        conn.commit()
+    yield storage
+    storage.dispose()
+    unregister_storage(storage)
+
+
+def read_column(storage: SQLStorage) -> List[int]:
+    with closing(storage.connect()) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT a FROM t ORDER BY a")
+            return [row[0] for row in cursor.fetchall()]
+
+
+def append_concurrently(buffer: IngestBuffer, storage: SQLStorage, values: List[int]):
+    "Append each value from its own thread, and return the errors raised"
+    errors = {}
+
+    def append(value: int) -> None:
+        try:
+            buffer.append(storage, pa.table({"a": [value]}))
+        except Exception as err:
+            errors[value] = err
+
+    threads = [threading.Thread(target=append, args=(value,)) for value in values]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_appends_committed_together(
+    storage: SQLStorage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    buffer = IngestBuffer("t", max_delay=0.5)
+    ingested = []
+    original = IngestBuffer._ingest
+
+    def spy(self, storage, tables):
+        ingested.append(len(tables))
+        return original(self, storage, tables)
+
+    monkeypatch.setattr(IngestBuffer, "_ingest", spy)
+    assert append_concurrently(buffer, storage, list(range(10))) == {}
+    assert read_column(storage) == list(range(10))
+    # The appends arrived within max_delay, so were written in fewer ingests.
+    assert sum(ingested) == 10
+    assert len(ingested) < 10
+
+
+def test_full_batch_is_not_delayed(storage: SQLStorage) -> None:
+    "A batch holding max_rows rows is written without waiting for max_delay"
+    buffer = IngestBuffer("t", max_delay=60, max_rows=3)
+    buffer.append(storage, pa.table({"a": [1, 2, 3]}))
+    assert read_column(storage) == [1, 2, 3]
+
+
+def test_failed_append_does_not_fail_others(storage: SQLStorage) -> None:
+    buffer = IngestBuffer("t", max_delay=0.5)
+    buffer.append(storage, pa.table({"a": [0]}))
+    # Appending 0 again violates the unique index.
+    errors = append_concurrently(buffer, storage, [0, 1, 2, 3])
+    assert list(errors) == [0]
+    assert read_column(storage) == [0, 1, 2, 3]
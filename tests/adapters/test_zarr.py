@@ -0,0 +1,56 @@
+import numpy
+import pytest
+import zarr
+
+from tiled.adapters.zarr import ZARR_LIB_V2, ZarrArrayAdapter
+from tiled.catalog.adapter import _read_natively
+from tiled.ndslice import NDBlock, NDSlice
+from tiled.structures.array import ArrayStructure
+
+pytestmark = pytest.mark.skipif(ZARR_LIB_V2, reason="zarr-python 2 has no async API")
+
+expected = numpy.arange(24 * 10, dtype="float64").reshape(24, 10)
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    array = zarr.create_array(
+        str(tmp_path / "a.zarr"), shape=(24, 10), chunks=(5, 4), dtype="float64"
+    )
+    array[:] = expected
+    structure = ArrayStructure.from_array(expected, chunks=((5,) * 4 + (4,), (4, 4, 2)))
+    return ZarrArrayAdapter(array, structure=structure)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "slice_",
+    [
+        NDSlice(...),
+        NDSlice(slice(3, 17), slice(1, 9)),
+        NDSlice(7, slice(None, None, 3)),
+        NDSlice(slice(-4, None)),
+    ],
+)
+async def test_read_async(adapter, slice_):
+    actual = await adapter.read_async(slice_)
+    numpy.testing.assert_equal(actual, adapter.read(slice_))
+    numpy.testing.assert_equal(actual, expected[slice_])
+
+
+@pytest.mark.asyncio
+async def test_read_block_async(adapter):
+    for i, j in [(0, 0), (2, 1), (4, 2)]:
+        block = NDBlock(i, j)
+        numpy.testing.assert_equal(
+            await adapter.read_block_async(block), adapter.read_block(block)
+        )
+    numpy.testing.assert_equal(
+        await adapter.read_block_async(NDBlock(4, 2), NDSlice(slice(1, 3))),
+        adapter.read_block(NDBlock(4, 2), NDSlice(slice(1, 3))),
+    )
+
+
+def test_catalog_reads_natively(adapter):
+    assert _read_natively(adapter, "read") == adapter.read_async
+    assert _read_natively(adapter, "read_block") == adapter.read_block_async
@@ -6,6 +6,7 @@ import numpy
 import pandas
 import pytest
 
+import tiled.adapters.csv
 from tiled.adapters.csv import CSVAdapter, CSVArrayAdapter
 from tiled.catalog import in_memory
 from tiled.client import Context, from_context
@@ -124,6 +125,9 @@ def test_csv_table(context, csv_table_uri):
     read_df = client["x"]["table"].read()
     assert set(read_df.columns) == set(df1.columns)
     assert (read_df == df1).all().all()
+    # The last rows
+    read_df = client["x"]["table"].read_partition(0, rows=slice(-3, None))
+    assert read_df["C"].tolist() == [1, 2, 3]
 
 
 @pytest.mark.parametrize("nullable", [True, False])
@@ -317,3 +321,94 @@ def test_csv_arrays_from_uris_selected_columns(
         numpy.testing.assert_allclose(read_arr, orig_arr)
     else:
         numpy.testing.assert_array_equal(read_arr, orig_arr)
+
+
+@pytest.fixture
+def csv_large_table_path(tmpdir):
+    fpath = Path(tmpdir, "large_table.csv")
+    df = pandas.DataFrame(
+        {
+            "A": rng.choice(list(string.ascii_letters), size=1003),
+            "B": rng.random(size=1003),
+            "C": numpy.arange(1003),
+        }
+    )
+    df.to_csv(fpath, index=False)
+
+    yield fpath, df
+
+
+def test_csv_table_parsed_once(csv_table_uri, monkeypatch):
+    "Reading each column in turn parses the file once, with pyarrow"
+    adp = CSVAdapter.from_uris(csv_table_uri)
+    parses = []
+    read_csv = tiled.adapters.csv.pyarrow.csv.read_csv
+    monkeypatch.setattr(
+        "tiled.adapters.csv.pyarrow.csv.read_csv",
+        lambda *args, **kwargs: parses.append(args) or read_csv(*args, **kwargs),
+    )
+    for column in df1.columns:
+        pandas.testing.assert_series_equal(adp.read([column])[column], df1[column])
+    assert len(parses) == 1
+    pandas.testing.assert_frame_equal(adp.read(), df1)
+
+
+def test_csv_table_missing_values(tmpdir):
+    "Missing values read with pyarrow are NaN, as pandas reads them"
+    fpath = Path(tmpdir, "missing.csv")
+    fpath.write_text("a,b,c,d\n2,3,,2020-01-02\n,4,z,\n")
+    expected = pandas.read_csv(fpath)
+    adp = CSVAdapter.from_uris(ensure_uri(fpath))
+    for df in (adp.read(), adp.read_rows(0, 0, 2)):
+        pandas.testing.assert_frame_equal(df, expected)
+        assert numpy.isnan(df["c"][0])
+        assert numpy.isnan(df["d"][1])
+
+
+def test_csv_table_unsupported_kwargs(csv_table_uri):
+    "Keyword arguments that pyarrow has no equivalent for are handled by pandas"
+    adp = CSVAdapter.from_uris(csv_table_uri, skipfooter=1, engine="python")
+    pandas.testing.assert_frame_equal(adp.read(), df1.iloc[:-1])
+
+
+def test_csv_row_index(csv_large_table_path, monkeypatch):
+    fpath, df = csv_large_table_path
+    monkeypatch.setattr("tiled.adapters.csv.ROW_INDEX_MIN_BYTES", 0)
+    monkeypatch.setattr("tiled.adapters.csv.ROW_INDEX_STRIDE", 100)
+    structure = CSVAdapter.from_uris(ensure_uri(fpath)).structure()
+    data_source = DataSource(
+        mimetype="text/csv",
+        assets=[
+            Asset(data_uri=ensure_uri(fpath), is_directory=False, parameter="data_uris")
+        ],
+        structure_family=StructureFamily.table,
+        structure=structure,
+        management=Management.external,
+    )
+    row_index = CSVAdapter.infer_properties(data_source)["row_index"]
+    (entry,) = row_index["files"]
+    assert row_index["stride"] == 100
+    assert entry["rows"] == len(df)
+    assert len(entry["offsets"]) == 11
+    with open(fpath, "rb") as file:
+        lines = file.readlines()
+    for i, offset in enumerate(entry["offsets"]):
+        assert offset == sum(map(len, lines[: 1 + 100 * i]))
+
+    adp = CSVAdapter([ensure_uri(fpath)], structure=structure, row_index=row_index)
+    read_df = adp.read_rows(0, 250, 420, fields=["C", "A"])
+    pandas.testing.assert_frame_equal(read_df, df[["C", "A"]].iloc[250:420])
+    pandas.testing.assert_frame_equal(adp.read_rows(0, 950, 2000), df.iloc[950:])
+    pandas.testing.assert_frame_equal(adp.read(), df)
+
+    # A stale index is not used.
+    df.iloc[:10].to_csv(fpath, index=False)
+    tiled.adapters.csv._table_cache.clear()
+    pandas.testing.assert_frame_equal(adp.read(), df.iloc[:10])
+
+
+def test_csv_row_index_quoted_fields(tmpdir):
+    "Files with quoted fields, which may span lines, are not indexed"
+    fpath = Path(tmpdir, "quoted.csv")
+    fpath.write_text('A,B\n"x\ny",1\nz,2\n')
+    assert tiled.adapters.csv.build_row_index(fpath, 1, 1) is None
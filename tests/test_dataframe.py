@@ -3,7 +3,7 @@ from urllib.parse import parse_qs, urlparse
 import numpy
 import pandas.testing
 import pytest
-from starlette.status import HTTP_400_BAD_REQUEST
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_CONTENT
 
 from tiled.adapters.dataframe import DataFrameAdapter
 from tiled.adapters.mapping import MapAdapter
@@ -234,3 +234,41 @@ def test_redundant_query_parameters(context):
         context.http_client.get(url_path, params=params).raise_for_status()
         assert "'field'" in response.text
         assert "'column'" in response.text
+
+
+def test_dataframe_rows_and_filter(context):
+    "Adapters without their own row selection are read whole and selected from"
+    client = from_context(context)
+    expected = tree["diverse"].read()
+    actual = client["diverse"].read(filter="B > 1 and C != 'three'")
+    pandas.testing.assert_frame_equal(
+        actual, expected[(expected["B"] > 1) & (expected["C"] != "three")]
+    )
+    actual = client["diverse"].read_partition(
+        0, columns=["C"], rows=slice(1, None), filter="A < 3"
+    )
+    assert list(actual.columns) == ["C"]
+    assert actual["C"].tolist() == ["two"]
+    # The last rows
+    actual = client["diverse"].read_partition(0, rows=slice(-2, None))
+    assert actual["C"].tolist() == ["two", "three"]
+    url_path = client["diverse"].item["links"]["partition"]
+    params = {**parse_qs(urlparse(url_path).query), "partition": 0, "rows": "-3:"}
+    context.http_client.get(url_path, params=params).raise_for_status()
+
+
+@pytest.mark.parametrize(
+    "params, status_code",
+    [
+        ({"filter": "__import__('os').getcwd()"}, HTTP_400_BAD_REQUEST),
+        ({"filter": "C > 1"}, HTTP_400_BAD_REQUEST),
+        ({"rows": "1:-2"}, HTTP_422_UNPROCESSABLE_CONTENT),
+        ({"rows": "-:"}, HTTP_422_UNPROCESSABLE_CONTENT),
+    ],
+)
+def test_dataframe_bad_rows_or_filter(context, params, status_code):
+    client = from_context(context)
+    url_path = client["diverse"].item["links"]["partition"]
+    params = {**parse_qs(urlparse(url_path).query), "partition": 0, **params}
+    with fail_with_status_code(status_code):
+        context.http_client.get(url_path, params=params).raise_for_status()
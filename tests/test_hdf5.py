@@ -2,14 +2,27 @@ import os
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import dask.array
 import numpy
 import pytest
 
 from tiled.adapters import hdf5 as hdf5_adapters
-from tiled.adapters.hdf5 import HDF5Adapter, HDF5ArrayAdapter
+from tiled.adapters.hdf5 import (
+    HDF5Adapter,
+    HDF5ArrayAdapter,
+    HDF5ConcatenatedArray,
+    HDF5FileHandle,
+)
 from tiled.adapters.mapping import MapAdapter
+from tiled.adapters.resource_cache import (
+    default_resource_cache,
+    get_resource_cache,
+    set_resource_cache,
+)
 from tiled.catalog import in_memory
 from tiled.client import Context, from_context, record_history
+from tiled.hdf5_filters import HDF5_CHUNK_MIME_TYPE, StoredChunk
+from tiled.ndslice import NDBlock
 from tiled.server.app import build_app
 from tiled.structures.array import ArrayStructure, BuiltinDtype
 from tiled.structures.core import StructureFamily
@@ -718,6 +731,41 @@ def test_chunked_arrays_from_uris(example_files_with_chunked_arrays, num_files):
     numpy.testing.assert_array_equal(arr_d.read(), arr_true_d)
 
 
+@pytest.mark.parametrize(
+    "key",
+    [
+        ...,
+        5,
+        -1,
+        numpy.s_[2:9],
+        numpy.s_[::-1],
+        numpy.s_[1:11:4],
+        numpy.s_[10:1:-3],
+        numpy.s_[3:6, 4],
+        numpy.s_[:, ::-2, 1:],
+        numpy.s_[7, 2, ::-1],
+        numpy.s_[5:5],
+        numpy.s_[:, [0, 2]],
+    ],
+)
+def test_concatenated_array_indexing(example_files_with_chunked_arrays, key):
+    "Indexing the files concatenated, with or without Dask, matches NumPy"
+    file_paths = [path_from_uri(uri) for uri in example_files_with_chunked_arrays]
+    array = HDF5ArrayAdapter.lazy_load_hdf5_array(*file_paths, dataset="a/b")
+    assert isinstance(array, HDF5ConcatenatedArray)
+    assert array.chunks == ((1, 1, 1, 1) * 3, (2, 2, 1), (3, 3))
+    expected = numpy.arange(360, dtype="int64").reshape((12, 5, 6))
+    numpy.testing.assert_array_equal(array[key], expected[key])
+
+    # Dask remains available, as an opt-in.
+    dask_array = HDF5ArrayAdapter.lazy_load_hdf5_array(
+        *file_paths, dataset="a/b", use_dask=True
+    )
+    assert isinstance(dask_array, dask.array.Array)
+    assert dask_array.chunks == array.chunks
+    numpy.testing.assert_array_equal(dask_array[key].compute(), expected[key])
+
+
 @pytest.mark.parametrize("num_files", [1, 3])
 @pytest.mark.parametrize("reshape", [True, False])
 def test_chunked_arrays_from_catalog(
@@ -774,94 +822,320 @@ def test_chunked_arrays_from_catalog(
     numpy.testing.assert_array_equal(adp.read(), arr_true)
 
 
-@pytest.mark.parametrize("swmr", [True, False])
-def test_files_opened_and_closed(example_files_with_chunked_arrays, swmr):
-    "Test that only the necessary files are opened and that they are closed after reading"
-    import tiled
+def close_pooled_files(cache):
+    for value in list(cache.values()):
+        if isinstance(value, HDF5FileHandle):
+            value.close()
+
 
+@pytest.fixture
+def resource_cache():
+    "Use an empty resource cache, with no HDF5 files held open by other tests"
+    cache = default_resource_cache()
+    previous = get_resource_cache()
+    close_pooled_files(previous)
+    set_resource_cache(cache)
+    yield cache
+    set_resource_cache(previous)
+    close_pooled_files(cache)
+
+
+@pytest.mark.parametrize("swmr", [True, False])
+def test_files_opened_once(example_files_with_chunked_arrays, resource_cache, swmr):
+    "Test that each file is opened only once, and the handle is reused for all reads"
     h5py = pytest.importorskip("h5py")
 
     # Use the example with two files chunked along a single dimension;
     # total chunks across the two files: ((3, 3, 3, 1)*2, )
     file_uris = example_files_with_chunked_arrays[:2]
     file_paths = [path_from_uri(uri) for uri in file_uris]
-    with patch(
-        "tiled.adapters.hdf5.h5open", wraps=tiled.adapters.hdf5.h5open
-    ) as mock_h5open:
-        mock_h5open.assert_not_called()  # No files should be opened yet
+    with patch.object(
+        HDF5FileHandle, "_open", autospec=True, side_effect=HDF5FileHandle._open
+    ) as mock_open:
+
+        def files_opened():
+            return [call.args[0]._filename.name for call in mock_open.call_args_list]
+
+        mock_open.assert_not_called()  # No files should be opened yet
 
         # Tree initialized from the entire file, no dataset provided
         tree = HDF5Adapter.from_uris(*file_uris, swmr=swmr)
-        mock_h5open.assert_called()
-        assert mock_h5open.call_count == 1
+        assert files_opened() == [file_paths[0].name]
 
-        # Adapter initialized directly from the dataset:
-        # Each file is read once to get the structure, and the first one
-        # is also read once again to get the metadata
-        mock_h5open.reset_mock()
+        # Adapter initialized directly from the dataset: the second file is
+        # opened to get its structure; the first one is reused.
         HDF5ArrayAdapter.from_uris(*file_uris, dataset="a/d", swmr=swmr)
-        assert mock_h5open.call_count == 3
-        files_opened = [call.args[0].name for call in mock_h5open.call_args_list]
-        assert files_opened.count(file_paths[0].name) == 2
-        assert files_opened.count(file_paths[1].name) == 1
-        assert set(files_opened) == set([fp.name for fp in file_paths])
-
-        # Build the app fromn the tree (HDF5Adapter): all datasets in the file are parsed
-        mock_h5open.reset_mock()
+        assert sorted(files_opened()) == sorted(fp.name for fp in file_paths)
+
+        # Build the app, read the array, and read slices of it: no file is
+        # opened again.
+        mock_open.reset_mock()
         with Context.from_app(build_app(tree)) as context:
             client = from_context(context)
-        mock_h5open.assert_called()
-
-        # Initialize the array client -- no need to reopen the files
-        mock_h5open.reset_mock()
-        arr = client["a"]["d"]
-        assert arr.structure().shape == (20,)
-        assert arr.structure().chunks == ((3, 3, 3, 1) * 2,)
-        assert arr.metadata is not None
-        mock_h5open.assert_not_called()
-
-        # Read the entire array: files are opened once to get the specs and then again,
-        # four times each, to fetch each chunk separately. Additionally, the first file is opened once
-        # adain when initialized from catalog to get the metadata
-        assert arr.read() is not None
-        # 2 for specs, 4*2 for chunks, 1 for metadata
-        assert mock_h5open.call_count == 2 + 4 * 2 + 1
-        files_opened = [call.args[0].name for call in mock_h5open.call_args_list]
-        # First file: 1 for specs, 4 for chunks, 1 for metadata
-        assert files_opened.count(file_paths[0].name) == 4 + 1 + 1
-        # Second file: 1 for specs, 4 for chunks
-        assert files_opened.count(file_paths[1].name) == 4 + 1
-
-        # Read a slice that only touches one file: only the relevant file should be opened
-        mock_h5open.reset_mock()
-        assert arr[:1] is not None
-        assert mock_h5open.call_count == 4  # 2 for specs, 1 for chunks, 1 for metadata
-        files_opened = [call.args[0].name for call in mock_h5open.call_args_list]
-        assert files_opened.count(file_paths[0].name) == 3
-        assert files_opened.count(file_paths[1].name) == 1  # only to get the specs
-
-        # Read everything from the second file
-        mock_h5open.reset_mock()
-        assert arr[-10:] is not None
-        assert mock_h5open.call_count == 7
-        files_opened = [call.args[0].name for call in mock_h5open.call_args_list]
-        # First file: 1 for specs, 1 for metadata
-        assert files_opened.count(file_paths[0].name) == 1 + 1
-        # Second file: 4 for chunks, 1 for specs
-        assert files_opened.count(file_paths[1].name) == 4 + 1
-
-        # Read a slice that has one value from each of the files
-        mock_h5open.reset_mock()
-        assert arr[9:11] is not None
-        assert mock_h5open.call_count == 2 + 2 + 1
-        files_opened = [call.args[0].name for call in mock_h5open.call_args_list]
-        # First file: # 1 for specs, 1 for chunk, 1 for metadata
-        assert files_opened.count(file_paths[0].name) == 3
-        assert files_opened.count(file_paths[1].name) == 2  # 1 for specs, 1 for chunk
-
-    # Try opening the files directly to check that they are closed after reading
-    h5py.File(file_paths[0], "r", swmr=swmr).close()
-    h5py.File(file_paths[1], "r", swmr=swmr).close()
-
+            arr = client["a"]["d"]
+            assert arr.structure().shape == (20,)
+            assert arr.structure().chunks == ((3, 3, 3, 1) * 2,)
+            assert arr.read() is not None
+            assert arr[:1] is not None
+            assert arr[-10:] is not None
+            assert arr[9:11] is not None
+        mock_open.assert_not_called()
+
+        # Reading with different flags reopens the file, since HDF5 does not
+        # allow a file to be open twice with different flags.
+        HDF5ArrayAdapter.from_uris(file_uris[0], dataset="a/d", swmr=not swmr)
+        assert files_opened() == [file_paths[0].name]
+
+    # Once the pooled handles are closed, the files can be opened directly.
+    close_pooled_files(resource_cache)
     h5py.File(file_paths[0], "r", swmr=not swmr).close()
     h5py.File(file_paths[1], "r", swmr=not swmr).close()
+
+
+def test_swmr_refresh(tmp_path, resource_cache):
+    "A pooled handle in SWMR mode sees data appended after it was opened"
+    h5py = pytest.importorskip("h5py")
+    file_path = tmp_path / "growing.h5"
+    with h5py.File(file_path, "w", libver="latest") as writer:
+        writer.create_dataset("x", data=numpy.arange(3), maxshape=(None,))
+        writer.swmr_mode = True
+        adapter = HDF5ArrayAdapter.from_uris(
+            ensure_uri(file_path), dataset="x", swmr=True
+        )
+        numpy.testing.assert_array_equal(adapter.read(), numpy.arange(3))
+
+        writer["x"].resize((5,))
+        writer["x"][3:] = [3, 4]
+        writer["x"].flush()
+        adapter = HDF5ArrayAdapter.from_uris(
+            ensure_uri(file_path), dataset="x", swmr=True
+        )
+        numpy.testing.assert_array_equal(adapter.read(), numpy.arange(5))
+    assert len(resource_cache) == 1
+
+
+def test_geometry_recorded_and_files_opened_lazily(
+    context, example_files_with_chunked_arrays, resource_cache
+):
+    "Per-file geometry is recorded on registration, and reads open only the files they touch"
+    client = from_context(context)
+    file_paths = [path_from_uri(uri) for uri in example_files_with_chunked_arrays]
+    data_source = DataSource(
+        mimetype="application/x-hdf5",
+        assets=[
+            Asset(data_uri=uri, is_directory=False, parameter="data_uris", num=indx)
+            for indx, uri in enumerate(example_files_with_chunked_arrays)
+        ],
+        structure_family=StructureFamily.array,
+        structure=ArrayStructure(
+            shape=(30,),
+            chunks=((3, 3, 3, 1) * 3,),
+            data_type=BuiltinDtype.from_numpy_dtype(numpy.dtype("int64")),
+        ),
+        parameters={"dataset": "a/d"},
+        management=Management.external,
+    )
+    arr = client.new(
+        structure_family=StructureFamily.array,
+        data_sources=[data_source],
+        key="lazy_multifile",
+    )
+    close_pooled_files(resource_cache)
+
+    with patch.object(
+        HDF5FileHandle, "_open", autospec=True, side_effect=HDF5FileHandle._open
+    ) as mock_open:
+
+        def files_opened():
+            return {call.args[0]._filename.name for call in mock_open.call_args_list}
+
+        numpy.testing.assert_array_equal(arr[12:15], numpy.arange(12, 15))
+        assert files_opened() == {file_paths[1].name}
+        numpy.testing.assert_array_equal(arr[-1], 29)
+        assert files_opened() == {file_paths[1].name, file_paths[2].name}
+        numpy.testing.assert_array_equal(arr.read(), numpy.arange(30))
+        assert files_opened() == {fp.name for fp in file_paths}
+
+
+@pytest.mark.parametrize(
+    "slice_, expected",
+    [
+        (..., (0, 1, 2)),
+        (slice(None, 4), (0,)),
+        (slice(3, 5), (0, 1)),
+        (slice(None, None, 5), (0, 2)),
+        (-1, (2,)),
+        (slice(5, 5), ()),
+    ],
+)
+def test_file_indices_for_slice(slice_, expected):
+    structure = ArrayStructure(
+        shape=(9, 2),
+        chunks=((2, 2, 2, 2, 1), (2,)),
+        data_type=BuiltinDtype.from_numpy_dtype(numpy.dtype("int64")),
+    )
+    properties = {"file_shapes": [[4, 2], [1, 2], [4, 2]], "file_chunks": [[2, 2]] * 3}
+    assert (
+        HDF5Adapter.file_indices_for_slice(structure, 3, slice_, properties, {})
+        == expected
+    )
+    # Not recorded, stale, or transformed after loading: the files must be opened.
+    assert HDF5Adapter.file_indices_for_slice(structure, 3, slice_, {}, {}) is None
+    stale = {**properties, "file_shapes": [[4, 2], [1, 2], [3, 2]]}
+    assert HDF5Adapter.file_indices_for_slice(structure, 3, slice_, stale, {}) is None
+    assert (
+        HDF5Adapter.file_indices_for_slice(
+            structure, 3, slice_, properties, {"squeeze": True}
+        )
+        is None
+    )
+
+
+@pytest.fixture(scope="module")
+def example_file_with_filters(tmp_path_factory):
+    h5py = pytest.importorskip("h5py")
+    hdf5plugin = pytest.importorskip("hdf5plugin")
+    file_path = tmp_path_factory.mktemp("data").joinpath("filters.h5")
+    data = numpy.arange(70 * 45, dtype="uint16").reshape((70, 45)) % 97
+    with h5py.File(file_path, "w") as file:
+        for key, options in {
+            "gzip": dict(compression="gzip", shuffle=True, fletcher32=True),
+            "blosc": hdf5plugin.Blosc(cname="lz4", shuffle=hdf5plugin.Blosc.SHUFFLE),
+            "blosc2": hdf5plugin.Blosc2(cname="zstd"),
+            "bitshuffle_lz4": hdf5plugin.Bitshuffle(cname="lz4"),
+            "bitshuffle_zstd": hdf5plugin.Bitshuffle(cname="zstd"),
+            "lz4": hdf5plugin.LZ4(nbytes=1000),
+            "zstd": hdf5plugin.Zstd(),
+        }.items():
+            file.create_dataset(key, data=data, chunks=(32, 20), **options)
+        file.create_dataset("contiguous", data=data)
+    return ensure_uri(file_path), data
+
+
+@pytest.mark.parametrize(
+    "key",
+    ["gzip", "blosc", "blosc2", "bitshuffle_lz4", "bitshuffle_zstd", "lz4", "zstd"],
+)
+def test_read_stored_block(example_file_with_filters, key):
+    "Blocks aligned with HDF5 chunks are read as stored and decoded without HDF5"
+    file_uri, data = example_file_with_filters
+    adapter = HDF5ArrayAdapter.from_uris(file_uri, dataset=key)
+    assert adapter.structure().chunks == ((32, 32, 6), (20, 20, 5))
+    for block in [(0, 0), (1, 2), (2, 1), (2, 2)]:
+        stored = adapter.read_stored_block(NDBlock(*block))
+        assert stored is not None
+        expected = adapter.read_block(NDBlock(*block))
+        numpy.testing.assert_array_equal(stored.decode(), expected)
+        # Round-trip the description of the encoding through the media type
+        received = StoredChunk.from_media_type(stored.data, stored.media_type())
+        numpy.testing.assert_array_equal(received.decode(), expected)
+    numpy.testing.assert_array_equal(adapter.read(), data)
+
+
+def test_read_stored_block_unaligned(example_file_with_filters):
+    file_uri, data = example_file_with_filters
+    # Not chunked in the file
+    adapter = HDF5ArrayAdapter.from_uris(file_uri, dataset="contiguous")
+    assert adapter.read_stored_block(NDBlock(0, 0)) is None
+    # Sliced after loading
+    adapter = HDF5ArrayAdapter.from_uris(file_uri, dataset="gzip", slice="1:")
+    assert adapter.read_stored_block(NDBlock(0, 0)) is None
+    numpy.testing.assert_array_equal(adapter.read_block(NDBlock(0, 0)), data[1:32, :20])
+
+
+def test_stored_chunk_media_type(example_file_with_filters):
+    file_uri, data = example_file_with_filters
+    tree = MapAdapter(
+        {
+            key: HDF5ArrayAdapter.from_uris(file_uri, dataset=key)
+            for key in ["bitshuffle_lz4", "blosc2", "contiguous"]
+        }
+    )
+    with Context.from_app(build_app(tree)) as context:
+        client = from_context(context)
+        for key in ["bitshuffle_lz4", "blosc2"]:
+            url = client[key].item["links"]["block"]
+            response = context.http_client.get(
+                url,
+                params={"block": "2,1"},
+                headers={"Accept": f"{HDF5_CHUNK_MIME_TYPE}, application/octet-stream"},
+            )
+            response.raise_for_status()
+            assert response.headers["content-type"].startswith(HDF5_CHUNK_MIME_TYPE)
+            stored = StoredChunk.from_media_type(
+                response.content, response.headers["content-type"]
+            )
+            assert stored.shape == (6, 20)
+            numpy.testing.assert_array_equal(stored.decode(), data[64:, 20:40])
+            # The usual route still works, for the same block.
+            numpy.testing.assert_array_equal(
+                client[key].read_block((2, 1)), data[64:, 20:40]
+            )
+
+        # Fall back to the next requested media type if the block is not a stored chunk.
+        url = client["contiguous"].item["links"]["block"]
+        response = context.http_client.get(
+            url,
+            params={"block": "0,0"},
+            headers={"Accept": f"{HDF5_CHUNK_MIME_TYPE}, application/octet-stream"},
+        )
+        assert response.headers["content-type"] == "application/octet-stream"
+        response = context.http_client.get(
+            url, params={"block": "0,0"}, headers={"Accept": HDF5_CHUNK_MIME_TYPE}
+        )
+        assert response.status_code == 406
+
+
+def test_read_blocks_along_other_axes(
+    context, tmp_path_factory, example_files_with_chunked_arrays
+):
+    "Blocks not only along the leading axis are read through the catalog"
+    h5py = pytest.importorskip("h5py")
+    client = from_context(context)
+    file_path = tmp_path_factory.mktemp("data").joinpath("chunked_2d.h5")
+    expected = numpy.arange(48, dtype="int64").reshape((8, 6))
+    with h5py.File(file_path, "w") as file:
+        file.create_dataset("x", data=expected, chunks=(4, 3))
+
+    def register(key, uris, dataset, shape, chunks):
+        return client.new(
+            structure_family=StructureFamily.array,
+            data_sources=[
+                DataSource(
+                    mimetype="application/x-hdf5",
+                    assets=[
+                        Asset(
+                            data_uri=uri,
+                            is_directory=False,
+                            parameter="data_uris",
+                            num=indx,
+                        )
+                        for indx, uri in enumerate(uris)
+                    ],
+                    structure_family=StructureFamily.array,
+                    structure=ArrayStructure(
+                        shape=shape,
+                        chunks=chunks,
+                        data_type=BuiltinDtype.from_numpy_dtype(numpy.dtype("int64")),
+                    ),
+                    parameters={"dataset": dataset},
+                    management=Management.external,
+                )
+            ],
+            key=key,
+        )
+
+    arr = register("chunked_2d", [ensure_uri(file_path)], "x", (8, 6), ((4, 4), (3, 3)))
+    numpy.testing.assert_array_equal(arr.read_block((0, 1)), expected[:4, 3:])
+    numpy.testing.assert_array_equal(arr.read_block((1, 1)), expected[4:, 3:])
+    # Spanning files, with the per-file geometry recorded
+    arr = register(
+        "chunked_multifile",
+        example_files_with_chunked_arrays,
+        "a/b",
+        (12, 5, 6),
+        ((1,) * 12, (2, 2, 1), (3, 3)),
+    )
+    expected = numpy.arange(360, dtype="int64").reshape((12, 5, 6))
+    numpy.testing.assert_array_equal(arr.read_block((5, 1, 1)), expected[5:6, 2:4, 3:])
+    numpy.testing.assert_array_equal(arr.read_block((11, 0, 0)), expected[11:, :2, :3])
@@ -0,0 +1,114 @@
+import threading
+import time
+
+import pytest
+
+from tiled.adapters.io_executor import (
+    IOExecutor,
+    default_io_executor,
+    set_io_executor,
+)
+from tiled.server.metrics import IO_ACTIVE_WORKERS, IO_QUEUE_DEPTH
+
+
+def track_concurrency():
+    "Return a function that sleeps briefly, and a list recording the peak concurrency"
+    lock = threading.Lock()
+    running = 0
+    peak = [0]
+
+    def f(x):
+        nonlocal running
+        with lock:
+            running += 1
+            peak[0] = max(peak[0], running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return x * 2
+
+    return f, peak
+
+
+def test_map_preserves_order():
+    executor = IOExecutor(4)
+    try:
+        assert executor.map(lambda x: x * 2, range(20)) == list(range(0, 40, 2))
+        assert executor.map(lambda x: x * 2, []) == []
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.parametrize(
+    "per_request, limit, expected", [(2, None, 2), (8, 3, 3), (3, 8, 3), (4, 1, 1)]
+)
+def test_per_request_limit(per_request, limit, expected):
+    "Each call keeps at most min(per_request, limit) tasks in the pool"
+    executor = IOExecutor(8, per_request)
+    f, peak = track_concurrency()
+    try:
+        assert executor.map(f, range(16), limit=limit) == list(range(0, 32, 2))
+    finally:
+        executor.shutdown()
+    assert peak[0] == expected
+
+
+def test_global_limit():
+    "Concurrent calls share the pool, so max_workers bounds them all together"
+    executor = IOExecutor(3, 3)
+    f, peak = track_concurrency()
+    threads = [
+        threading.Thread(target=executor.map, args=(f, range(9))) for _ in range(4)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        executor.shutdown()
+    assert peak[0] == 3
+    assert IO_QUEUE_DEPTH._value.get() == 0
+    assert IO_ACTIVE_WORKERS._value.get() == 0
+
+
+def test_exception_propagates():
+    def f(x):
+        if x == 5:
+            raise ValueError("bad file")
+        return x
+
+    executor = IOExecutor(4)
+    try:
+        with pytest.raises(ValueError, match="bad file"):
+            executor.map(f, range(50))
+    finally:
+        executor.shutdown()
+    assert IO_QUEUE_DEPTH._value.get() == 0
+
+
+def test_replaced_executor_is_shut_down():
+    first = IOExecutor(2)
+    try:
+        set_io_executor(first)
+        started = threading.Event()
+        release = threading.Event()
+
+        def f(x):
+            started.set()
+            release.wait(5)
+            return x
+
+        results = []
+        reader = threading.Thread(target=lambda: results.append(first.map(f, range(4))))
+        reader.start()
+        started.wait(5)
+        set_io_executor(IOExecutor(2))
+        # The read running on the replaced executor finishes there...
+        release.set()
+        reader.join(5)
+        assert results == [[0, 1, 2, 3]]
+        # ...and then its threads are shut down.
+        assert first._executor is None
+    finally:
+        set_io_executor(default_io_executor())
@@ -181,3 +181,32 @@ def test_npy_sequence_cache(client):
     assert_raises(
         AssertionError, numpy.testing.assert_equal, read_array, other_read_array
     )
+
+
+def test_npy_memory_mapped(tmp_path):
+    "Reads of an NPY file are memory-mapped, and served whole in every format"
+    data = numpy.arange(4 * 5 * 6, dtype="<i4").reshape((4, 5, 6))
+    path = tmp_path / "large.npy"
+    numpy.save(path, data)
+    adapter = NPYAdapter.from_uris(ensure_uri(path))
+    assert isinstance(adapter.read(), numpy.memmap)
+    assert isinstance(adapter.read((1, slice(0, 2))), numpy.memmap)
+
+    app = build_app(MapAdapter({"large": adapter}))
+    with Context.from_app(app) as context:
+        client = from_context(context)
+        numpy.testing.assert_array_equal(client["large"].read(), data)
+        numpy.testing.assert_array_equal(client["large"][1:3, ::2], data[1:3, ::2])
+        response = context.http_client.get(
+            "/api/v1/array/full/large", params={"slice": "1,0:2", "format": "json"}
+        )
+        assert response.json() == data[1, 0:2].tolist()
+        # The ETag of a memory-mapped array does not depend on hashing the data,
+        # but is still specific to the slice.
+        etags = {
+            context.http_client.get(
+                "/api/v1/array/full/large", params={"slice": s}
+            ).headers["ETag"]
+            for s in ["0", "0", "1"]
+        }
+        assert len(etags) == 2
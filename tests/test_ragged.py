@@ -501,6 +501,14 @@ def test_adapter_read_write_patch(name, sql_storage):
     expected = ragged.concat([array, array, array], axis=0)
     assert ak.array_equal(expected._impl, adp.read()._impl)
 
+    # Read each chunk, as written, by block
+    for i in range(3):
+        assert ak.array_equal(
+            array._impl, adp.read_block((i,) + (0,) * (array.ndim - 1))._impl
+        )
+    with pytest.raises(IndexError):
+        adp.read_block((3,) + (0,) * (array.ndim - 1))
+
 
 @pytest.mark.parametrize("name", list(arrays.keys())[:1])
 def test_concurrent_patch_raises_conflicts(name, sql_storage, request):
@@ -672,6 +680,23 @@ def test_chunking(client, i: int):
     assert ak.array_equal(sliced._impl, array[1:10, 0:5]._impl)
 
 
+@pytest.mark.parametrize("i", range(len(chunkable_arrays)))
+def test_read_block(client, i: int):
+    array = ragged.array(chunkable_arrays[i])
+    rac = client["chunked"][f"partitionable_{i}"]
+
+    divisions = np.cumsum((0, *rac.chunks[0]))
+    for j, (start, stop) in enumerate(zip(divisions[:-1], divisions[1:])):
+        block = rac.read_block(j)
+        assert ak.array_equal(block._impl, array[start:stop]._impl)
+
+        block = rac.read_block(j, slice=(builtins.slice(1, 3), builtins.slice(0, 4)))
+        assert ak.array_equal(block._impl, array[start:stop][1:3, 0:4]._impl)
+
+    with pytest.raises(ClientError, match="out of range"):
+        rac.read_block(len(rac.chunks[0]))
+
+
 @pytest.mark.parametrize("name", arrays.keys())
 def test_export_json(tmpdir, client, name):
     array = ragged.array(arrays[name])
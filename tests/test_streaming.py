@@ -1,14 +1,17 @@
 import asyncio
 import gc
+import struct
+import time
 
 import msgpack
 import numpy as np
 import orjson
 import pytest
+from prometheus_client import REGISTRY
 
 from tiled.catalog import in_memory
 from tiled.client import Context, from_context
-from tiled.server import streaming
+from tiled.server import core, streaming
 from tiled.server.app import build_app
 from tiled.structures.bytes import BytesStructure
 from tiled.structures.core import StructureFamily
@@ -175,6 +178,427 @@ async def test_pubsub_fanout_and_cleanup():
     assert "topic" not in pubsub._topics
 
 
+@pytest.mark.asyncio
+async def test_redis_multiplexer_shares_one_subscription(redis_uri):
+    from redis import asyncio as redis
+
+    client = redis.from_url(redis_uri)
+    multiplexer = streaming.RedisPubSubMultiplexer(client)
+    try:
+        gen1, cleanup1 = await multiplexer.subscribe("notify:node")
+        gen2, cleanup2 = await multiplexer.subscribe("notify:node")
+        assert multiplexer.channels == {"notify:node": 2}
+        # One pub/sub connection serves both subscribers.
+        assert await client.pubsub_numsub("notify:node") == [(b"notify:node", 1)]
+
+        await client.publish("notify:node", 7)
+        assert await asyncio.wait_for(gen1.__anext__(), timeout=5) == 7
+        assert await asyncio.wait_for(gen2.__anext__(), timeout=5) == 7
+
+        await cleanup1()
+        assert multiplexer.channels == {"notify:node": 1}
+        await cleanup2()
+        assert multiplexer.channels == {}
+    finally:
+        await multiplexer.aclose()
+        await client.aclose()
+
+
+class FakeStreamClient:
+    "Answers the first XREAD with the given entries, and then blocks."
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.reads = 0
+
+    async def xrevrange(self, stream, count):
+        return []
+
+    async def xread(self, streams, block):
+        self.reads += 1
+        if self.reads == 1:
+            (stream,) = streams
+            return [(stream.encode(), self.entries)]
+        await asyncio.sleep(block / 1000)
+        return []
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_multiplexer_shares_one_reader():
+    entries = [(f"{i}-0".encode(), {b"sequence": str(i).encode()}) for i in (1, 2, 3)]
+    client = FakeStreamClient(entries)
+    multiplexer = streaming.RedisStreamsMultiplexer(client, max_entries=2)
+    gen1, cleanup1 = await multiplexer.subscribe("stream:node")
+    gen2, cleanup2 = await multiplexer.subscribe("stream:node")
+    assert list(multiplexer._readers) == ["stream:node"]
+    for gen in (gen1, gen2):
+        assert [
+            await asyncio.wait_for(gen.__anext__(), timeout=5) for _ in range(3)
+        ] == [1, 2, 3]
+    # At most max_entries are held...
+    assert multiplexer.take("stream:node", 1) is None
+    # ...each until every subscriber has taken it.
+    assert multiplexer.take("stream:node", 3) == {b"sequence": b"3"}
+    assert multiplexer.take("stream:node", 3) == {b"sequence": b"3"}
+    assert multiplexer.take("stream:node", 3) is None
+
+    await cleanup1()
+    assert list(multiplexer._readers) == ["stream:node"]
+    await cleanup2()
+    assert multiplexer._readers == {}
+    assert multiplexer._entries == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        ("disconnect", [streaming._SUBSCRIBER_TOO_SLOW]),
+        ("drop-oldest", [3, 4, 5]),
+        ("coalesce", [streaming._Coalesced(sequence=4, skipped=3), 5]),
+    ],
+)
+async def test_subscriber_buffer_slow_subscriber_policy(policy, expected):
+    buffer = streaming.SubscriberBuffer("node", maxsize=3, policy=policy)
+    for sequence in range(1, 6):
+        buffer.put(sequence)
+    assert buffer.latest == 5
+    assert [await buffer.get() for _ in range(len(buffer))] == expected
+    buffer.put(6)
+    if policy == "disconnect":
+        # Nothing more is buffered for a subscriber that is being disconnected.
+        assert len(buffer) == 0
+    else:
+        assert await asyncio.wait_for(buffer.get(), timeout=1) == 6
+
+
+def test_subscriber_buffer_rejects_unknown_policy():
+    with pytest.raises(ValueError, match="Unknown slow subscriber policy"):
+        streaming.SubscriberBuffer("node", maxsize=3, policy="ignore")
+
+
+def test_coalesce_only_whole_array_updates():
+    coalesced = streaming._Coalesced(sequence=7, skipped=6)
+    whole = {
+        "type": "array-data",
+        "sequence": 7,
+        "timestamp": "now",
+        "mimetype": "application/octet-stream",
+        "shape": [3, 4],
+        "offset": None,
+        "block": None,
+    }
+    ref = streaming._coalesce(whole, coalesced)
+    assert ref["type"] == "array-ref"
+    assert ref["shape"] == [3, 4]
+    assert ref["coalesced"] == 6
+    # A block of the array cannot stand in for the updates before it...
+    assert streaming._coalesce({**whole, "block": [0, 1]}, coalesced) is None
+    # ...and neither can a non-array update.
+    assert streaming._coalesce({"type": "table-data"}, coalesced) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_datastore_set_get_and_range(redis_uri):
+    datastore = streaming.RedisStreamsDatastore(
+        {
+            "uri": redis_uri,
+            "data_ttl": 60,
+            "seq_ttl": 60,
+            "socket_timeout": 10,
+            "socket_connect_timeout": 10,
+        }
+    )
+    node_id = "node-streams"
+    try:
+        sequences = [await datastore.incr_seq(node_id) for _ in range(3)]
+        assert sequences == [1, 2, 3]
+        # Write out of order, as concurrent writers might.
+        for sequence in (1, 3, 2):
+            await datastore.set(
+                node_id, sequence, {"sequence": sequence}, payload=b"x" * sequence
+            )
+        payload, metadata = await datastore.get(
+            f"data:{node_id}:3", "payload", "metadata"
+        )
+        assert payload == b"xxx"
+        assert orjson.loads(metadata) == {"sequence": 3}
+        # The late message is found by its sequence number...
+        payload, metadata = await datastore.get(
+            f"data:{node_id}:2", "payload", "metadata"
+        )
+        assert payload == b"xx"
+        assert orjson.loads(metadata) == {"sequence": 2}
+
+        async def replayed(start, stop):
+            return [
+                orjson.loads(metadata)["sequence"]
+                async for _, metadata in datastore.get_range(node_id, start, stop)
+            ]
+
+        # ...and replayed in order.
+        assert await replayed(1, 3) == [1, 2, 3]
+        assert await replayed(2, 2) == [2]
+        assert await replayed(3, 3) == [3]
+
+        await datastore.close(node_id)
+        _, metadata = await datastore.get(f"data:{node_id}:4", "payload", "metadata")
+        assert orjson.loads(metadata)["end_of_stream"] is True
+    finally:
+        await datastore.client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_concurrent_writers(redis_uri):
+    "Messages appended out of order by concurrent writers are all delivered."
+    datastore = streaming.RedisStreamsDatastore(
+        {
+            "uri": redis_uri,
+            "data_ttl": 60,
+            "seq_ttl": 60,
+            "stream_block_ms": 100,
+            "socket_timeout": 10,
+            "socket_connect_timeout": 10,
+        }
+    )
+    node_id = "node-concurrent"
+    count = 20
+    live, cleanup = await datastore._multiplexer.subscribe(f"stream:{node_id}")
+    try:
+
+        async def write():
+            sequence = await datastore.incr_seq(node_id)
+            # Later sequences are appended first.
+            await asyncio.sleep(0.01 * (count - sequence))
+            await datastore.set(node_id, sequence, {"sequence": sequence})
+
+        await asyncio.gather(*(write() for _ in range(count)))
+        expected = list(range(1, count + 1))
+        received = [
+            await asyncio.wait_for(live.__anext__(), timeout=5) for _ in expected
+        ]
+        assert sorted(received) == expected
+        for sequence in expected:
+            (metadata,) = await datastore.get(f"data:{node_id}:{sequence}", "metadata")
+            assert orjson.loads(metadata) == {"sequence": sequence}
+        assert [
+            orjson.loads(metadata)["sequence"]
+            async for _, metadata in datastore.get_range(node_id, 1, count)
+        ] == expected
+    finally:
+        await cleanup()
+        await datastore._multiplexer.aclose()
+        await datastore.client.aclose()
+
+
+def test_websocket_replay_and_live_events_redis_streams(tmpdir, redis_uri):
+    catalog = in_memory(
+        writable_storage=str(tmpdir),
+        cache_config={
+            "uri": redis_uri,
+            "datastore": "redis-streams",
+            "data_ttl": 60,
+            "seq_ttl": 60,
+            "socket_timeout": 60,
+            "socket_connect_timeout": 10,
+        },
+    )
+    with Context.from_app(build_app(catalog)) as context:
+        client = from_context(context)
+        base = np.arange(6, dtype=np.int64)
+        streaming_node = client.write_array(base, key="stream")
+        streaming_node.write(base + 1)
+        streaming_node.write(base + 2)
+
+        with context.http_client.websocket_connect(
+            "/api/v1/stream/single/stream?envelope_format=msgpack&start=1"
+        ) as websocket:
+            # The schema, then a replay of the creation and both writes
+            schema_message, *replay_messages = [
+                msgpack.unpackb(websocket.receive_bytes()) for _ in range(4)
+            ]
+            assert [msg["sequence"] for msg in replay_messages] == [1, 2, 3]
+
+            streaming_node.write(base + 3)
+            live_msg = msgpack.unpackb(websocket.receive_bytes())
+            assert live_msg["sequence"] == 4
+            np.testing.assert_array_equal(
+                np.frombuffer(live_msg["payload"], dtype=np.int64), base + 3
+            )
+
+            context.http_client.delete("/api/v1/stream/close/stream")
+
+
+@pytest.fixture
+def memory_streaming_context(tmpdir):
+    catalog = in_memory(
+        writable_storage=str(tmpdir),
+        cache_config={"uri": "memory://", "data_ttl": 60, "seq_ttl": 60},
+    )
+    with Context.from_app(build_app(catalog)) as context:
+        yield context
+
+
+def test_msgpack_typed_envelope(memory_streaming_context):
+    context = memory_streaming_context
+    client = from_context(context)
+    base = np.arange(12, dtype="<f4").reshape(3, 4)
+    streaming_node = client.write_array(base, key="typed")
+
+    with context.http_client.websocket_connect(
+        "/api/v1/stream/single/typed?envelope_format=msgpack-typed"
+    ) as websocket:
+        msgpack.unpackb(websocket.receive_bytes())  # schema
+        streaming_node.write(base + 1)
+        message = msgpack.unpackb(websocket.receive_bytes())
+
+    ext = message["payload"]
+    assert isinstance(ext, msgpack.ExtType)
+    assert ext.code == core.NDARRAY_EXT_TYPE
+    (header_length,) = struct.unpack("<I", ext.data[:4])
+    buffer_offset = 4 + header_length
+    dtype, shape = msgpack.unpackb(ext.data[4:buffer_offset])
+    assert (dtype, shape) == ("<f4", [3, 4])
+    actual = np.frombuffer(ext.data[buffer_offset:], dtype=dtype).reshape(shape)
+    np.testing.assert_array_equal(actual, base + 1)
+
+
+def test_json_envelope_encoded_once_for_all_subscribers(memory_streaming_context):
+    context = memory_streaming_context
+    client = from_context(context)
+    base = np.arange(5)
+    streaming_node = client.write_array(base, key="shared")
+    core._encoded_frames.clear()
+
+    url = "/api/v1/stream/single/shared?envelope_format=json"
+    with context.http_client.websocket_connect(url) as ws1:
+        with context.http_client.websocket_connect(url) as ws2:
+            ws1.receive_text(), ws2.receive_text()  # schema
+            streaming_node.write(base + 1)
+            frame1, frame2 = ws1.receive_text(), ws2.receive_text()
+
+    assert frame1 == frame2
+    assert orjson.loads(frame1)["payload"] == (base + 1).tolist()
+    # One frame was encoded, keyed on the node, sequence, and envelope format.
+    [key] = [key for key in core._encoded_frames._frames if key[0] == "shared"]
+    assert key[1] == orjson.loads(frame1)["sequence"]
+
+
+def total_sample_value(name):
+    "Sum a metric's samples across all label values."
+    return sum(
+        sample.value
+        for metric in REGISTRY.collect()
+        for sample in metric.samples
+        if sample.name == name
+    )
+
+
+@pytest.mark.asyncio
+async def test_stamped_with_request_arrival():
+    "Messages are stamped with the time their request arrived, not published."
+    cache = streaming.StreamingCache(
+        {"datastore": "memory", "data_ttl": 60, "seq_ttl": 60}
+    )
+    token = streaming.request_received_at.set(100.0)
+    try:
+        first, second = {"type": "array-data"}, {"type": "array-data"}
+        await cache.set("node", 1, first)
+        await cache.set("node", 2, second, received_at=200.0)
+    finally:
+        streaming.request_received_at.reset(token)
+    assert first["server_received_at"] == 100.0
+    assert second["server_received_at"] == 200.0
+    # Outside of a request, the message is stamped when it is published.
+    third = {"type": "array-data"}
+    before = time.time()
+    await cache.set("node", 3, third)
+    assert before <= third["server_received_at"] <= time.time()
+
+
+def test_node_metrics_removed_with_last_subscriber(memory_streaming_context):
+    context = memory_streaming_context
+    client = from_context(context)
+    client.write_array(np.arange(5), key="counted")
+
+    def node_ids():
+        "The nodes for which metrics labeled by node have series"
+        return {
+            sample.labels["node_id"]
+            for metric in REGISTRY.collect()
+            for sample in metric.samples
+            if sample.name.startswith("tiled_stream_") and "node_id" in sample.labels
+        }
+
+    url = "/api/v1/stream/single/counted?envelope_format=msgpack&start=1"
+    others = node_ids()
+    with context.http_client.websocket_connect(url) as first:
+        msgpack.unpackb(first.receive_bytes())  # schema
+        msgpack.unpackb(first.receive_bytes())  # replayed
+        (node_id,) = node_ids() - others
+        with context.http_client.websocket_connect(url) as second:
+            msgpack.unpackb(second.receive_bytes())  # schema
+            msgpack.unpackb(second.receive_bytes())  # replayed
+        # The series remain while the node has a subscriber...
+        assert node_id in node_ids()
+    # ...and are removed when its last subscriber leaves.
+    assert node_id not in node_ids()
+
+
+def test_latency_metrics(memory_streaming_context):
+    context = memory_streaming_context
+    client = from_context(context)
+    streaming_node = client.write_array(np.arange(5), key="timed")
+    streaming_node.write(np.arange(5) + 1)
+    published = REGISTRY.get_sample_value(
+        "tiled_stream_publish_duration_seconds_count", {"datastore": "memory"}
+    )
+    sent = REGISTRY.get_sample_value(
+        "tiled_stream_send_latency_seconds_count", {"envelope_format": "msgpack"}
+    )
+    sent_bytes = REGISTRY.get_sample_value(
+        "tiled_stream_sent_bytes_total", {"envelope_format": "msgpack"}
+    )
+    replays = total_sample_value("tiled_stream_replay_messages_count")
+    replayed = total_sample_value("tiled_stream_replay_messages_sum")
+
+    with context.http_client.websocket_connect(
+        "/api/v1/stream/single/timed?envelope_format=msgpack&start=2"
+    ) as websocket:
+        msgpack.unpackb(websocket.receive_bytes())  # schema
+        replayed_message = msgpack.unpackb(websocket.receive_bytes())
+        assert replayed_message["sequence"] == 2
+        assert total_sample_value("tiled_stream_subscribers") == 1
+        before = time.time()
+        streaming_node.write(np.arange(5) + 2)
+        live_message = msgpack.unpackb(websocket.receive_bytes())
+        # (Series labeled by node are removed once its last subscriber leaves.)
+        assert total_sample_value("tiled_stream_replay_messages_count") == replays + 1
+        assert total_sample_value("tiled_stream_replay_messages_sum") == replayed + 1
+
+    # Messages carry the time at which the server received them.
+    assert replayed_message["server_received_at"] < before
+    assert before <= live_message["server_received_at"] <= time.time()
+    assert total_sample_value("tiled_stream_subscribers") == 0
+    assert (
+        REGISTRY.get_sample_value(
+            "tiled_stream_publish_duration_seconds_count", {"datastore": "memory"}
+        )
+        == published + 1
+    )
+    # Only the live message counts toward send latency...
+    assert (
+        REGISTRY.get_sample_value(
+            "tiled_stream_send_latency_seconds_count", {"envelope_format": "msgpack"}
+        )
+        == sent + 1
+    )
+    # ...but all messages count toward bytes sent.
+    assert REGISTRY.get_sample_value(
+        "tiled_stream_sent_bytes_total", {"envelope_format": "msgpack"}
+    ) > sent_bytes + len(live_message["payload"]) + len(replayed_message["payload"])
+
+
 def test_put_data_source_on_non_array_with_streaming_cache(tmpdir):
     """PUT /data_source on a non-array node (e.g. `bytes`) must not
     crash when the server has a `streaming_cache` configured.
@@ -228,3 +652,25 @@ def test_put_data_source_on_non_array_with_streaming_cache(tmpdir):
             json={"data_source": ds},
         )
         assert put_response.status_code == 200, put_response.text
+
+
+@pytest.mark.asyncio
+async def test_coalesced_frames_are_not_shared():
+    "A coalesced array-ref is not the plain message of the same sequence."
+    sent = []
+
+    class WebSocket:
+        async def send_bytes(self, data):
+            sent.append(data)
+
+    core._encoded_frames.clear()
+    send = core.get_websocket_envelope_formatter(
+        "msgpack", None, None, node_key="coalesced-node"
+    )
+    message = {"type": "array-ref", "sequence": 5, "timestamp": "t", "uri": "u"}
+    await send(WebSocket(), dict(message), None)
+    await send(WebSocket(), {**message, "coalesced": 4}, None)
+    await send(WebSocket(), dict(message), None)
+    plain, coalesced, plain_again = (msgpack.unpackb(frame) for frame in sent)
+    assert "coalesced" not in plain and "coalesced" not in plain_again
+    assert coalesced["coalesced"] == 4
@@ -758,3 +758,106 @@ def test_subscribe_no_api_key_public(tiled_websocket_context_public):
 
     with subscription.start_in_thread(0):
         assert received_event.wait(timeout=10.0), "Timeout waiting for messages"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_async(tiled_websocket_context):
+    context = tiled_websocket_context
+    client = from_context(context)
+    streaming_node = client.write_array(
+        np.arange(10), key=f"test_subscribe_async_{uuid.uuid4().hex[:8]}"
+    )
+    for i in range(1, 4):
+        streaming_node.write(np.arange(10) + i)
+
+    received = []
+    async with streaming_node.subscribe_async(start=1) as subscription:
+        async for update in subscription:
+            received.append(update)
+            if len(received) == 4:
+                break
+
+    # The creation of the array, then the three writes
+    assert [update.sequence for update in received] == [1, 2, 3, 4]
+    for i, update in enumerate(received):
+        np.testing.assert_array_equal(update.data(), np.arange(10) + i)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_async_many_nodes_one_loop(tiled_websocket_context):
+    "Many subscriptions share one event loop, without a thread per subscription."
+    import anyio
+
+    context = tiled_websocket_context
+    client = from_context(context)
+    nodes = [
+        client.write_array(np.arange(3), key=f"test_many_{i}_{uuid.uuid4().hex[:8]}")
+        for i in range(3)
+    ]
+    received = {node.item["id"]: [] for node in nodes}
+
+    async def watch(node):
+        async with node.subscribe_async() as subscription:
+            async for update in subscription:
+                received[node.item["id"]].append(update.data())
+                return
+
+    async with anyio.create_task_group() as tg:
+        for node in nodes:
+            tg.start_soon(watch, node)
+        # Wait until each subscription has connected, then write.
+        await anyio.sleep(1)
+        for i, node in enumerate(nodes):
+            await anyio.to_thread.run_sync(node.write, np.arange(3) + 10 * i)
+
+    for i, node in enumerate(nodes):
+        [data] = received[node.item["id"]]
+        np.testing.assert_array_equal(data, np.arange(3) + 10 * i)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_async_ends_when_stream_closed(tiled_websocket_context):
+    context = tiled_websocket_context
+    client = from_context(context)
+    x = client.create_container(f"test_subscribe_async_closed_{uuid.uuid4().hex[:8]}")
+    x.close_stream()
+    async with x.subscribe_async(start=0) as subscription:
+        assert [update async for update in subscription] == []
+
+
+@pytest.mark.asyncio
+async def test_subscribe_async_reconnects_and_resumes(
+    tiled_websocket_context, stamina_testing, monkeypatch
+):
+    context = tiled_websocket_context
+    client = from_context(context)
+    streaming_node = client.write_array(
+        np.arange(10), key=f"test_async_reconnect_{uuid.uuid4().hex[:8]}"
+    )
+    for i in range(1, 7):
+        streaming_node.write(np.arange(10) + i)
+
+    subscription = streaming_node.subscribe_async(start=1)
+    wrapper = subscription._websocket
+    original_recv = wrapper.recv
+    calls = 0
+
+    async def fail_once():
+        # Drop the connection after the schema and three updates.
+        nonlocal calls
+        calls += 1
+        if calls == 5:
+            raise websockets.exceptions.ConnectionClosedError(None, None)
+        return await original_recv()
+
+    monkeypatch.setattr(wrapper, "recv", fail_once)
+    received = []
+    async with subscription:
+        async for update in subscription:
+            received.append(update.sequence)
+            if len(received) == 6:
+                break
+
+    # Resumed from the update after the last one received: nothing is
+    # missed or repeated.
+    assert received == [1, 2, 3, 4, 5, 6]
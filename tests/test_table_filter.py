@@ -0,0 +1,75 @@
+import pandas
+import pyarrow
+import pytest
+
+from tiled.table_filter import TableFilter, parse_rows
+
+df = pandas.DataFrame(
+    {
+        "x": [1, 2, 3, 4],
+        "y": [0.5, -1.0, 2.5, 4.0],
+        "name": ["a", "b", "c", "d"],
+        "flag": [True, False, True, False],
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("x > 2", [3, 4]),
+        ("2 <= x", [2, 3, 4]),
+        ("1 < x <= 3", [2, 3]),
+        ("y == -1", [2]),
+        ("name in ['a', 'd']", [1, 4]),
+        ("name not in ('a', 'd')", [2, 3]),
+        ("flag and x != 3", [1]),
+        ("not flag or (x == 1)", [1, 2, 4]),
+    ],
+)
+def test_filter(text, expected):
+    table_filter = TableFilter(text)
+    assert table_filter.apply(df)["x"].tolist() == expected
+    table = pyarrow.Table.from_pandas(df).filter(table_filter.expression())
+    assert table["x"].to_pylist() == expected
+
+
+def test_filter_columns():
+    assert TableFilter("x > 1 and name in ['a'] or not flag").columns == {
+        "x",
+        "name",
+        "flag",
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "x >",
+        "__import__('os').system('true')",
+        "x.real > 1",
+        "x[0] > 1",
+        "x + 1 > 2",
+        "1 < 2",
+        "x in y",
+        "x is None",
+        "x > None",
+        "lambda: x",
+        "not " * 1000 + "flag",
+        "x > " + "1" * 5000,
+    ],
+)
+def test_invalid_filter(text):
+    with pytest.raises(ValueError):
+        TableFilter(text)
+
+
+def test_parse_rows():
+    assert parse_rows("2:5") == slice(2, 5)
+    assert parse_rows(":5") == slice(None, 5)
+    assert parse_rows("2:") == slice(2, None)
+    assert parse_rows("-3:") == slice(-3, None)
+    assert parse_rows("-3:5") == slice(-3, 5)
+    for text in ["5", "-:", "1:-2", "1:2:3", "a:b"]:
+        with pytest.raises(ValueError):
+            parse_rows(text)
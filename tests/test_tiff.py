@@ -416,3 +416,18 @@ def test_tiff_sequence_cache(client):
     assert_raises(
         AssertionError, numpy.testing.assert_equal, read_array, other_read_array
     )
+
+
+@pytest.mark.parametrize("compression, memory_mapped", [(None, True), ("zlib", False)])
+def test_tiff_memory_mapped(tmp_path, compression, memory_mapped):
+    "Uncompressed TIFF files are memory-mapped; others are decoded"
+    data = rng.integers(0, 255, size=(3, 5, 7), dtype="uint16")
+    path = tmp_path / "stack.tif"
+    tf.imwrite(path, data, compression=compression, photometric="minisblack")
+    adapter = TiffAdapter(ensure_uri(path))
+    assert isinstance(adapter.read(), numpy.memmap) == memory_mapped
+    numpy.testing.assert_array_equal(adapter.read((1, slice(2, 4))), data[1, 2:4])
+
+    sequence = TiffSequenceAdapter.from_uris(ensure_uri(path), ensure_uri(path))
+    numpy.testing.assert_array_equal(sequence.read((1, 2, 3)), data[2, 3])
+    numpy.testing.assert_array_equal(sequence.read(), numpy.stack([data, data]))
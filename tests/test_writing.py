@@ -4,6 +4,7 @@ This tests tiled's writing routes with an in-memory store.
 Persistent stores are being developed externally to the tiled package.
 """
 
+import asyncio
 import base64
 import collections
 import math
@@ -12,6 +13,7 @@ import pathlib
 import threading
 import uuid
 from datetime import datetime
+from types import SimpleNamespace
 from urllib.parse import urljoin, urlparse
 
 import awkward
@@ -25,7 +27,9 @@ import sparse
 from minio import Minio
 from minio.error import S3Error
 from pandas.testing import assert_frame_equal
+from starlette.requests import ClientDisconnect
 from starlette.status import (
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_409_CONFLICT,
     HTTP_415_UNSUPPORTED_MEDIA_TYPE,
@@ -36,15 +40,22 @@ from tiled.catalog import in_memory
 from tiled.catalog.adapter import CatalogContainerAdapter
 from tiled.client import Context, from_context, record_history
 from tiled.client.utils import ClientError
+from tiled.media_type_registration import default_serialization_registry
 from tiled.mimetypes import PARQUET_MIMETYPE
 from tiled.queries import Key
 from tiled.server.app import build_app
-from tiled.structures.array import BuiltinDtype
+from tiled.server.core import construct_batches_response
+from tiled.structures.array import ArrayStructure, BuiltinDtype
 from tiled.structures.core import Spec, StructureFamily
 from tiled.structures.data_source import DataSource
 from tiled.structures.sparse import COOStructure
 from tiled.structures.table import TableStructure
-from tiled.utils import APACHE_ARROW_FILE_MIME_TYPE, patch_mimetypes, sanitize_uri
+from tiled.utils import (
+    APACHE_ARROW_FILE_MIME_TYPE,
+    patch_mimetypes,
+    path_from_uri,
+    sanitize_uri,
+)
 from tiled.validation_registration import ValidationRegistry
 
 from .utils import fail_with_status_code
@@ -206,6 +217,67 @@ def test_write_array_chunked(tree, shape, chunks):
         assert result.specs == specs
 
 
+def test_write_array_with_storage_policy(tmpdir):
+    "The server's storage policy sets the codecs, chunks, and shards of Zarr arrays."
+    import zarr
+
+    policy = {
+        "compressors": {
+            "f": {
+                "name": "blosc",
+                "cname": "zstd",
+                "clevel": 3,
+                "shuffle": "bitshuffle",
+            },
+            "default": None,
+        },
+        "target_chunk_bytes": 800,
+        "shard_bytes": 3200,
+    }
+    catalog = in_memory(
+        writable_storage=[f"file://localhost{str(tmpdir / 'data')}"],
+        storage_policies={"application/x-zarr": policy},
+    )
+    with Context.from_app(build_app(catalog)) as context:
+        client = from_context(context)
+
+        # Tiny chunks of 40 bytes are grown to 800 bytes, and stored in a shard.
+        a = dask.array.arange(200, dtype="float64").reshape(40, 5).rechunk((1, 5))
+        ac = client.write_array(a, key="a")
+        assert ac.chunks == ((40,), (5,))
+        numpy.testing.assert_equal(ac.read(), a.compute())
+        numpy.testing.assert_equal(ac[5:25], a[5:25].compute())
+        (data_source,) = ac.data_sources()
+        assert "storage_policy" not in data_source.parameters
+        stored = zarr.open(path_from_uri(data_source.assets[0].data_uri))
+        assert stored.chunks == (20, 5)
+        assert stored.shards == (40, 5)
+        (compressor,) = stored.compressors
+        assert compressor.cname.value == "zstd"
+
+        # A data source overrides the server's policy.
+        b = numpy.arange(200, dtype="int32").reshape(40, 5)
+        bc = client.new(
+            "array",
+            [
+                DataSource(
+                    structure=ArrayStructure.from_array(b, chunks=((1,) * 40, (5,))),
+                    structure_family="array",
+                    parameters={"storage_policy": {"shard_bytes": None}},
+                )
+            ],
+            key="b",
+        )
+        assert bc.chunks == ((40,), (5,))
+        bc.write(b)
+        numpy.testing.assert_equal(bc.read(), b)
+        (data_source,) = bc.data_sources()
+        stored = zarr.open(path_from_uri(data_source.assets[0].data_uri))
+        assert stored.chunks == (40, 5)
+        assert stored.shards is None
+        assert stored.compressors == ()
+
+
 def test_extend_array(tree):
     "Extend an array with additional data, expanding its shape."
     with Context.from_app(
@@ -310,6 +382,26 @@ def test_write_table_partitioned(tree):
         assert result.specs == specs
 
 
+def test_read_table_rows_and_filter(tree):
+    "Tables stored as Parquet are read with the rows and filter pushed down"
+    with Context.from_app(
+        build_app(tree, validation_registry=validation_registry)
+    ) as context:
+        client = from_context(context)
+
+        df = pandas.DataFrame({"x": numpy.arange(10), "y": numpy.arange(10) * 0.5})
+        ddf = dask.dataframe.from_pandas(df, npartitions=2)
+        result = client.write_table(ddf, key="filtered")
+
+        actual = result.read(filter="x >= 3 and y < 4")
+        assert actual["x"].tolist() == [3, 4, 5, 6, 7]
+        actual = result.read_partition(1, ["y"], rows=slice(1, 3), filter="x != 6")
+        assert list(actual.columns) == ["y"]
+        assert actual["y"].tolist() == [3.5]
+        # The last rows
+        assert result.read_partition(1, rows=slice(-3, None))["x"].tolist() == [7, 8, 9]
+
+
 def test_write_table_dict(tree):
     with Context.from_app(
         build_app(tree, validation_registry=validation_registry)
@@ -425,6 +517,58 @@ def test_write_sparse_chunked(tree):
         assert result.specs == specs
 
 
+def test_read_sparse_slice_loads_intersecting_blocks(tree, monkeypatch):
+    from tiled.adapters import sparse_blocks_parquet
+
+    loaded = []
+    original = sparse_blocks_parquet.load_block
+
+    def spy(uri, ranges=None):
+        loaded.append(uri)
+        return original(uri, ranges)
+
+    monkeypatch.setattr(sparse_blocks_parquet, "load_block", spy)
+    with Context.from_app(
+        build_app(tree, validation_registry=validation_registry)
+    ) as context:
+        client = from_context(context)
+        N = 4
+        x = client.new(
+            "sparse",
+            [
+                DataSource(
+                    structure=COOStructure(
+                        shape=(2 * N, 2 * N),
+                        chunks=((N, N), (N, N)),
+                        data_type=BuiltinDtype.from_numpy_dtype(numpy.dtype("float64")),
+                    ),
+                    structure_family="sparse",
+                )
+            ],
+        )
+        expected = numpy.zeros((2 * N, 2 * N))
+        for i in range(2):
+            for j in range(2):
+                coords = [[0, 1, 3], [2, 0, 3]]
+                data = [10 * i + j + 0.5, 10 * i + j + 1.5, 10 * i + j + 2.5]
+                x.write_block(coords=coords, data=data, block=(i, j))
+                for (row, col), value in zip(zip(*coords), data):
+                    expected[N * i + row, N * j + col] = value
+
+        loaded.clear()
+        numpy.testing.assert_equal(x[1:3, 5:7].todense(), expected[1:3, 5:7])
+        # Only the block (0, 1) intersects the slice.
+        assert len(loaded) == 1
+        loaded.clear()
+        numpy.testing.assert_equal(x[3:6, 2].todense(), expected[3:6, 2])
+        assert len(loaded) == 2
+        loaded.clear()
+        numpy.testing.assert_equal(x[-3:, :].todense(), expected[-3:, :])
+        assert len(loaded) == 2
+        numpy.testing.assert_equal(x[2:2].todense(), expected[2:2])
+        numpy.testing.assert_equal(x.read().todense(), expected)
+
+
 def test_limits(tree):
     "Test various limits on uploaded metadata."
 
@@ -914,6 +1058,92 @@ def test_append_partition(
         assert_frame_equal(x.read(), pandas.DataFrame(expected_file), check_dtype=False)
 
 
+def test_stream_appendable_table(tree):
+    "Appendable tables are streamed in the Arrow format, batch by batch"
+    table = pyarrow.table({"x": numpy.arange(5000), "y": numpy.arange(5000) * 0.5})
+    with Context.from_app(build_app(tree)) as context:
+        client = from_context(context)
+        x = client.create_appendable_table(table.schema, key="x")
+        x.append_partition(0, table)
+
+        with record_history() as history:
+            actual = x.read()
+        assert actual["x"].tolist() == table["x"].to_pylist()
+        (response,) = history.responses
+        assert response.headers["Content-Type"] == APACHE_ARROW_FILE_MIME_TYPE
+        # A streamed response has no ETag.
+        assert "ETag" not in response.headers
+        assert x.read_partition(0, ["y"])["y"].tolist() == table["y"].to_pylist()
+
+        # Other formats are serialized from the whole table as before.
+        response = context.http_client.get(
+            x.item["links"]["full"], params={"format": "csv"}
+        )
+        response.raise_for_status()
+        assert "ETag" in response.headers
+        assert response.text.count("\n") == 1 + len(table)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spec_version", ["2.3", "2.4"])
+async def test_streamed_table_closed_on_disconnect(spec_version):
+    "The reader of a streamed table is closed if the client disconnects."
+    schema = pyarrow.schema([("x", pyarrow.int64())])
+    closed = []
+
+    def batches():
+        try:
+            for i in range(100_000):
+                yield pyarrow.record_batch([pyarrow.array([i])], schema=schema)
+        finally:
+            closed.append(True)
+
+    response = construct_batches_response(
+        default_serialization_registry,
+        pyarrow.RecordBatchReader.from_batches(schema, batches()),
+        {},
+        SimpleNamespace(state=SimpleNamespace()),
+    )
+    sent = asyncio.Event()
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            sent.set()
+            # Servers implementing ASGI 2.4 raise when the client is gone...
+            if spec_version == "2.4":
+                raise OSError("Connection lost")
+
+    async def receive():
+        # ...and older ones report it as a message.
+        await sent.wait()
+        return {"type": "http.disconnect"}
+
+    scope = {"type": "http", "asgi": {"spec_version": spec_version}}
+    try:
+        await response(scope, receive, send)
+    except ClientDisconnect:
+        pass
+    assert closed == [True]
+
+
+def test_read_appendable_table_rows_and_filter(tree):
+    "Appendable tables select rows by position and value in the database"
+    table = pyarrow.table({"x": numpy.arange(100), "y": numpy.arange(100) * 0.5})
+    with Context.from_app(build_app(tree)) as context:
+        client = from_context(context)
+        x = client.create_appendable_table(table.schema, key="x")
+        x.append_partition(0, table)
+
+        assert x.read(filter="x >= 97")["x"].tolist() == [97, 98, 99]
+        actual = x.read_partition(0, ["y"], rows=slice(10, 14), filter="x != 11")
+        assert list(actual.columns) == ["y"]
+        assert actual["y"].tolist() == [5.0, 6.0, 6.5]
+        # The last rows, e.g. of a live table
+        assert x.read_partition(0, rows=slice(-3, None))["x"].tolist() == [97, 98, 99]
+        with fail_with_status_code(HTTP_400_BAD_REQUEST):
+            x.read(filter="z > 1")
+
+
 @pytest.mark.parametrize(
     "table_name, expected",
     [
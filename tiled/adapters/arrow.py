@@ -1,7 +1,19 @@
 import copy
+import hashlib
+import os
 from collections.abc import Set
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import quote_plus
 
 import pandas
@@ -21,6 +33,57 @@ from .array import ArrayAdapter
 from .utils import init_adapter_from_catalog
 
 
+class ArrowFile(NamedTuple):
+    "The contents of an Arrow IPC file, memory-mapped, and an ETag identifying them"
+
+    data: pyarrow.Buffer
+    etag: str
+
+
+def open_ipc_file(path: Union[str, Path]) -> pyarrow.RecordBatchFileReader:
+    """Open an Arrow IPC file, memory-mapped
+
+    Tables read from it reference the mapped file rather than copies of it, so
+    they must not outlive changes to the file; see `write_ipc_file`.
+    """
+    return pyarrow.ipc.open_file(pyarrow.memory_map(str(path), "r"))
+
+
+def write_ipc_file(path: Union[str, Path], batches: List[pyarrow.RecordBatch]) -> None:
+    """Write an Arrow IPC file, replacing any existing one atomically
+
+    Tables memory-mapped from the file it replaces remain valid.
+    """
+    temporary = f"{path}.tmp-{os.getpid()}"
+    try:
+        with pyarrow.ipc.new_file(temporary, batches[0].schema) as file_writer:
+            for batch in batches:
+                file_writer.write_batch(batch)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def _select(
+    table: pyarrow.Table, fields: Optional[Union[str, List[str]]]
+) -> pyarrow.Table:
+    # Keep the columns that pandas restores as the index, as selecting the
+    # fields after converting to pandas would.
+    if fields is None:
+        return table
+    columns = [fields] if isinstance(fields, str) else list(fields)
+    for name in columns:
+        if name not in table.column_names:
+            raise KeyError(name)
+    index_columns = [
+        name
+        for name in (table.schema.pandas_metadata or {}).get("index_columns", [])
+        if isinstance(name, str) and name not in columns
+    ]
+    return table.select([*columns, *index_columns])
+
+
 class ArrowAdapter(Adapter[TableStructure]):
     """ArrowAdapter Class"""
 
@@ -37,7 +100,7 @@ class ArrowAdapter(Adapter[TableStructure]):
         # TODO Store data_uris instead and generalize to non-file schemes.
         self._partition_paths = [path_from_uri(uri) for uri in data_uris]
         if structure is None:
-            table = feather.read_table(self._partition_paths)
+            table = feather.read_table(self._partition_paths, memory_map=True)
             structure = TableStructure.from_arrow_table(table)
         super().__init__(structure, metadata=metadata, specs=specs)
 
@@ -199,7 +262,7 @@ class ArrowAdapter(Adapter[TableStructure]):
         if not Path(self._partition_paths[partition]).exists():
             raise ValueError(f"partition {partition} has not been stored yet")
         else:
-            return pyarrow.ipc.open_file(self._partition_paths[partition])
+            return open_ipc_file(self._partition_paths[partition])
 
     def reader_handle_all(self) -> Iterator[pyarrow.RecordBatchFileReader]:
         """Initialize and return the reader handle.
@@ -212,7 +275,7 @@ class ArrowAdapter(Adapter[TableStructure]):
             if not Path(path).exists():
                 raise ValueError(f"path {path} has not been stored yet")
             else:
-                with pyarrow.ipc.open_file(path) as reader:
+                with open_ipc_file(path) as reader:
                     yield reader
 
     def write_partition(
@@ -238,13 +301,7 @@ class ArrowAdapter(Adapter[TableStructure]):
             else:
                 batches = data
 
-        schema = batches[0].schema
-
-        uri = self._partition_paths[partition]
-
-        with pyarrow.ipc.new_file(uri, schema) as file_writer:
-            for batch in batches:
-                file_writer.write_batch(batch)
+        write_ipc_file(self._partition_paths[partition], batches)
 
     def write(
         self,
@@ -267,15 +324,9 @@ class ArrowAdapter(Adapter[TableStructure]):
             else:
                 batches = data
 
-        schema = batches[0].schema
-
         if self.structure().npartitions != 1:
             raise NotImplementedError
-        uri = self._partition_paths[0]
-
-        with pyarrow.ipc.new_file(uri, schema) as file_writer:
-            for batch in data:
-                file_writer.write_batch(batch)
+        write_ipc_file(self._partition_paths[0], batches)
 
     def read(self, fields: Optional[Union[str, List[str]]] = None) -> pandas.DataFrame:
         """
@@ -286,14 +337,72 @@ class ArrowAdapter(Adapter[TableStructure]):
         -------
         Returns the concatenated pyarrow table as pandas dataframe.
         """
-        data = pyarrow.concat_tables(
-            [partition.read_all() for partition in self.reader_handle_all()]
-        )
-        table = data.to_pandas()
+        table = self.read_table().to_pandas()
         if fields is not None:
             return table[fields]
         return table
 
+    def read_table(
+        self, fields: Optional[Union[str, List[str]]] = None
+    ) -> pyarrow.Table:
+        """
+        The concatenated data from all partitions, memory-mapped.
+        Parameters
+        ----------
+        fields : optional fields parameter.
+
+        Returns
+        -------
+        The pyarrow table, referencing the record batches in the files.
+        """
+        return _select(
+            pyarrow.concat_tables(
+                [partition.read_all() for partition in self.reader_handle_all()]
+            ),
+            fields,
+        )
+
+    def read_partition_table(
+        self,
+        partition: int,
+        fields: Optional[Union[str, List[str]]] = None,
+    ) -> pyarrow.Table:
+        """
+        Function to read a given partition, memory-mapped.
+        Parameters
+        ----------
+        partition : the index of the partition to read.
+        fields : optional fields parameter.
+
+        Returns
+        -------
+        The pyarrow table, referencing the record batches in the file.
+        """
+        return _select(self.reader_handle_partiton(partition).read_all(), fields)
+
+    def read_partition_ipc(self, partition: int) -> ArrowFile:
+        """
+        Function to read a given partition as the Arrow IPC file that stores it.
+        Parameters
+        ----------
+        partition : the index of the partition to read.
+
+        Returns
+        -------
+        The file contents, memory-mapped, with an ETag derived from the file's path,
+        size, and modification time rather than from its contents.
+        """
+        path = self._partition_paths[partition]
+        if not Path(path).exists():
+            raise ValueError(f"partition {partition} has not been stored yet")
+        # The buffer keeps the mapping open.
+        data = pyarrow.memory_map(str(path), "r").read_buffer()
+        stat = os.stat(path)
+        etag = hashlib.md5(
+            f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+        ).hexdigest()
+        return ArrowFile(data, etag)
+
     def read_partition(
         self,
         partition: int,
@@ -310,8 +419,7 @@ class ArrowAdapter(Adapter[TableStructure]):
         -------
         The pyarrow table corresponding to a given partition and batch as pandas dataframe.
         """
-        reader = self.reader_handle_partiton(partition)
-        table = reader.read_all().to_pandas()
+        table = self.read_partition_table(partition).to_pandas()
         if fields is not None:
             return table[fields]
         return table
@@ -1,12 +1,29 @@
 import copy
+import io
+import os
+import threading
 from collections.abc import Set
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import quote_plus
 
+import cachetools
 import dask.dataframe
 import numpy
 import pandas
+import pyarrow
+import pyarrow.csv
 import pyarrow.types as patypes
 
 from tiled.adapters.core import Adapter
@@ -17,11 +34,134 @@ from ..structures.array import ArrayStructure, BuiltinDtype, StructDtype
 from ..structures.core import Spec, StructureFamily
 from ..structures.data_source import Asset, DataSource, Management
 from ..structures.table import TableStructure
+from ..table_filter import TableFilter, columns_to_read, select_rows
 from ..type_aliases import JSON
 from ..utils import ensure_uri, path_from_uri
 from .array import ArrayAdapter
+from .io_executor import get_io_executor
+from .resource_cache import default_ttu
 from .utils import init_adapter_from_catalog
 
+# Partitions are parsed with pyarrow's multithreaded CSV reader when the
+# read_csv keyword arguments have pyarrow equivalents (and with pandas
+# otherwise). The parsed tables are cached, so that reading the columns of a
+# table one at a time, as clients do, parses each file once. The cache is
+# bounded by the total size of the tables, in bytes; a larger table is not
+# cached.
+TABLE_CACHE_BYTES = int(os.getenv("TILED_CSV_TABLE_CACHE_BYTES", str(512 * 2**20)))
+
+# Files at least ROW_INDEX_MIN_BYTES large are indexed when they are
+# registered: the byte offset of every ROW_INDEX_STRIDE-th row is recorded in
+# the data source's properties, so that a file can be parsed in row-range
+# chunks concurrently, and a range of rows can be read without parsing the
+# rows before it.
+ROW_INDEX_STRIDE = int(os.getenv("TILED_CSV_ROW_INDEX_STRIDE", "100000"))
+ROW_INDEX_MIN_BYTES = int(os.getenv("TILED_CSV_ROW_INDEX_MIN_BYTES", str(64 * 2**20)))
+
+_table_cache: cachetools.TLRUCache[Any, pyarrow.Table] = cachetools.TLRUCache(
+    TABLE_CACHE_BYTES, default_ttu, getsizeof=lambda table: max(table.nbytes, 1)
+)
+_table_cache_lock = threading.Lock()
+
+
+class ArrowCSVOptions(NamedTuple):
+    "Options for reading a CSV file with pyarrow.csv, equivalent to read_csv keyword arguments"
+
+    parse_options: pyarrow.csv.ParseOptions
+    convert_options: pyarrow.csv.ConvertOptions
+    column_names: List[str]  # empty if read from the header
+    skip_rows: int  # the number of header lines
+
+
+def arrow_csv_options(
+    read_csv_kwargs: Dict[str, Any], schema: pyarrow.Schema
+) -> Optional[ArrowCSVOptions]:
+    """Translate pandas.read_csv keyword arguments to pyarrow.csv options
+
+    Columns are converted to the types in `schema`, the structure inferred by
+    pandas, so that both readers give the same result. Returns None if any
+    argument has no pyarrow equivalent.
+    """
+    if not set(read_csv_kwargs).issubset(
+        {"sep", "delimiter", "header", "names", "usecols", "assume_missing"}
+    ):
+        return None
+    sep = read_csv_kwargs.get("sep", read_csv_kwargs.get("delimiter", ","))
+    names = read_csv_kwargs.get("names")
+    header = read_csv_kwargs.get("header", None if names else "infer")
+    usecols = read_csv_kwargs.get("usecols")
+    if (
+        not isinstance(sep, str)
+        or len(sep) != 1
+        or header not in ("infer", 0, None)
+        or (header is None and not names)
+        or (usecols is not None and not all(isinstance(c, str) for c in usecols))
+    ):
+        return None
+    # The types in the schema already account for assume_missing.
+    return ArrowCSVOptions(
+        pyarrow.csv.ParseOptions(delimiter=sep),
+        pyarrow.csv.ConvertOptions(
+            column_types={field.name: field.type for field in schema},
+            # Columns named with a leading underscore are reserved; e.g. an index
+            include_columns=[name for name in schema.names if not name.startswith("_")],
+            strings_can_be_null=True,
+        ),
+        list(names or []),
+        0 if header is None else 1,
+    )
+
+
+def _to_pandas(table: pyarrow.Table) -> pandas.DataFrame:
+    "Convert a table parsed by pyarrow to the DataFrame pandas.read_csv would give"
+    df = table.to_pandas()
+    # pandas.read_csv gives NaN, not None, for missing strings (and dates).
+    objects = df.columns[df.dtypes == object]
+    if len(objects):
+        df[objects] = df[objects].where(df[objects].notna(), numpy.nan)
+    return df
+
+
+def build_row_index(
+    filepath: Union[str, Path], skip_rows: int, stride: int = ROW_INDEX_STRIDE
+) -> Optional[JSON]:
+    """Record the byte offset of every `stride`-th row of a CSV file
+
+    The first offset is that of the first row after the header. Returns None if
+    rows cannot be told apart by line breaks alone: if the file has quoted
+    fields (which may span lines) or blank lines (which parsers skip).
+    """
+    stat = os.stat(filepath)
+    rows = 0
+    with open(filepath, "rb") as file:
+        for _ in range(skip_rows):
+            file.readline()
+        position = file.tell()
+        offsets = [position]
+        last = b"\n"
+        while block := file.read(2**24):
+            if b'"' in block or b"\n\n" in last + block or b"\n\r\n" in last + block:
+                return None
+            breaks = numpy.flatnonzero(
+                numpy.frombuffer(block, dtype=numpy.uint8) == ord("\n")
+            )
+            # The number of the row ending at each line break, counting from 1
+            ends = rows + 1 + numpy.arange(len(breaks))
+            offsets.extend((position + breaks[ends % stride == 0] + 1).tolist())
+            rows += len(breaks)
+            position += len(block)
+            last = block[-1:]
+    if last != b"\n":
+        rows += 1  # The last row does not end with a line break.
+    if offsets[-1] == stat.st_size:
+        offsets.pop()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "rows": rows,
+        "offsets": offsets,
+    }
+
 
 class CSVAdapter(Adapter[TableStructure]):
     """Adapter for tabular data stored as partitioned text (csv) files"""
@@ -35,6 +175,7 @@ class CSVAdapter(Adapter[TableStructure]):
         *,
         metadata: Optional[JSON] = None,
         specs: Optional[List[Spec]] = None,
+        row_index: Optional[JSON] = None,
         **kwargs: Optional[Any],
     ) -> None:
         """Adapter for partitioned tabular data stored as a sequence of text (csv) files
@@ -45,17 +186,23 @@ class CSVAdapter(Adapter[TableStructure]):
         structure :
         metadata :
         specs :
+        row_index : dict, optional
+            byte offsets of the rows in each file, as built by `infer_properties`
         kwargs : dict
             any keyword arguments that can be passed to the pandas.read_csv function, e.g. names, sep, dtype, etc.
         """
         self._file_paths = [path_from_uri(uri) for uri in data_uris]
         self._read_csv_kwargs = kwargs
+        self._row_index = row_index
         if structure is None:
             ddf = dask.dataframe.read_csv(self._file_paths, **self._read_csv_kwargs)
             if usecols := self._read_csv_kwargs.get("usecols"):
                 ddf = ddf[usecols]  # Ensure the order of columns is preserved
             structure = TableStructure.from_dask_dataframe(ddf)
         super().__init__(structure, metadata=metadata, specs=specs)
+        self._arrow_options = arrow_csv_options(
+            self._read_csv_kwargs, self.structure().arrow_schema_decoded
+        )
 
     @classmethod
     def supported_storage(cls) -> Set[type[Storage]]:
@@ -69,7 +216,45 @@ class CSVAdapter(Adapter[TableStructure]):
         /,
         **kwargs: Optional[Any],
     ) -> "CSVAdapter":
-        return init_adapter_from_catalog(cls, data_source, node, **kwargs)
+        return init_adapter_from_catalog(
+            cls,
+            data_source,
+            node,
+            row_index=(data_source.properties or {}).get("row_index"),
+            **kwargs,
+        )
+
+    @classmethod
+    def infer_properties(cls, data_source: DataSource[TableStructure]) -> JSON:
+        """Index the rows of large files in a data source
+
+        The catalog calls this when an external data source is registered. The
+        byte offset of every `ROW_INDEX_STRIDE`-th row of each file at least
+        `ROW_INDEX_MIN_BYTES` large is recorded, as "row_index". Returns an
+        empty dict if no file is indexed.
+        """
+        structure = data_source.structure
+        if isinstance(structure, dict):
+            structure = TableStructure(**structure)
+        if structure is None:
+            return {}
+        options = arrow_csv_options(
+            data_source.parameters or {}, structure.arrow_schema_decoded
+        )
+        if options is None:
+            return {}
+        files: List[Optional[JSON]] = []
+        for asset in sorted(data_source.assets, key=lambda ast: ast.num or 0):
+            filepath = path_from_uri(asset.data_uri)
+            if os.path.getsize(filepath) < ROW_INDEX_MIN_BYTES:
+                files.append(None)
+            else:
+                files.append(
+                    build_row_index(filepath, options.skip_rows, ROW_INDEX_STRIDE)
+                )
+        if not any(files):
+            return {}
+        return {"row_index": {"stride": ROW_INDEX_STRIDE, "files": files}}
 
     @classmethod
     def from_uris(
@@ -166,6 +351,93 @@ class CSVAdapter(Adapter[TableStructure]):
         uri = self._file_paths[0]
         data.to_csv(uri, index=False)
 
+    def _cache_key(self, indx: int) -> Tuple[Any, ...]:
+        stat = os.stat(self._file_paths[indx])
+        return (
+            str(self._file_paths[indx]),
+            stat.st_size,
+            stat.st_mtime_ns,
+            repr(sorted(self._read_csv_kwargs.items())),
+            self.structure().arrow_schema,
+        )
+
+    def _file_row_index(self, indx: int) -> Optional[JSON]:
+        "Return the row index of a partition, if it has one and the file has not changed since"
+        if self._row_index is None or self._arrow_options is None:
+            return None
+        files = self._row_index.get("files", [])
+        entry = files[indx] if indx < len(files) else None
+        if not entry or not entry["offsets"]:
+            return None
+        stat = os.stat(self._file_paths[indx])
+        if (entry["size"], entry["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+            return None
+        return entry
+
+    def _read_chunks(self, indx: int, entry: JSON, chunks: range) -> pyarrow.Table:
+        "Parse the given row-range chunks of an indexed partition, concurrently"
+        options = self._arrow_options
+        offsets = [*entry["offsets"], entry["size"]]
+        with open(self._file_paths[indx], "rb") as file:
+            header = file.readline() if options.skip_rows else b""
+        if options.column_names:
+            column_names = options.column_names
+        else:
+            column_names = pyarrow.csv.read_csv(
+                io.BytesIO(header.rstrip(b"\r\n") + b"\n"),
+                parse_options=options.parse_options,
+            ).column_names
+        read_options = pyarrow.csv.ReadOptions(
+            column_names=column_names, use_threads=False
+        )
+
+        def parse_chunk(chunk: int) -> pyarrow.Table:
+            with open(self._file_paths[indx], "rb") as file:
+                file.seek(offsets[chunk])
+                data = file.read(offsets[chunk + 1] - offsets[chunk])
+            return pyarrow.csv.read_csv(
+                io.BytesIO(data),
+                read_options=read_options,
+                parse_options=options.parse_options,
+                convert_options=options.convert_options,
+            )
+
+        return pyarrow.concat_tables(get_io_executor().map(parse_chunk, chunks))
+
+    def _read_table(self, indx: int) -> Optional[pyarrow.Table]:
+        """Parse a partition with pyarrow, using the cache
+
+        Returns None if the partition must be read with pandas instead.
+        """
+        if self._arrow_options is None:
+            return None
+        key = self._cache_key(indx)
+        with _table_cache_lock:
+            table = _table_cache.get(key)
+        if table is not None:
+            return table
+        options = self._arrow_options
+        try:
+            if (entry := self._file_row_index(indx)) is not None:
+                table = self._read_chunks(indx, entry, range(len(entry["offsets"])))
+            else:
+                table = pyarrow.csv.read_csv(
+                    self._file_paths[indx],
+                    read_options=pyarrow.csv.ReadOptions(
+                        column_names=options.column_names,
+                        skip_rows=options.skip_rows if options.column_names else 0,
+                    ),
+                    parse_options=options.parse_options,
+                    convert_options=options.convert_options,
+                )
+        except (pyarrow.ArrowInvalid, KeyError):
+            # e.g. a value that pyarrow does not convert to the column's type
+            return None
+        if table.nbytes <= TABLE_CACHE_BYTES:
+            with _table_cache_lock:
+                _table_cache[key] = table
+        return table
+
     def read(self, fields: Optional[List[str]] = None) -> pandas.DataFrame:
         dfs = [
             self.read_partition(i, fields=fields) for i in range(len(self._file_paths))
@@ -191,6 +463,12 @@ class CSVAdapter(Adapter[TableStructure]):
             DataFrame containing the requested columns from the partition
         """
 
+        if fields is None or all(isinstance(field, str) for field in fields):
+            if (table := self._read_table(indx)) is not None:
+                if fields is not None:
+                    table = table.select(list(fields))
+                return _to_pandas(table)
+
         kwargs = {**self._read_csv_kwargs}
         if fields is not None:
             kwargs.update({"usecols": fields})
@@ -214,6 +492,79 @@ class CSVAdapter(Adapter[TableStructure]):
 
         return df
 
+    def read_rows(
+        self,
+        indx: int,
+        start: Optional[int],
+        stop: Optional[int],
+        fields: Optional[List[str]] = None,
+    ) -> pandas.DataFrame:
+        """Read a range of rows from a single partition
+
+        If the file is indexed (see `infer_properties`) only the chunks of it that
+        span the rows are parsed.
+
+        Parameters
+        ----------
+        indx : int
+            index of the partition to read
+        start, stop : int or None
+            the range of rows to read, as in a slice
+        fields : list of str, optional
+            list of columns to read from the partition
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame containing the requested rows and columns, indexed by row number
+        """
+        entry = self._file_row_index(indx)
+        if entry is not None:
+            start, stop, _ = slice(start, stop).indices(entry["rows"])
+            with _table_cache_lock:
+                cached = self._cache_key(indx) in _table_cache
+        if entry is None or cached or start >= stop:
+            return self.read_partition(indx, fields=fields).iloc[start:stop]
+        stride = self._row_index["stride"]
+        chunks = range(start // stride, (stop - 1) // stride + 1)
+        try:
+            table = self._read_chunks(indx, entry, chunks)
+        except (pyarrow.ArrowInvalid, KeyError):
+            return self.read_partition(indx, fields=fields).iloc[start:stop]
+        table = table.slice(start - chunks.start * stride, stop - start)
+        if fields is not None:
+            table = table.select(list(fields))
+        df = _to_pandas(table)
+        df.index = pandas.RangeIndex(start, stop)
+        return df
+
+    def read_partition_subset(
+        self,
+        indx: int,
+        fields: Optional[List[str]] = None,
+        rows: Optional[slice] = None,
+        filter: Optional[TableFilter] = None,
+    ) -> pandas.DataFrame:
+        """Read a subset of the rows of a single partition
+
+        Parameters
+        ----------
+        indx : int
+            index of the partition to read
+        fields : list of str, optional
+            list of columns to read from the partition
+        rows : slice, optional
+            the rows to read, by position in the partition (see `read_rows`)
+        filter : TableFilter, optional
+            an expression that the rows must satisfy, applied after `rows`
+        """
+        columns = columns_to_read(fields, filter)
+        if rows is None:
+            df = self.read_partition(indx, fields=columns)
+        else:
+            df = self.read_rows(indx, rows.start, rows.stop, fields=columns)
+        return select_rows(df, fields, filter=filter)
+
     def get(self, key: str) -> Union[ArrayAdapter, None]:
         if key not in self.structure().columns:
             return None
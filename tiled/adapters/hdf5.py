@@ -1,11 +1,14 @@
 import builtins
+import contextlib
 import copy
 import itertools
+import math
 import os
 import sys
+import threading
 import warnings
 from pathlib import Path
-from typing import Any, Iterator, List, Optional, Tuple, Union
+from typing import Any, Container, Iterator, List, Optional, Tuple, Union
 
 import dask
 import dask.array
@@ -20,8 +23,9 @@ from tiled.structures.container import ContainerStructure
 
 from ..adapters.utils import IndexersMixin
 from ..catalog.orm import Node
+from ..hdf5_filters import MULTITHREADED_FILTERS, StoredChunk
 from ..iterviews import ItemsView, KeysView, ValuesView
-from ..ndslice import NDSlice
+from ..ndslice import NDBlock, NDSlice
 from ..server.core import NoEntry
 from ..structures.array import ArrayStructure
 from ..structures.core import Spec, StructureFamily
@@ -29,6 +33,8 @@ from ..structures.data_source import DataSource
 from ..type_aliases import JSON
 from ..utils import BrokenLink, Sentinel, node_repr, path_from_uri
 from .array import ArrayAdapter
+from .io_executor import get_io_executor
+from .resource_cache import with_resource_cache
 from .utils import split_chunks
 
 SWMR_DEFAULT = bool(int(os.getenv("TILED_HDF5_SWMR_DEFAULT", "0")))
@@ -37,6 +43,8 @@ INLINED_DEPTH = int(os.getenv("TILED_HDF5_INLINED_CONTENTS_MAX_DEPTH", "7"))
 HDF5_DATASET = Sentinel("HDF5_DATASET")
 HDF5_BROKEN_LINK = Sentinel("HDF5_BROKEN_LINK")
 MIN_CHUNK_SIZE = 1  # Minimum chunk size along the concatenation axis
+# Read through Dask (one task per chunk) rather than HDF5ConcatenatedArray
+USE_DASK = bool(int(os.getenv("TILED_HDF5_USE_DASK", "0")))
 
 
 def parse_hdf5_tree(
@@ -76,7 +84,7 @@ def get_hdf5_attrs(
 ) -> JSON:
     """Get attributes of an HDF5 dataset"""
     file_path = path_from_uri(file_uri)
-    with h5open(
+    with pooled_h5open(
         file_path, dataset=dataset, swmr=swmr, libver=libver, locking=locking
     ) as node:
         d = dict(getattr(node, "attrs", {}))
@@ -122,13 +130,423 @@ class h5open(h5py.File):  # type: ignore
         super().__exit__(exc_type, exc_value, exc_tb)
 
         if exc_type == KeyError:
-            if "file" in str(exc_value):
-                # External link is broken
-                raise BrokenLink(exc_value.args[0]) from exc_value
+            _raise_if_broken_link(exc_value)
 
-            elif "component not found" in str(exc_value):
-                # Soft link is broken
-                raise BrokenLink(exc_value.args[0]) from exc_value
+
+def _raise_if_broken_link(exc_value: KeyError) -> None:
+    "Translate the KeyError h5py raises for a broken link into BrokenLink."
+    if "file" in str(exc_value):
+        # External link is broken
+        raise BrokenLink(exc_value.args[0]) from exc_value
+
+    elif "component not found" in str(exc_value):
+        # Soft link is broken
+        raise BrokenLink(exc_value.args[0]) from exc_value
+
+
+class HDF5FileHandle:
+    """A read-only HDF5 file handle, pooled and shared by all readers of the file
+
+    Opening an HDF5 file costs a few milliseconds, and on parallel filesystems
+    it loads the metadata server, so handles are kept in the resource cache
+    (see tiled.adapters.resource_cache) and reused across requests and chunk
+    reads. Obtain one with pooled_h5open.
+
+    h5py objects are not safe to use from several threads at once, so access
+    through a handle is serialized by a per-handle lock. In SWMR mode,
+    resizable datasets are refreshed on access so that readers see data
+    appended since the file was opened without reopening it.
+    """
+
+    def __init__(self, filename: Union[str, Path]) -> None:
+        self._filename = filename
+        self._file: Optional[h5py.File] = None
+        self._options: Optional[tuple[Any, ...]] = None
+        self._lock = threading.RLock()
+
+    def _open(
+        self, swmr: bool, libver: str, locking: Optional[Union[bool, str]]
+    ) -> h5py.File:
+        return h5py.File(
+            self._filename, mode="r", swmr=swmr, libver=libver, locking=locking
+        )
+
+    @contextlib.contextmanager
+    def node(
+        self,
+        dataset: Optional[str] = None,
+        swmr: bool = SWMR_DEFAULT,
+        libver: str = "latest",
+        locking: Optional[Union[bool, str]] = None,
+    ) -> Iterator[Union[h5py.File, h5py.Group, h5py.Dataset]]:
+        "Hold the lock and yield the file, or the group or dataset at a path in it"
+        with self._lock:
+            options = (swmr, libver, locking)
+            if not self._file or options != self._options:
+                # HDF5 refuses to open a file that is already open with
+                # different flags, so there is one handle per file, reopened
+                # if the flags change.
+                self.close()
+                self._file = self._open(swmr, libver, locking)
+                self._options = options
+            try:
+                node = self._file[dataset] if dataset else self._file
+            except KeyError as err:
+                _raise_if_broken_link(err)
+                raise
+            # Only a resizable dataset can grow; refreshing others is not
+            # needed, and H5Drefresh is fragile under concurrent readers.
+            if swmr and isinstance(node, h5py.Dataset) and node.maxshape != node.shape:
+                node.refresh()
+            yield node
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_HANDLES_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def pooled_h5open(
+    filename: Union[str, Path],
+    dataset: Optional[str] = None,
+    swmr: bool = SWMR_DEFAULT,
+    libver: str = "latest",
+    locking: Optional[Union[bool, str]] = None,
+) -> Iterator[Union[h5py.File, h5py.Group, h5py.Dataset]]:
+    """Like h5open, but using a pooled file handle (see HDF5FileHandle)
+
+    The yielded object must not be used after the context exits.
+    """
+    filename = Path(filename)
+    # Look up and create handles under a lock, so that concurrent readers of a
+    # file that is not yet in the cache do not each open it.
+    with _HANDLES_LOCK:
+        handle = with_resource_cache(
+            (HDF5FileHandle, filename), HDF5FileHandle, filename
+        )
+    with handle.node(dataset, swmr=swmr, libver=libver, locking=locking) as node:
+        yield node
+
+
+class HDF5ConcatenatedArray:
+    """An array-like view of a dataset concatenated along the first axis of several HDF5 files
+
+    Indexing it reads only the files that the selection touches, directly into a preallocated
+    output array, and reads from several files concurrently in the shared I/O pool. Unlike a
+    Dask array, constructing it costs nothing per file or chunk: the files touched by a
+    selection are found from the cumulative lengths of the datasets with `numpy.searchsorted`.
+
+    Parameters
+    ----------
+    file_paths : list
+        The paths of the files; entries for files that are never read may be None
+    dataset : str
+        The dataset to read from the files
+    file_shapes : list
+        The shape of the dataset in each file
+    file_chunks : list
+        The chunks of the dataset in each file
+    dtype : numpy.dtype
+        The data type of the datasets
+    kwargs : dict
+        Options for opening the files: swmr, libver, locking
+    """
+
+    def __init__(
+        self,
+        file_paths: List[Optional[Union[str, Path]]],
+        dataset: Optional[str],
+        file_shapes: List[Tuple[int, ...]],
+        file_chunks: List[Tuple[int, ...]],
+        dtype: numpy.dtype,
+        **kwargs: Any,
+    ) -> None:
+        self._file_paths = list(file_paths)
+        self._dataset = dataset
+        self._file_shapes = [tuple(shp) for shp in file_shapes]
+        self._file_chunks = [tuple(chk) for chk in file_chunks]
+        self._kwargs = kwargs
+        self.dtype = numpy.dtype(dtype)
+        # Offsets of the first row of each file, and the total number of rows
+        self._offsets = numpy.cumsum([0] + [shp[0] for shp in self._file_shapes])
+        self.shape = (int(self._offsets[-1]), *self._file_shapes[0][1:])
+
+        # Chunks along the first axis are split per file; chunks in the rest of
+        # the dimensions are the same for each file.
+        dim0_chunks = tuple(
+            size
+            for shp, chk in zip(self._file_shapes, self._file_chunks)
+            for size in split_chunks(shp[0], max(chk[0], MIN_CHUNK_SIZE))
+        )
+        rest_chunks = tuple(
+            split_chunks(shp, min(chk[i + 1] for chk in self._file_chunks))
+            for i, shp in enumerate(self.shape[1:])
+        )
+        self.chunks = (dim0_chunks, *rest_chunks)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(<{len(self._file_paths)} files>, "
+            f"dataset={self._dataset!r}, shape={self.shape}, dtype={self.dtype})"
+        )
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> NDArray[Any]:
+        array = self[...]
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def __getitem__(self, key: Any) -> NDArray[Any]:
+        key_ = key if isinstance(key, tuple) else (key,)
+        if not all(
+            isinstance(i, (int, numpy.integer, builtins.slice)) or i is Ellipsis
+            for i in key_
+        ):
+            # Fancy indexing or new axes: fall back to Dask.
+            return self.to_dask()[key].compute()
+        index = NDSlice(
+            *(int(i) if isinstance(i, numpy.integer) else i for i in key_)
+        ).expand_for_shape(self.shape)
+
+        # Read every dimension in increasing order (as HDF5 requires), and
+        # reverse those selected with a negative step once read.
+        ranges = []
+        for i, n in zip(index, self.shape):
+            if isinstance(i, int):
+                ranges.append(range(i, i + 1))
+            else:
+                rng = range(*i.indices(n))
+                ranges.append(rng[::-1] if rng.step < 0 else rng)
+        rows, *rest = ranges
+        out = numpy.empty(tuple(map(len, ranges)), dtype=self.dtype)
+        if out.size:
+            rest_slice = tuple(
+                builtins.slice(rng.start, rng[-1] + 1, rng.step) for rng in rest
+            )
+            # Position (in rows) of the first selected row of each file
+            positions = numpy.clip(
+                -((rows.start - self._offsets) // rows.step), 0, len(rows)
+            )
+            reads = [
+                (indx, int(positions[indx]), int(positions[indx + 1]))
+                for indx in numpy.flatnonzero(positions[1:] > positions[:-1])
+            ]
+
+            def _read(indx: int, start: int, stop: int) -> None:
+                first = rows[start] - int(self._offsets[indx])
+                last = rows[stop - 1] - int(self._offsets[indx])
+                source = (builtins.slice(first, last + 1, rows.step), *rest_slice)
+                with pooled_h5open(
+                    self._file_paths[indx], self._dataset, **self._kwargs
+                ) as ds:
+                    ds.read_direct(out, source, numpy.s_[start:stop])
+
+            get_io_executor().map(lambda read: _read(*read), reads)
+
+        # Reverse the dimensions selected with negative steps, and drop those
+        # selected with integers.
+        return out[
+            tuple(
+                0
+                if isinstance(i, int)
+                else builtins.slice(None, None, -1 if i.indices(n)[2] < 0 else None)
+                for i, n in zip(index, self.shape)
+            )
+        ]
+
+    def to_dask(self) -> dask.array.Array:
+        "Build a Dask array with one task per chunk, reading from the files on compute"
+        dataset, kwargs = self._dataset, self._kwargs
+
+        def _read_hdf5_array(
+            fpath: Union[str, Path], slice: tuple[builtins.slice, ...]
+        ) -> NDArray:
+            with pooled_h5open(fpath, dataset, **kwargs) as ds:
+                return ds[slice]
+
+        dim0_chunks, *rest_chunks = self.chunks
+        # Prepare slice tuples and indices for the rightmost dimensions (same for each file)
+        key_rest: Tuple[Tuple[int, ...], ...]
+        slc_rest: Tuple[Tuple[builtins.slice, ...], ...]
+        if not rest_chunks or (max(len(dim) for dim in rest_chunks) == 1):
+            # All dimensions have only one chunk per each: use full slices
+            key_rest = (tuple(0 for _ in rest_chunks),)
+            slc_rest = (tuple(builtins.slice(None) for _ in rest_chunks),)
+        else:
+            # Multiple chunks in at least one of the dimensions:
+            # build full product of indices and corresponding slices
+            key_rest = tuple(
+                itertools.product(*(range(len(dim)) for dim in rest_chunks))
+            )
+            rest_bounds = tuple(
+                numpy.cumsum((0,) + dim).tolist() for dim in rest_chunks
+            )
+            rest_starts = itertools.product(*(bounds[:-1] for bounds in rest_bounds))
+            rest_stops = itertools.product(*(bounds[1:] for bounds in rest_bounds))
+            slc_rest = tuple(
+                tuple(
+                    builtins.slice(start, stop)
+                    for start, stop in zip(dim_starts, dim_stops)
+                )
+                for dim_starts, dim_stops in zip(rest_starts, rest_stops)
+            )
+
+        # Define the Dask tasks for loading each chunk from the files
+        name = "hdf5-stack-" + str(hash(tuple([dataset, *self._file_paths])))
+        dsk = {}  # mapping of (name: task + args) for delayed read task
+        dim0_chunk_idx = 0  # global chunk index along the leftmost dimension
+        for fpath, shp, chk in zip(
+            self._file_paths, self._file_shapes, self._file_chunks
+        ):
+            # Main loop over the chunks for the leftmost dimension for each file
+            dim0_start = 0
+            for dim0_chunk_size in split_chunks(shp[0], max(chk[0], MIN_CHUNK_SIZE)):
+                dim0_stop = dim0_start + dim0_chunk_size
+                slc = (builtins.slice(dim0_start, dim0_stop),)
+                key = (name, dim0_chunk_idx)
+
+                # Inner loop over the rest of dimensions
+                for kr, sr in zip(key_rest, slc_rest):
+                    dsk[key + kr] = (_read_hdf5_array, fpath, slc + sr)
+
+                dim0_start = dim0_stop
+                dim0_chunk_idx += 1
+
+        # Build the high-level graph and the resulting Dask array
+        hlg = HighLevelGraph.from_collections(name, dsk, dependencies=[])
+        return dask.array.Array(hlg, name, chunks=self.chunks, dtype=self.dtype)
+
+
+class HDF5ChunkReader:
+    """Read the blocks of an array that line up with chunks of the HDF5 datasets, as stored
+
+    The array is the concatenation of a dataset along the first axis of one or more files.
+    A block that covers exactly one chunk of the dataset in one file (or its part inside the
+    dataset, at the edges) can be read with `read_direct_chunk`, skipping the HDF5 filter pipeline.
+
+    Parameters
+    ----------
+    file_paths : list
+        The paths of the files; entries for files that are never read may be None
+    dataset : str
+        The dataset to read from the files
+    file_shapes : list, optional
+        The shape of the dataset in each file; read from the files when first needed, if not given
+    file_chunks : list, optional
+        The chunks of the dataset in each file; read from the files when first needed, if not given
+    kwargs : dict
+        Options for opening the files: swmr, libver, locking
+    """
+
+    def __init__(
+        self,
+        file_paths: List[Optional[Union[str, Path]]],
+        dataset: Optional[str] = None,
+        file_shapes: Optional[List[Tuple[int, ...]]] = None,
+        file_chunks: Optional[List[Tuple[int, ...]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._file_paths = file_paths
+        self._dataset = dataset
+        self._geometry = None
+        if file_shapes is not None and file_chunks is not None:
+            self._geometry = (list(file_shapes), list(file_chunks))
+        self._kwargs = kwargs
+
+    def _get_geometry(self) -> Tuple[List[Tuple[int, ...]], List[Tuple[int, ...]]]:
+        if self._geometry is None:
+            file_shapes, file_chunks = [], []
+            for fpath in self._file_paths:
+                with pooled_h5open(fpath, self._dataset, **self._kwargs) as ds:
+                    file_shapes.append(ds.shape)
+                    file_chunks.append(ds.chunks or ds.shape)
+            self._geometry = (file_shapes, file_chunks)
+        return self._geometry
+
+    def locate(
+        self, chunks: Tuple[Tuple[int, ...], ...], block: NDBlock
+    ) -> Optional[Tuple[int, Tuple[int, ...], Tuple[int, ...]]]:
+        """Find the file, and the offset of the HDF5 chunk in it, that a block lines up with
+
+        Returns (file index, chunk offset, block shape), or None if the block is not aligned.
+        """
+        file_shapes, file_chunks = self._get_geometry()
+        if not chunks or any(not shp for shp in file_shapes):
+            return None
+        rest_shape = file_shapes[0][1:]
+        if any(shp[1:] != rest_shape for shp in file_shapes) or (
+            sum(shp[0] for shp in file_shapes),
+            *rest_shape,
+        ) != tuple(map(sum, chunks)):
+            # The array is reshaped from the concatenated datasets.
+            return None
+        slice_ = block.slice_from_chunks(chunks)
+        bounds = numpy.cumsum([0] + [shp[0] for shp in file_shapes])
+        indx = int(numpy.searchsorted(bounds, slice_[0].start, side="right")) - 1
+        if slice_[0].stop > bounds[indx + 1]:
+            return None
+        starts = (slice_[0].start - int(bounds[indx]), *(s.start for s in slice_[1:]))
+        shape = tuple(s.stop - s.start for s in slice_)
+        for start, size, dim, chunk in zip(
+            starts, shape, file_shapes[indx], file_chunks[indx]
+        ):
+            if start % chunk or size != min(chunk, dim - start):
+                return None
+        return indx, starts, shape
+
+    def read(
+        self,
+        chunks: Tuple[Tuple[int, ...], ...],
+        block: NDBlock,
+        filters: Optional[Container[int]] = None,
+    ) -> Optional[StoredChunk]:
+        """Read a block as stored in the file, if it lines up with one HDF5 chunk
+
+        Returns None if it does not, if the dataset is not chunked or the chunk was never written,
+        or if `filters` is given and the filter pipeline uses any filter not in it.
+        """
+        location = self.locate(chunks, block)
+        if location is None:
+            return None
+        indx, offset, shape = location
+        with pooled_h5open(self._file_paths[indx], self._dataset, **self._kwargs) as ds:
+            if ds.chunks is None or ds.dtype.kind == "O":
+                return None
+            dcpl = ds.id.get_create_plist()
+            pipeline = tuple(
+                (code, tuple(values))
+                for code, _, values, _ in (
+                    dcpl.get_filter(i) for i in range(dcpl.get_nfilters())
+                )
+            )
+            if filters is not None and any(code not in filters for code, _ in pipeline):
+                return None
+            try:
+                filter_mask, data = ds.id.read_direct_chunk(offset)
+            except (OSError, KeyError, ValueError):
+                return None
+            return StoredChunk(
+                data=data,
+                filters=pipeline,
+                filter_mask=filter_mask,
+                chunk_shape=ds.chunks,
+                shape=shape,
+                dtype=ds.dtype,
+            )
 
 
 class HDF5ArrayAdapter(ArrayAdapter):
@@ -136,19 +554,69 @@ class HDF5ArrayAdapter(ArrayAdapter):
 
     This adapter lazily loads array data from HDF5 files using Dask. Supports reading from datasets spanning
     multiple files.
+
+    If the shapes and chunks of the datasets in each file are recorded in the data source properties
+    (as "file_shapes" and "file_chunks"; see `infer_properties`), no file is opened until it is read,
+    and the catalog resolves only the files that a read touches.
     """
 
+    supports_lazy_assets = True
+
+    def __init__(
+        self,
+        array: NDArray[Any],
+        structure: ArrayStructure,
+        *,
+        metadata: Optional[JSON] = None,
+        specs: Optional[List[Spec]] = None,
+        chunk_reader: Optional[HDF5ChunkReader] = None,
+    ) -> None:
+        super().__init__(array, structure, metadata=metadata, specs=specs)
+        self._chunk_reader = chunk_reader
+
+    def read_stored_block(self, block: NDBlock) -> Optional[StoredChunk]:
+        """Read a block as stored in the file (e.g. compressed), bypassing the HDF5 filter pipeline
+
+        Returns None unless the block lines up exactly with one chunk of the dataset in one file.
+        """
+        if self._chunk_reader is None:
+            return None
+        return self._chunk_reader.read(self._structure.chunks, block)
+
+    def read(self, slice: NDSlice = NDSlice(...)) -> NDArray[Any]:
+        if isinstance(self._array, HDF5ConcatenatedArray):
+            return self._array[tuple(slice) if slice else ...]
+        return super().read(slice)
+
+    def read_block(self, block: NDBlock, slice: NDSlice = NDSlice(...)) -> NDArray[Any]:
+        # Decode aligned chunks with a multithreaded codec, if one applies,
+        # rather than through the HDF5 filter pipeline.
+        if self._chunk_reader is not None:
+            stored = self._chunk_reader.read(
+                self._structure.chunks, block, filters=MULTITHREADED_FILTERS
+            )
+            if stored is not None:
+                array = stored.decode()
+                return array[slice] if slice else array
+        return super().read_block(block, slice)
+
     @staticmethod
     def lazy_load_hdf5_array(
-        *file_paths: Union[str, Path],
+        *file_paths: Optional[Union[str, Path]],
         dataset: Optional[str] = None,
         swmr: bool = SWMR_DEFAULT,
         libver: str = "latest",
         locking: Optional[Union[bool, str]] = None,
-    ) -> dask.array.Array:
+        file_shapes: Optional[List[Tuple[int, ...]]] = None,
+        file_chunks: Optional[List[Tuple[int, ...]]] = None,
+        dtype: Optional[numpy.dtype] = None,
+        use_dask: bool = USE_DASK,
+    ) -> Union[HDF5ConcatenatedArray, dask.array.Array]:
         """Lazily load arrays from possibly multiple HDF5 files and concatenate them along the first axis
 
-        The chunks of the resulting Dask array are determined by the chunks of the constituent arrays.
+        The chunks of the resulting array are determined by the chunks of the constituent arrays.
+        It is an HDF5ConcatenatedArray, which reads the files directly when indexed, or a Dask
+        array if `use_dask` is set (or for scalars, empty arrays and object dtypes).
 
         Parameters
         ----------
@@ -162,13 +630,25 @@ class HDF5ArrayAdapter(ArrayAdapter):
             The HDF5 library version to use
         locking : bool
             Whether to use file locking when accessing the files
+        file_shapes : list, optional
+            The shape of the dataset in each file, if known in advance
+        file_chunks : list, optional
+            The chunks of the dataset in each file, if known in advance
+        dtype : numpy.dtype, optional
+            The data type of the datasets, if known in advance
+        use_dask : bool, optional
+            Whether to build a Dask array, with one task per chunk; defaults to the
+            TILED_HDF5_USE_DASK environment variable
+
+        If all of `file_shapes`, `file_chunks` and `dtype` are given, no file is opened
+        until its data are read, and entries of `file_paths` that are never read may be None.
         """
 
         # Define helper functions for reading and getting specs of HDF5 arrays
         def _read_hdf5_array(
             fpath: Union[str, Path], slice: tuple[builtins.slice, ...]
         ) -> NDArray:
-            with h5open(
+            with pooled_h5open(
                 fpath, dataset, swmr=swmr, libver=libver, locking=locking
             ) as ds:
                 return ds[slice]
@@ -176,14 +656,20 @@ class HDF5ArrayAdapter(ArrayAdapter):
         def _get_hdf5_specs(
             fpath: Union[str, Path]
         ) -> Tuple[Tuple[int, ...], Tuple[int, ...], numpy.dtype]:
-            with h5open(
+            with pooled_h5open(
                 fpath, dataset, swmr=swmr, libver=libver, locking=locking
             ) as ds:
                 result = ds.shape, ds.chunks or ds.shape, ds.dtype
             return result
 
         # Need to know shapes/dtypes of constituent arrays to load them lazily
-        shapes_chunks_dtypes = [_get_hdf5_specs(fpath) for fpath in file_paths]
+        if file_shapes is not None and file_chunks is not None and dtype is not None:
+            shapes_chunks_dtypes = [
+                (tuple(shp), tuple(chk), dtype)
+                for shp, chk in zip(file_shapes, file_chunks)
+            ]
+        else:
+            shapes_chunks_dtypes = [_get_hdf5_specs(fpath) for fpath in file_paths]
         dtype = shapes_chunks_dtypes[0][2]
         if dtype == numpy.dtype("O"):
             # h5py uses NumPy's object dtype to represent variable-length
@@ -211,7 +697,7 @@ class HDF5ArrayAdapter(ArrayAdapter):
             is_vlen_string = h5py.check_string_dtype(dtype) is not None
 
             def _read_as_bytes(fpath: Union[str, Path]) -> NDArray:
-                with h5open(
+                with pooled_h5open(
                     fpath, dataset, swmr=swmr, libver=libver, locking=locking
                 ) as ds:
                     if is_vlen_string:
@@ -238,75 +724,130 @@ class HDF5ArrayAdapter(ArrayAdapter):
             array = dask.array.stack([_read_hdf5_array(fp, ()) for fp in file_paths])
 
         else:
-            # Use delayed loading to read and conactenate arrays from multiple files
-            # First, find chunks along the left axis (split per file),
-            # and chunks in the rest of the dimensions (same for each file)
-            file_chunks = tuple(
-                split_chunks(shp[0], max(chk[0], MIN_CHUNK_SIZE))
-                for shp, chk, _ in shapes_chunks_dtypes
-            )
-            # Shape of the rest of dimensions
-            rest_shape = shapes_chunks_dtypes[0][0][1:]
-            rest_chunks = tuple(
-                split_chunks(shp, min(chk[i + 1] for _, chk, _ in shapes_chunks_dtypes))
-                for i, shp in enumerate(rest_shape)
+            array = HDF5ConcatenatedArray(
+                list(file_paths),
+                dataset,
+                [shp for shp, _, _ in shapes_chunks_dtypes],
+                [chk for _, chk, _ in shapes_chunks_dtypes],
+                dtype,
+                swmr=swmr,
+                libver=libver,
+                locking=locking,
             )
-            dim0_chunks = tuple(size for fc in file_chunks for size in fc)
-            chunks_final = (dim0_chunks, *[tuple(d) for d in rest_chunks])
-
-            # Prepare slice tuples and indices for the rightmost dimensions (same for each file)
-            key_rest: Tuple[Tuple[int, ...], ...]
-            slc_rest: Tuple[Tuple[builtins.slice, ...], ...]
-            if not rest_chunks or (max(len(dim) for dim in rest_chunks) == 1):
-                # All dimensions have only one chunk per each: use full slices
-                key_rest = (tuple(0 for _ in rest_chunks),)
-                slc_rest = (tuple(builtins.slice(None) for _ in rest_chunks),)
-            else:
-                # Multiple chunks in at least one of the dimensions:
-                # build full product of indices and corresponding slices
-                key_rest = tuple(
-                    itertools.product(*(range(len(dim)) for dim in rest_chunks))
-                )
-                rest_bounds = tuple(
-                    numpy.cumsum((0,) + dim).tolist() for dim in rest_chunks
-                )
-                rest_starts = itertools.product(
-                    *(bounds[:-1] for bounds in rest_bounds)
-                )
-                rest_stops = itertools.product(*(bounds[1:] for bounds in rest_bounds))
-                slc_rest = tuple(
-                    tuple(
-                        builtins.slice(start, stop)
-                        for start, stop in zip(dim_starts, dim_stops)
-                    )
-                    for dim_starts, dim_stops in zip(rest_starts, rest_stops)
-                )
-
-            # Define the Dask tasks for loading each chunk from the files
-            name = "hdf5-stack-" + str(hash(tuple([dataset, *file_paths])))
-            dsk = {}  # mapping of (name: task + args) for delayed read task
-            dim0_chunk_idx = 0  # global chunk index along the leftmost dimension
-            for fpath, dim0_chunks in zip(file_paths, file_chunks):
-                # Main loop over the chunks for the leftmost dimension for each file
-                dim0_start = 0
-                for dim0_chunk_size in dim0_chunks:
-                    dim0_stop = dim0_start + dim0_chunk_size
-                    slc = (builtins.slice(dim0_start, dim0_stop),)
-                    key = (name, dim0_chunk_idx)
-
-                    # Inner loop over the rest of dimensions
-                    for kr, sr in zip(key_rest, slc_rest):
-                        dsk[key + kr] = (_read_hdf5_array, fpath, slc + sr)
-
-                    dim0_start = dim0_stop
-                    dim0_chunk_idx += 1
-
-            # Build the high-level graph and the resulting Dask array
-            hlg = HighLevelGraph.from_collections(name, dsk, dependencies=[])
-            array = dask.array.Array(hlg, name, chunks=chunks_final, dtype=dtype)
+            if use_dask:
+                array = array.to_dask()
 
         return array
 
+    @staticmethod
+    def _recorded_geometry(
+        shape: Tuple[int, ...], properties: JSON, parameters: JSON
+    ) -> Optional[Tuple[List[Tuple[int, ...]], List[Tuple[int, ...]]]]:
+        """Get the per-file shapes and chunks recorded in the data source properties
+
+        Returns None if they are not recorded, or cannot be used to describe the array without
+        opening the files: if the array is sliced or squeezed after loading, if the datasets are
+        empty or scalars, or if the recorded shapes do not add up to the (possibly updated) shape.
+        """
+        if parameters.get("slice") or parameters.get("squeeze"):
+            return None
+        file_shapes = properties.get("file_shapes")
+        file_chunks = properties.get("file_chunks")
+        if not file_shapes or not file_chunks or len(file_shapes) != len(file_chunks):
+            return None
+        file_shapes = [tuple(shp) for shp in file_shapes]
+        file_chunks = [tuple(chk) for chk in file_chunks]
+        rest_shape = file_shapes[0][1:]
+        if any((not shp) or (0 in shp) or shp[1:] != rest_shape for shp in file_shapes):
+            return None
+        if (sum(shp[0] for shp in file_shapes), *rest_shape) != tuple(shape):
+            return None
+        return file_shapes, file_chunks
+
+    @classmethod
+    def file_indices_for_slice(
+        cls,
+        structure: ArrayStructure,
+        n_files: int,
+        slice: Any = ...,
+        properties: Optional[JSON] = None,
+        parameters: Optional[JSON] = None,
+    ) -> Optional[Tuple[int, ...]]:
+        """Return the indices of the files needed to satisfy `slice`
+
+        The files are concatenated along the first axis, so the touched files are found from
+        the recorded number of rows in each file. Returns None (every file may need to be
+        opened) if the per-file geometry is not recorded in the data source `properties`.
+        """
+        geometry = cls._recorded_geometry(
+            structure.shape, properties or {}, parameters or {}
+        )
+        if geometry is None or len(geometry[0]) != n_files:
+            return None
+        bounds = numpy.cumsum([shp[0] for shp in geometry[0]])
+        index = NDSlice(slice).expand_for_shape(tuple(structure.shape))[0]
+        if isinstance(index, builtins.slice):
+            rows = numpy.arange(*index.indices(int(bounds[-1])))
+        else:
+            rows = numpy.array([index])
+        return tuple(
+            numpy.unique(numpy.searchsorted(bounds, rows, side="right")).tolist()
+        )
+
+    @classmethod
+    def infer_properties(cls, data_source: DataSource[ArrayStructure]) -> JSON:
+        """Record the shape and chunks of the dataset in each file of a data source
+
+        The catalog calls this when an external data source is registered, so that the files
+        do not need to be opened just to describe the array whenever it is read. Returns an
+        empty dict if the data source does not span multiple files, if the geometry is already
+        recorded, or if the files cannot be read.
+        """
+        structure = data_source.structure
+        if isinstance(structure, dict):
+            structure = ArrayStructure.from_json(structure)
+        parameters = data_source.parameters or {}
+        if (
+            structure is None
+            or parameters.get("slice")
+            or parameters.get("squeeze")
+            or cls._recorded_geometry(
+                structure.shape, data_source.properties or {}, parameters
+            )
+        ):
+            return {}
+        data_uris = [
+            ast.data_uri
+            for ast in sorted(data_source.assets, key=lambda ast: ast.num or 0)
+            if ast.parameter == "data_uris"
+        ]
+        if len(data_uris) < 2:
+            return {}
+        dataset = parameters.get("dataset")
+        if dataset is not None and not isinstance(dataset, str):
+            dataset = "/".join(dataset)
+        dtype = structure.data_type.to_numpy_dtype()
+        file_shapes, file_chunks = [], []
+        try:
+            for uri in data_uris:
+                with h5open(
+                    path_from_uri(uri),
+                    dataset,
+                    swmr=parameters.get("swmr", SWMR_DEFAULT),
+                    libver=parameters.get("libver", "latest"),
+                    locking=parameters.get("locking"),
+                ) as ds:
+                    if not isinstance(ds, h5py.Dataset) or ds.dtype != dtype:
+                        return {}
+                    file_shapes.append(list(ds.shape))
+                    file_chunks.append(list(ds.chunks or ds.shape))
+        except (OSError, KeyError, ValueError, BrokenLink):
+            return {}
+        properties = {"file_shapes": file_shapes, "file_chunks": file_chunks}
+        if cls._recorded_geometry(structure.shape, properties, parameters) is None:
+            return {}
+        return properties
+
     @classmethod
     def from_catalog(
         cls,
@@ -319,17 +860,42 @@ class HDF5ArrayAdapter(ArrayAdapter):
         swmr: bool = SWMR_DEFAULT,
         libver: str = "latest",
         locking: Optional[Union[bool, str]] = None,
+        data_uris: Optional[List[Optional[str]]] = None,
     ) -> "HDF5ArrayAdapter":
         structure = data_source.structure
-        assets = data_source.assets
-        data_uris = [
-            ast.data_uri for ast in assets if ast.parameter == "data_uris"
-        ] or [assets[0].data_uri]
-        file_paths = [path_from_uri(uri) for uri in data_uris]
+        if data_uris is None:
+            assets = data_source.assets
+            data_uris = [
+                ast.data_uri for ast in assets if ast.parameter == "data_uris"
+            ] or [assets[0].data_uri]
+        # The catalog may pass only the URIs of the files that a read touches (the rest None).
+        file_paths = [None if uri is None else path_from_uri(uri) for uri in data_uris]
+
+        geometry = cls._recorded_geometry(
+            structure.shape,
+            data_source.properties or {},
+            {"slice": slice, "squeeze": squeeze},
+        )
+        file_shapes, file_chunks, dtype = None, None, None
+        if geometry is not None and len(geometry[0]) == len(file_paths):
+            file_shapes, file_chunks = geometry
+            dtype = structure.data_type.to_numpy_dtype()
 
         array = cls.lazy_load_hdf5_array(
-            *file_paths, dataset=dataset, swmr=swmr, libver=libver, locking=locking
+            *file_paths,
+            dataset=dataset,
+            swmr=swmr,
+            libver=libver,
+            locking=locking,
+            file_shapes=file_shapes,
+            file_chunks=file_chunks,
+            dtype=dtype,
         )
+        if isinstance(array, HDF5ConcatenatedArray) and (
+            slice or squeeze or array.shape != tuple(structure.shape)
+        ):
+            # Slicing, squeezing and reshaping the array lazily require Dask.
+            array = array.to_dask()
 
         if slice:
             if isinstance(slice, str):
@@ -347,11 +913,27 @@ class HDF5ArrayAdapter(ArrayAdapter):
         # TODO: Possibly rechunk according to structure.chunks? Is it expensive/necessary?
         # array = dask.array.rechunk(array, chunks=structure.chunks)
 
+        chunk_reader = None
+        if not (slice or squeeze):
+            chunk_reader = HDF5ChunkReader(
+                file_paths,
+                dataset,
+                file_shapes=file_shapes,
+                file_chunks=file_chunks,
+                swmr=swmr,
+                libver=libver,
+                locking=locking,
+            )
+
         # Pull additional metadata from the file attributes
         metadata = copy.deepcopy(node.metadata_)
         metadata.update(
             get_hdf5_attrs(
-                data_uris[0], dataset, swmr=swmr, libver=libver, locking=locking
+                next(uri for uri in data_uris if uri is not None),
+                dataset,
+                swmr=swmr,
+                libver=libver,
+                locking=locking,
             )
         )
 
@@ -360,6 +942,7 @@ class HDF5ArrayAdapter(ArrayAdapter):
             structure,
             metadata=metadata,
             specs=node.specs,
+            chunk_reader=chunk_reader,
         )
 
     @classmethod
@@ -378,6 +961,9 @@ class HDF5ArrayAdapter(ArrayAdapter):
         array = cls.lazy_load_hdf5_array(
             *file_paths, dataset=dataset, swmr=swmr, libver=libver, locking=locking
         )
+        if isinstance(array, HDF5ConcatenatedArray) and (slice or squeeze):
+            # Slicing and squeezing the array lazily require Dask.
+            array = array.to_dask()
 
         # Apply slice and squeeze operations, if specified
         if slice:
@@ -393,7 +979,13 @@ class HDF5ArrayAdapter(ArrayAdapter):
             data_uris[0], dataset, swmr=swmr, libver=libver, locking=locking
         )
 
-        return cls(array, structure, metadata=metadata)
+        chunk_reader = None
+        if not (slice or squeeze):
+            chunk_reader = HDF5ChunkReader(
+                file_paths, dataset, swmr=swmr, libver=libver, locking=locking
+            )
+
+        return cls(array, structure, metadata=metadata, chunk_reader=chunk_reader)
 
 
 class HDF5Adapter(
@@ -432,6 +1024,8 @@ class HDF5Adapter(
 
     """
 
+    supports_lazy_assets = True
+
     def __init__(
         self,
         tree: Union[dict[str, Any], Sentinel],
@@ -494,7 +1088,7 @@ class HDF5Adapter(
             ast.data_uri for ast in assets if ast.parameter == "data_uris"
         ] or [assets[0].data_uri]
         file_path = path_from_uri(data_uris[0])
-        with h5open(
+        with pooled_h5open(
             file_path, dataset, swmr=swmr, libver=libver, locking=locking
         ) as file:
             tree = parse_hdf5_tree(file)
@@ -516,6 +1110,30 @@ class HDF5Adapter(
             locking=locking,
         )
 
+    @classmethod
+    def file_indices_for_slice(
+        cls,
+        structure: Optional[ArrayStructure],
+        n_files: int,
+        slice: Any = ...,
+        properties: Optional[JSON] = None,
+        parameters: Optional[JSON] = None,
+    ) -> Optional[Tuple[int, ...]]:
+        # Only arrays spanning multiple files can be read lazily; see HDF5ArrayAdapter.
+        if not isinstance(structure, ArrayStructure):
+            return None
+        return HDF5ArrayAdapter.file_indices_for_slice(
+            structure, n_files, slice, properties=properties, parameters=parameters
+        )
+
+    @classmethod
+    def infer_properties(
+        cls, data_source: DataSource[Union[ArrayStructure, None]]
+    ) -> JSON:
+        if data_source.structure_family != StructureFamily.array:
+            return {}
+        return HDF5ArrayAdapter.infer_properties(data_source)  # type: ignore
+
     @classmethod
     def from_uris(
         cls,
@@ -527,7 +1145,9 @@ class HDF5Adapter(
         **kwargs: Any,  # Optional kwargs for HDF5ArrayAdapter
     ) -> Union["HDF5Adapter", HDF5ArrayAdapter]:
         fpath = path_from_uri(data_uris[0])
-        with h5open(fpath, dataset, swmr=swmr, libver=libver, locking=locking) as file:
+        with pooled_h5open(
+            fpath, dataset, swmr=swmr, libver=libver, locking=locking
+        ) as file:
             tree = parse_hdf5_tree(file)
 
         if tree == HDF5_DATASET:
@@ -548,7 +1168,12 @@ class HDF5Adapter(
         return node_repr(self, list(self))
 
     def metadata(self) -> JSON:
-        d = get_hdf5_attrs(self.uris[0], self.dataset)
+        # Open the file with the same flags as for reading, so that the pooled
+        # handle is not reopened.
+        options = {
+            k: v for k, v in self._kwargs.items() if k in {"swmr", "libver", "locking"}
+        }
+        d = get_hdf5_attrs(self.uris[0], self.dataset, **options)
         return {**d, **super().metadata()}
 
     def __iter__(self) -> Iterator[Any]:
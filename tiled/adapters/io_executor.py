@@ -0,0 +1,186 @@
+import concurrent.futures
+import os
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+from ..server.metrics import IO_ACTIVE_WORKERS, IO_QUEUE_DEPTH, IO_WAIT_DURATION
+
+# Reads that span many files (e.g. a slice through a stack of TIFF files) are
+# I/O-bound: open + read + decode, releasing the GIL in the C codecs. They run
+# on one process-wide thread pool so that the total number of files read at
+# once stays bounded however many requests are in flight, and no request pays
+# to start up its own pool.
+#
+# - The pool has `max_workers` threads. A worker count somewhat above the CPU
+#   count keeps the storage busy.
+# - Each call to `IOExecutor.map` (one per read) keeps at most `per_request`
+#   tasks in the pool at once, submitting the next as one finishes, so that one
+#   large read does not queue ahead of all the work of concurrent requests.
+#
+# Both can be set in the server configuration (io_workers,
+# io_workers_per_request) or with the environment variables TILED_IO_WORKERS and
+# TILED_IO_WORKERS_PER_REQUEST. TILED_SEQUENCE_IO_WORKERS is still honored.
+DEFAULT_MAX_WORKERS = int(
+    os.getenv("TILED_IO_WORKERS")
+    or os.getenv("TILED_SEQUENCE_IO_WORKERS")
+    or min(32, (os.cpu_count() or 4) + 4)
+)
+DEFAULT_PER_REQUEST = int(
+    os.getenv("TILED_IO_WORKERS_PER_REQUEST") or max(1, DEFAULT_MAX_WORKERS // 2)
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class IOExecutor:
+    """A bounded thread pool, shared by all reads in the process
+
+    Parameters
+    ----------
+    max_workers : int
+        The largest number of tasks running at once, in all requests
+    per_request : int, optional
+        The largest number of tasks in the pool at once for each call to `map`.
+        By default, half of `max_workers`.
+    """
+
+    def __init__(self, max_workers: int, per_request: Optional[int] = None) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, not {max_workers}")
+        self.max_workers = max_workers
+        self.per_request = min(max_workers, per_request or max(1, max_workers // 2))
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Calls to `map` using the pool, and whether to shut it down once
+        # there are none (see `shutdown`)
+        self._running = 0
+        self._retired = False
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(max_workers={self.max_workers}, "
+            f"per_request={self.per_request})"
+        )
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        # Start the threads on first use, not when the server is configured.
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="tiled-io"
+                )
+            return self._executor
+
+    def _submit(
+        self, func: Callable[[T], R], item: T
+    ) -> "concurrent.futures.Future[R]":
+        submitted = time.perf_counter()
+        IO_QUEUE_DEPTH.inc()
+
+        def run() -> R:
+            IO_QUEUE_DEPTH.dec()
+            IO_WAIT_DURATION.observe(time.perf_counter() - submitted)
+            IO_ACTIVE_WORKERS.inc()
+            try:
+                return func(item)
+            finally:
+                IO_ACTIVE_WORKERS.dec()
+
+        return self._get_executor().submit(run)
+
+    def map(
+        self, func: Callable[[T], R], items: Iterable[T], limit: Optional[int] = None
+    ) -> List[R]:
+        """Apply `func` to each item on the pool, and return the results in order
+
+        At most `limit` (by default, `per_request`) items are in the pool at
+        once. A single item, or a limit of 1, is run in the calling thread. If
+        any call raises, the items not yet started are cancelled and the
+        exception is raised.
+        """
+        items = list(items)
+        limit = min(limit or self.per_request, self.per_request, len(items))
+        if limit <= 1:
+            return [func(item) for item in items]
+        results: List[Any] = [None] * len(items)
+        pending = iter(enumerate(items))
+        in_flight = {}
+
+        def submit_next() -> None:
+            for position, item in pending:
+                in_flight[self._submit(func, item)] = position
+                return
+
+        with self._lock:
+            self._running += 1
+        try:
+            for _ in range(limit):
+                submit_next()
+            while in_flight:
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    results[in_flight.pop(future)] = future.result()
+                    submit_next()
+        except BaseException:
+            for future in in_flight:
+                if future.cancel():
+                    IO_QUEUE_DEPTH.dec()
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+                retire = self._retired and not self._running
+            if retire:
+                self.shutdown(wait=False)
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pool
+
+        If `wait` is False, calls to `map` that are running finish first, and
+        then the threads exit without blocking the caller.
+        """
+        with self._lock:
+            if not wait:
+                self._retired = True
+                if self._running:
+                    return
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def default_io_executor() -> IOExecutor:
+    "Create a new instance of the default I/O executor."
+    return IOExecutor(DEFAULT_MAX_WORKERS, DEFAULT_PER_REQUEST)
+
+
+_io_executor: Optional[IOExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> IOExecutor:
+    "Return the I/O executor, a process-global thread pool, creating the default if unset."
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = default_io_executor()
+        return _io_executor
+
+
+def set_io_executor(executor: IOExecutor) -> None:
+    """
+    Set the I/O executor, a process-global thread pool.
+
+    Reads already running on the previous executor finish there, and then its
+    threads exit.
+    """
+    global _io_executor
+    with _io_executor_lock:
+        previous, _io_executor = _io_executor, executor
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
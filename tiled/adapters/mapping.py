@@ -1,6 +1,8 @@
-import copy
+import bisect
 import itertools
+import numbers
 import operator
+import threading
 from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import (
@@ -11,6 +13,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -25,6 +28,8 @@ if TYPE_CHECKING:
 
 from collections.abc import Iterable, Mapping
 
+import numpy
+
 from ..iterviews import ItemsView, KeysView, ValuesView
 from ..queries import (
     Comparison,
@@ -96,6 +101,13 @@ class MapAdapter(Generic[A], ContainerAdapter[A], IndexersMixin):
             sorting = [SortingItem(key="_", direction=SortingDirection.ASCENDING)]
         self._sorting = sorting
         self._must_revalidate = must_revalidate
+        # Indexes of the children's metadata, built on first use by queries.
+        # The results of a query share them, and keep the positions of their
+        # entries in _selection, so that chained queries intersect those.
+        self._index: Optional[_MetadataIndex] = None
+        self._selection: Optional[Set[int]] = None
+        # The order of the entries, as positions in the index, if sorted
+        self._order: Optional[numpy.ndarray] = None
         self.include_routers: List[APIRouter] = []
         self.background_tasks: List[Any] = []
         self.entries_stale_after = entries_stale_after
@@ -129,6 +141,8 @@ class MapAdapter(Generic[A], ContainerAdapter[A], IndexersMixin):
 
         """
         self._must_revalidate = value
+        self._index = None
+        self._selection = None
 
     @property
     def sorting(self) -> List[SortingItem]:
@@ -140,6 +154,11 @@ class MapAdapter(Generic[A], ContainerAdapter[A], IndexersMixin):
         """
         return list(self._sorting)
 
+    def structure(self) -> ContainerStructure:
+        if self._order is not None:
+            return ContainerStructure(keys=list(self))
+        return super().structure()
+
     def __repr__(self) -> str:
         """
 
@@ -171,7 +190,10 @@ class MapAdapter(Generic[A], ContainerAdapter[A], IndexersMixin):
         -------
 
         """
-        yield from self._mapping
+        if self._order is None:
+            yield from self._mapping
+        else:
+            yield from self._keys_slice(0, None, 1)
 
     def __len__(self) -> int:
         """
@@ -295,6 +317,16 @@ class MapAdapter(Generic[A], ContainerAdapter[A], IndexersMixin):
             return self.new_variation(mapping=new_mapping)
         return self
 
+    def _metadata_index(self) -> "_MetadataIndex":
+        "Return the indexes of the children's metadata, (re)building them if needed"
+        index = self._index
+        if index is None or not index.is_current():
+            index = self._index = _MetadataIndex(self._mapping)
+            self._selection = None
+            if self._order is not None:
+                self._order = index.sort_order(self._sorting)
+        return index
+
     def search(self, query: Any) -> Any:
         """
 
@@ -361,28 +393,24 @@ class MapAdapter(Generic[A], ContainerAdapter[A], IndexersMixin):
         -------
 
         """
-        mapping = copy.copy(self._mapping)
-        for key, direction in reversed(sorting):
-            if key == "_":
-                # Special case to enable reversing the given/default ordering.
-                # Leave mapping as is, and possibly reserve it below.
-                pass
-            else:
-                mapping = dict(
-                    sorted(
-                        mapping.items(),
-                        key=lambda item: item[1].metadata().get(key, _HIGH_SORTER),  # type: ignore
-                    )
-                )
-
-            if direction < 0:
-                # TODO In Python 3.8 dict items should be reversible
-                # but I have seen errors in the wild that I could not
-                # quickly resolve so for now we convert to list in the middle.
-                to_reverse = list(mapping.items())
-                mapping = dict(reversed(to_reverse))
-
-        return self.new_variation(mapping=mapping, sorting=sorting)
+        # The sorted order is computed once per sorting (and version of the
+        # mapping), kept as an array of positions, and shared by the sorted
+        # variations, so that each one only looks up the keys on its pages.
+        index = self._metadata_index()
+        if self._order is not None:
+            # Sorting again keeps the current order among ties.
+            order = _sort_positions(index, self._order.tolist(), sorting)
+        elif self._selection is not None:
+            # Sort only the selected entries: the values of the others need
+            # not be comparable with them.
+            order = _sort_positions(index, sorted(self._selection), sorting)
+        else:
+            order = index.sort_order(sorting)
+        result = self.new_variation(sorting=sorting)
+        result._index = index
+        result._selection = self._selection
+        result._order = order
+        return result
 
     # The following two methods are used by keys(), values(), items().
 
@@ -401,20 +429,16 @@ class MapAdapter(Generic[A], ContainerAdapter[A], IndexersMixin):
         -------
 
         """
+        if self._order is not None:
+            keys = self._metadata_index().keys
+            order = self._order if direction > 0 else self._order[::-1]
+            return [keys[position] for position in order[start:stop].tolist()]
         if direction > 0:
             return itertools.islice(self._mapping.keys(), start, stop)
         else:
-            keys_to_slice = list(
-                reversed(
-                    list(
-                        itertools.islice(
-                            self._mapping.keys(), 0, len(self._mapping) - start
-                        )
-                    )
-                )
-            )
-            keys = keys_to_slice[start:stop]
-            return keys
+            keys = list(self._mapping.keys())
+            keys.reverse()
+            return keys[start:stop]
 
     def _items_slice(
         self, start: int, stop: int, direction: int, page_size: Optional[int] = None
@@ -522,6 +546,295 @@ def iter_child_metadata(
             yield key, value, term
 
 
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class _MetadataIndex:
+    """
+    Indexes of the metadata of the children of a mapping, built on first use
+
+    Queries look up the positions (in the mapping's order) of the matching
+    children here, instead of walking the metadata of every child. Each index
+    is built for one metadata key when it is first queried, and kept:
+
+    - the key's value in each child that has it, in order
+    - a hash map from each value to its positions (Eq, NotEq, In, NotIn)
+    - a hash map from each element of list values to positions (Contains)
+    - the numbers and strings in sorted order, with their positions, to
+      bisect (Comparison)
+
+    and, for FullText, a map from each word to the positions of the children
+    whose metadata contains it.
+    """
+
+    def __init__(self, mapping: Mapping[str, Any]) -> None:
+        self.mapping = mapping
+        self.keys = list(mapping)
+        # The children indexed, to notice entries replaced in the mapping
+        self.children = [mapping[key] for key in self.keys]
+        self._lock = threading.RLock()
+        self._terms: Dict[str, List[Tuple[int, Any]]] = {}
+        self._term_at: Dict[str, Dict[int, Any]] = {}
+        self._values: Dict[str, Tuple[Dict[Any, List[int]], List[Tuple[int, Any]]]] = {}
+        self._elements: Dict[
+            str, Tuple[Dict[Any, List[int]], List[Tuple[int, Any]]]
+        ] = {}
+        self._sorted: Dict[str, Dict[str, Tuple[List[Any], List[int]]]] = {}
+        self._words: Optional[Dict[str, List[int]]] = None
+        self._sort_values: Dict[str, List[Any]] = {}
+        self._sort_orders: Dict[Tuple[Tuple[str, int], ...], numpy.ndarray] = {}
+
+    def is_current(self) -> bool:
+        # Entries added to, removed from, or replaced in the mapping in place
+        # are noticed. (Changes made to the metadata of a child that is still
+        # the same object are not.)
+        if len(self.mapping) != len(self.keys):
+            return False
+        return all(
+            key == indexed_key and child is indexed_child
+            for (key, child), indexed_key, indexed_child in zip(
+                self.mapping.items(), self.keys, self.children
+            )
+        )
+
+    def _cached(self, cache: Dict[str, Any], key: str, build: Any) -> Any:
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in cache:
+                cache[key] = build(key)
+            return cache[key]
+
+    def terms(self, key: str) -> List[Tuple[int, Any]]:
+        "(position, value) of each child whose metadata has this (dotted) key"
+        return self._cached(self._terms, key, self._build_terms)
+
+    def _build_terms(self, key: str) -> List[Tuple[int, Any]]:
+        subkeys = key.split(".")
+        terms = []
+        for position, child in enumerate(self.children):
+            term = child.metadata()
+            for subkey in subkeys:
+                if subkey not in term:
+                    break
+                term = term[subkey]
+            else:
+                terms.append((position, term))
+        return terms
+
+    def _build_values(
+        self, key: str
+    ) -> Tuple[Dict[Any, List[int]], List[Tuple[int, Any]]]:
+        by_value: Dict[Any, List[int]] = {}
+        unhashable = []
+        for position, term in self.terms(key):
+            if _hashable(term):
+                by_value.setdefault(term, []).append(position)
+            else:
+                unhashable.append((position, term))
+        return by_value, unhashable
+
+    def _build_elements(
+        self, key: str
+    ) -> Tuple[Dict[Any, List[int]], List[Tuple[int, Any]]]:
+        by_element: Dict[Any, List[int]] = {}
+        others = []
+        for position, term in self.terms(key):
+            if isinstance(term, (list, tuple, set, frozenset, dict)) and all(
+                _hashable(element) for element in term
+            ):
+                for element in set(term):
+                    by_element.setdefault(element, []).append(position)
+            else:
+                others.append((position, term))
+        return by_element, others
+
+    def _build_sorted(self, key: str) -> Dict[str, Tuple[List[Any], List[int]]]:
+        groups: Dict[str, List[Tuple[Any, int]]] = {
+            "number": [],
+            "str": [],
+            "other": [],
+        }
+        for position, term in self.terms(key):
+            group = _comparison_group(term)
+            if group == "number" and term != term:
+                # NaN compares False with everything, so never matches.
+                continue
+            groups[group].append((term, position))
+        result = {}
+        for group, items in groups.items():
+            if group != "other":
+                items.sort(key=operator.itemgetter(0))
+            result[group] = ([term for term, _ in items], [p for _, p in items])
+        return result
+
+    def eq(self, key: str, value: Any) -> List[int]:
+        "Positions of the children whose value for this key equals the given value"
+        if not _hashable(value):
+            return [position for position, term in self.terms(key) if term == value]
+        by_value, unhashable = self._cached(self._values, key, self._build_values)
+        positions = by_value.get(value, [])
+        if unhashable:
+            positions = sorted(
+                positions + [position for position, term in unhashable if term == value]
+            )
+        return positions
+
+    def contains(self, key: str, value: Any) -> List[int]:
+        "Positions of the children whose value for this key is a list containing value"
+        by_element, others = self._cached(self._elements, key, self._build_elements)
+        positions = by_element.get(value, []) if _hashable(value) else []
+        extra = [
+            position
+            for position, term in others
+            if isinstance(term, Iterable)
+            and (not isinstance(term, str))
+            and (value in term)
+        ]
+        return sorted(positions + extra) if extra else positions
+
+    def compare(
+        self, key: str, op: str, value: Any, selection: Optional[Set[int]] = None
+    ) -> List[int]:
+        """Positions of the children whose value for this key compares so to value
+
+        If a selection is given (the positions of a query's results), only
+        the values of those children are compared.
+        """
+        comparison_func = getattr(operator, op)
+        groups = self._cached(self._sorted, key, self._build_sorted)
+        group = _comparison_group(value)
+        if selection is None:
+            terms: Iterable[Tuple[int, Any]] = self.terms(key)
+            mixed = any(
+                group_terms
+                for other, (group_terms, _) in groups.items()
+                if other != group
+            )
+        else:
+            term_at = self._cached(
+                self._term_at, key, lambda key: dict(self.terms(key))
+            )
+            terms = [
+                (position, term_at[position])
+                for position in selection
+                if position in term_at
+            ]
+            mixed = any(_comparison_group(term) != group for _, term in terms)
+        if group == "other" or mixed:
+            # Some values are not of the same kind, so compare one by one
+            # (which may raise TypeError, as comparing them would).
+            return sorted(
+                position for position, term in terms if comparison_func(term, value)
+            )
+        if value != value:
+            return []
+        terms, positions = groups[group]
+        if op == "lt":
+            selected = positions[: bisect.bisect_left(terms, value)]
+        elif op == "le":
+            selected = positions[: bisect.bisect_right(terms, value)]
+        elif op == "gt":
+            selected = positions[bisect.bisect_right(terms, value) :]  # noqa: E203
+        else:
+            selected = positions[bisect.bisect_left(terms, value) :]  # noqa: E203
+        return sorted(selected)
+
+    def sort_values(self, key: str) -> List[Any]:
+        "The value of this (top-level) key in each child, to sort by"
+        return self._cached(
+            self._sort_values,
+            key,
+            lambda key: [
+                child.metadata().get(key, _HIGH_SORTER) for child in self.children
+            ],
+        )
+
+    def sort_order(self, sorting: Any) -> numpy.ndarray:
+        "Positions of all the children, in sorted order"
+        spec = tuple((key, int(direction)) for key, direction in sorting)
+        try:
+            return self._sort_orders[spec]
+        except KeyError:
+            pass
+        order = _sort_positions(self, list(range(len(self.keys))), spec)
+        # Sorted views share this array, so it must not be modified.
+        order.flags.writeable = False
+        with self._lock:
+            return self._sort_orders.setdefault(spec, order)
+
+    def words(self) -> Dict[str, List[int]]:
+        "Positions of the children whose metadata contains each word"
+        if self._words is None:
+            with self._lock:
+                if self._words is None:
+                    words: Dict[str, List[int]] = {}
+                    for position, child in enumerate(self.children):
+                        for word in set(
+                            word
+                            for s in walk_string_values(child.metadata())
+                            for word in s.lower().split()
+                        ):
+                            words.setdefault(word, []).append(position)
+                    self._words = words
+        return self._words
+
+
+def _comparison_group(value: Any) -> str:
+    if isinstance(value, numbers.Real):
+        return "number"
+    if isinstance(value, str):
+        return "str"
+    return "other"
+
+
+def _sort_positions(
+    index: _MetadataIndex, positions: List[int], sorting: Any
+) -> numpy.ndarray:
+    "Sort positions in the index by the given sorting, stably"
+    for key, direction in reversed(sorting):
+        if key != "_":
+            # "_" means the given ordering, which may be reversed below.
+            positions.sort(key=index.sort_values(key).__getitem__)
+        if direction < 0:
+            positions.reverse()
+    return numpy.asarray(positions, dtype=numpy.intp)
+
+
+def _restrict(order: numpy.ndarray, selection: Set[int], size: int) -> numpy.ndarray:
+    "Return the positions in order that are in the selection, in the same order"
+    selected = numpy.zeros(size, dtype=bool)
+    selected[numpy.fromiter(selection, dtype=numpy.intp, count=len(selection))] = True
+    return order[selected[order]]
+
+
+def _select(tree: MapAdapter[A], positions: Iterable[int]) -> MapAdapter[A]:
+    "Return a variation of the tree with the entries at the given positions"
+    index = tree._metadata_index()
+    selection = set(positions)
+    if tree._selection is not None:
+        selection &= tree._selection
+    matches = {}
+    for position in sorted(selection):
+        # Take the child indexed, which the mapping may no longer hold if it
+        # changed since the index was checked.
+        matches[index.keys[position]] = index.children[position]
+    result = tree.new_variation(mapping=matches)
+    result._index = index
+    result._selection = selection
+    if tree._order is not None:
+        # Keep the order of a sorted tree.
+        result._order = _restrict(tree._order, selection, len(index.keys))
+    return result
+
+
 def full_text_search(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     """
 
@@ -534,21 +847,11 @@ def full_text_search(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     -------
 
     """
-    matches = {}
-    text = query.text
-    query_words = set(text.split())
-    for key, value in tree.items():
-        words = set(
-            word
-            for s in walk_string_values(value.metadata())
-            for word in s.lower().split()
-        )
-        # Note that `not set.isdisjoint` is faster than `set.intersection`. At
-        # the C level, `isdisjoint` loops over the set until it finds one match,
-        # and then bails, whereas `intersection` proceeds to find all matches.
-        if not words.isdisjoint(query_words):
-            matches[key] = value
-    return tree.new_variation(mapping=matches)
+    words = tree._metadata_index().words()
+    positions: Set[int] = set()
+    for word in set(query.text.split()):
+        positions.update(words.get(word, ()))
+    return _select(tree, positions)
 
 
 MapAdapter.register_query(FullText, full_text_search)
@@ -568,14 +871,16 @@ def regex(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     """
     import re
 
-    matches = {}
     flags = 0 if query.case_sensitive else re.IGNORECASE
     pattern = re.compile(query.pattern, flags=flags)
-
-    for key, value, term in iter_child_metadata(query.key, tree):
-        if isinstance(term, str) and pattern.search(term):
-            matches[key] = value
-    return tree.new_variation(mapping=matches)
+    return _select(
+        tree,
+        (
+            position
+            for position, term in tree._metadata_index().terms(query.key)
+            if isinstance(term, str) and pattern.search(term)
+        ),
+    )
 
 
 MapAdapter.register_query(Regex, regex)
@@ -593,11 +898,7 @@ def eq(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     -------
 
     """
-    matches = {}
-    for key, value, term in iter_child_metadata(query.key, tree):
-        if term == query.value:
-            matches[key] = value
-    return tree.new_variation(mapping=matches)
+    return _select(tree, tree._metadata_index().eq(query.key, query.value))
 
 
 MapAdapter.register_query(Eq, eq)
@@ -615,11 +916,12 @@ def noteq(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     -------
 
     """
-    matches = {}
-    for key, value, term in iter_child_metadata(query.key, tree):
-        if term != query.value:
-            matches[key] = value
-    return tree.new_variation(mapping=matches)
+    index = tree._metadata_index()
+    equal = set(index.eq(query.key, query.value))
+    return _select(
+        tree,
+        (position for position, _ in index.terms(query.key) if position not in equal),
+    )
 
 
 MapAdapter.register_query(NotEq, noteq)
@@ -637,15 +939,7 @@ def contains(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     -------
 
     """
-    matches = {}
-    for key, value, term in iter_child_metadata(query.key, tree):
-        if (
-            isinstance(term, Iterable)
-            and (not isinstance(term, str))
-            and (query.value in term)
-        ):
-            matches[key] = value
-    return tree.new_variation(mapping=matches)
+    return _select(tree, tree._metadata_index().contains(query.key, query.value))
 
 
 MapAdapter.register_query(Contains, contains)
@@ -663,14 +957,12 @@ def comparison(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     -------
 
     """
-    matches = {}
-    for key, value, term in iter_child_metadata(query.key, tree):
-        if query.operator not in {"le", "lt", "ge", "gt"}:
-            raise ValueError(f"Unexpected operator {query.operator}.")
-        comparison_func = getattr(operator, query.operator)
-        if comparison_func(term, query.value):
-            matches[key] = value
-    return tree.new_variation(mapping=matches)
+    if query.operator not in {"le", "lt", "ge", "gt"}:
+        raise ValueError(f"Unexpected operator {query.operator}.")
+    index = tree._metadata_index()
+    return _select(
+        tree, index.compare(query.key, query.operator, query.value, tree._selection)
+    )
 
 
 MapAdapter.register_query(Comparison, comparison)
@@ -688,11 +980,11 @@ def _in(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     -------
 
     """
-    matches = {}
-    for key, value, term in iter_child_metadata(query.key, tree):
-        if term in query.value:
-            matches[key] = value
-    return tree.new_variation(mapping=matches)
+    index = tree._metadata_index()
+    positions: Set[int] = set()
+    for value in query.value:
+        positions.update(index.eq(query.key, value))
+    return _select(tree, positions)
 
 
 MapAdapter.register_query(In, _in)
@@ -710,13 +1002,20 @@ def notin(query: Any, tree: MapAdapter[A]) -> MapAdapter[A]:
     -------
 
     """
-    matches = {}
     if len(query.value) == 0:
         return tree
-    for key, value, term in iter_child_metadata(query.key, tree):
-        if term not in query.value:
-            matches[key] = value
-    return tree.new_variation(mapping=matches)
+    index = tree._metadata_index()
+    excluded: Set[int] = set()
+    for value in query.value:
+        excluded.update(index.eq(query.key, value))
+    return _select(
+        tree,
+        (
+            position
+            for position, _ in index.terms(query.key)
+            if position not in excluded
+        ),
+    )
 
 
 MapAdapter.register_query(NotIn, notin)
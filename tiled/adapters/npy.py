@@ -1,4 +1,5 @@
 import builtins
+from pathlib import Path
 from typing import Any, Iterable, List, Optional, Tuple, Union
 
 import numpy
@@ -18,10 +19,22 @@ from .sequence import FileSequenceAdapter
 from .utils import force_reshape, init_adapter_from_catalog
 
 
+def load_npy(filepath: Union[str, Path]) -> NDArray[Any]:
+    """Memory-map an NPY file
+
+    Slicing the result reads only the pages of the file that hold the selected
+    data, and contiguous selections are served without copying them.
+    """
+    return numpy.load(filepath, mmap_mode="r")
+
+
 class NPYAdapter(Adapter[ArrayStructure]):
     """
     Read the Numpy on-disk format, NPY (.npy).
 
+    The file is memory-mapped, so reading a slice or block reads only the
+    parts of the file that it covers.
+
     Examples
     --------
 
@@ -67,8 +80,8 @@ class NPYAdapter(Adapter[ArrayStructure]):
         **kwargs: Optional[Any],
     ) -> "NPYAdapter":
         filepath = path_from_uri(data_uri)
-        cache_key = (numpy.load, filepath)
-        arr = with_resource_cache(cache_key, numpy.load, filepath)
+        cache_key = (load_npy, filepath)
+        arr = with_resource_cache(cache_key, load_npy, filepath)
 
         structure = ArrayStructure(
             shape=arr.shape,
@@ -82,8 +95,8 @@ class NPYAdapter(Adapter[ArrayStructure]):
         )
 
     def read(self, slice: NDSlice = NDSlice(...)) -> NDArray[Any]:
-        cache_key = (numpy.load, self._filepath)
-        arr = with_resource_cache(cache_key, numpy.load, self._filepath)
+        cache_key = (load_npy, self._filepath)
+        arr = with_resource_cache(cache_key, load_npy, self._filepath)
         arr = force_reshape(arr, self._structure.shape)
         arr = arr[slice] if slice else arr
         return arr
@@ -93,12 +106,10 @@ class NPYAdapter(Adapter[ArrayStructure]):
     ) -> NDArray[Any]:
         if sum(block) != 0:
             raise IndexError(block)
-        cache_key = (numpy.load, self._filepath)
-        arr = with_resource_cache(cache_key, numpy.load, self._filepath)
+        cache_key = (load_npy, self._filepath)
+        arr = with_resource_cache(cache_key, load_npy, self._filepath)
         arr = force_reshape(arr, self._structure.shape)
         arr = arr[slice] if slice else arr
-        if slice is not None:
-            arr = arr[slice]
         return arr
 
 
@@ -107,7 +118,7 @@ class NPYSequenceAdapter(FileSequenceAdapter):
         self, slice: Union[builtins.slice, int, Iterable[int]] = slice(None)
     ) -> NDArray[Any]:
         if isinstance(slice, int):
-            return numpy.load(self.filepaths[slice])[None, ...]
+            return load_npy(self.filepaths[slice])[None, ...]
         else:
             if isinstance(slice, Iterable):
                 selected = [self.filepaths[i] for i in slice]
@@ -116,4 +127,4 @@ class NPYSequenceAdapter(FileSequenceAdapter):
             return numpy.asarray(self._map_read(selected))
 
     def _read_one(self, filepath: str) -> NDArray[Any]:
-        return numpy.load(filepath)
+        return load_npy(filepath)
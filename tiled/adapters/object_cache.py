@@ -0,0 +1,250 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from ..server.metrics import (
+    OBJECT_CACHE_BYTES,
+    OBJECT_CACHE_EVICTIONS,
+    OBJECT_CACHE_REQUESTS,
+)
+
+# Reads from object storage (S3, Azure, GCS) each pay a round trip and the
+# transfer, even for data read seconds earlier by another request or another
+# worker process on the same host. An optional cache on local disk keeps what
+# was read:
+#
+# - Each entry is one range of bytes of one object, stored in a file named for
+#   its (storage location, object key, byte range, ETag), which begins with a
+#   line holding the ETag. When `revalidate` is true (the default), a read of
+#   a cached range is a conditional request to the store (If-None-Match: the
+#   cached ETag), which transfers no data if the object has not changed, and
+#   the data and ETag of the same response otherwise. So an object changed by
+#   another host is never served stale, and each read costs one request.
+# - Entries are written to a temporary file and then moved into place, so
+#   that worker processes on the same host can share a cache directory: a
+#   reader sees a whole entry or none.
+# - The cache holds at most about `max_bytes`. Reading an entry marks it as
+#   recently used (by its modification time), and the least recently used
+#   entries are removed when the cache outgrows its budget.
+#
+# This is enabled in the server configuration (object_cache_directory,
+# object_cache_max_bytes, object_cache_revalidate) or with the environment
+# variables TILED_OBJECT_CACHE_DIRECTORY, etc.
+DEFAULT_MAX_BYTES = 10 * 1024**3  # 10 GiB
+# After removing entries, leave the cache this fraction of its budget, so that
+# not every write has to remove some.
+LOW_WATER_MARK = 0.9
+# Temporary files older than this were left behind by a process that stopped
+# while writing them.
+STALE_TEMPORARY_FILE_AGE = 3600
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ObjectCache:
+    """A read-through cache on local disk for data read from object storage
+
+    Parameters
+    ----------
+    directory : str or Path
+        Where to store entries; may be shared by processes on the same host
+    max_bytes : int, optional
+        The size budget of the cache
+    revalidate : bool, optional
+        Check each read against the object's current ETag (the default), with
+        a conditional request that transfers no data if the object has not
+        changed. If False, entries are served without asking the store, which
+        is faster but may serve stale data if objects change.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        revalidate: bool = True,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, not {max_bytes}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.revalidate = revalidate
+        # Bytes written by this process since the size of the cache was last
+        # checked. Other processes write too, so the size is not tracked
+        # exactly: the directory is scanned once this much has been written.
+        self._written = 0
+        self._scan_every = max(1, int(max_bytes * (1 - LOW_WATER_MARK)))
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({str(self.directory)!r}, "
+            f"max_bytes={self.max_bytes}, revalidate={self.revalidate})"
+        )
+
+    def _object_directory(self, location: str, key: str) -> Path:
+        digest = _digest(f"{location}\0{key}")
+        return self.directory / digest[:2] / digest
+
+    def _candidates(
+        self, location: str, key: str, byte_range: str, etag: Optional[str]
+    ) -> List[Path]:
+        directory = self._object_directory(location, key)
+        range_digest = _digest(byte_range)[:32]
+        if etag is None:
+            # Accept any version.
+            return list(directory.glob(f"{range_digest}-*"))
+        return [directory / f"{range_digest}-{_digest(etag)[:16]}"]
+
+    def lookup(
+        self, location: str, key: str, byte_range: str, etag: Optional[str] = None
+    ) -> Optional[Tuple[str, bytes]]:
+        """Return the ETag and bytes of a cached range of an object, or None
+
+        Unlike `get`, this does not count a hit or a miss, for callers that
+        check the entry with the store before using it.
+
+        Parameters
+        ----------
+        location : str
+            Identifies the store, e.g. the URI of the bucket
+        key : str
+            The key of the object within the store
+        byte_range : str
+            Identifies the range read, or "" for the whole object
+        etag : str, optional
+            The object's current ETag. If None, any cached version is returned.
+        """
+        for path in self._candidates(location, key, byte_range, etag):
+            try:
+                entry = path.read_bytes()
+                # Mark the entry as recently used.
+                os.utime(path)
+            except FileNotFoundError:
+                # Removed by another process in the meantime
+                continue
+            cached_etag, _, data = entry.partition(b"\n")
+            return cached_etag.decode(), data
+        return None
+
+    def get(
+        self, location: str, key: str, byte_range: str, etag: Optional[str] = None
+    ) -> Optional[bytes]:
+        """Return the cached bytes of a range of an object, or None
+
+        The parameters are those of `lookup`.
+        """
+        entry = self.lookup(location, key, byte_range, etag)
+        if entry is None:
+            self.record_miss()
+            return None
+        _, data = entry
+        self.record_hit(data)
+        return data
+
+    def record_hit(self, data: bytes) -> None:
+        "Count a read served from the cache"
+        OBJECT_CACHE_REQUESTS.labels("hit").inc()
+        OBJECT_CACHE_BYTES.labels("hit").inc(len(data))
+
+    def record_miss(self) -> None:
+        "Count a read not served from the cache"
+        OBJECT_CACHE_REQUESTS.labels("miss").inc()
+
+    def put(
+        self,
+        location: str,
+        key: str,
+        byte_range: str,
+        etag: Optional[str],
+        data: bytes,
+    ) -> None:
+        "Store a range of an object, read from the store after a miss"
+        (path,) = self._candidates(location, key, byte_range, etag or "")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                # The ETag goes on a line of its own; ETags have no newlines.
+                file.write(f"{etag or ''}\n".encode())
+                file.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
+        # Entries for other versions of the same range are now stale.
+        for other in self._candidates(location, key, byte_range, None):
+            if other != path:
+                other.unlink(missing_ok=True)
+        OBJECT_CACHE_BYTES.labels("miss").inc(len(data))
+        with self._lock:
+            self._written += len(data)
+            scan = self._written >= self._scan_every
+            if scan:
+                self._written = 0
+        if scan:
+            self.evict()
+
+    def invalidate(self, location: str, key: str) -> None:
+        "Remove all cached ranges of an object, e.g. after writing it"
+        directory = self._object_directory(location, key)
+        if directory.is_dir():
+            for path in directory.iterdir():
+                path.unlink(missing_ok=True)
+
+    def evict(self) -> int:
+        """Remove the least recently used entries if the cache is over budget
+
+        Returns the number of entries removed.
+        """
+        now = time.time()
+        entries = []
+        total = 0
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if name.startswith(".tmp-"):
+                    if now - stat.st_mtime > STALE_TEMPORARY_FILE_AGE:
+                        Path(path).unlink(missing_ok=True)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return 0
+        entries.sort()
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes * LOW_WATER_MARK:
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        OBJECT_CACHE_EVICTIONS.inc(removed)
+        return removed
+
+
+_object_cache: Optional[ObjectCache] = None
+_object_cache_lock = threading.Lock()
+
+
+def get_object_cache() -> Optional[ObjectCache]:
+    "Return the object cache, a process-global setting, or None if there is none."
+    with _object_cache_lock:
+        return _object_cache
+
+
+def set_object_cache(cache: Optional[ObjectCache]) -> None:
+    "Set (or, with None, unset) the object cache, a process-global setting."
+    global _object_cache
+    with _object_cache_lock:
+        _object_cache = cache
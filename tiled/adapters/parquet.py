@@ -1,11 +1,13 @@
 import copy
 from collections.abc import Set
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 from urllib.parse import quote_plus
 
 import dask.dataframe
+import numpy
 import pandas
+import pyarrow.dataset
 
 from tiled.adapters.core import Adapter
 
@@ -14,6 +16,7 @@ from ..storage import FileStorage, Storage
 from ..structures.core import Spec
 from ..structures.data_source import Asset, DataSource
 from ..structures.table import TableStructure
+from ..table_filter import TableFilter
 from ..type_aliases import JSON
 from ..utils import path_from_uri
 from .array import ArrayAdapter
@@ -21,6 +24,25 @@ from .dataframe import DataFrameAdapter
 from .utils import init_adapter_from_catalog
 
 
+def _range_index(
+    schema: pyarrow.Schema, positions: numpy.ndarray, num_rows: int
+) -> pandas.Index:
+    "The index of the rows at the given positions, for a table without index columns"
+    start, step = 0, 1
+    index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+    if len(index_columns) == 1 and index_columns[0].get("kind") == "range":
+        # A RangeIndex stored as metadata, if it spans the whole table
+        (stored,) = index_columns
+        if len(range(stored["start"], stored["stop"], stored["step"])) == num_rows:
+            start, step = stored["start"], stored["step"]
+    if len(positions) and positions[-1] - positions[0] + 1 == len(positions):
+        first = start + step * int(positions[0])
+        return pandas.RangeIndex(first, first + step * len(positions), step)
+    if not len(positions):
+        return pandas.RangeIndex(0)
+    return pandas.Index(start + step * positions)
+
+
 class ParquetDatasetAdapter(Adapter[TableStructure]):
     def __init__(
         self,
@@ -110,11 +132,192 @@ class ParquetDatasetAdapter(Adapter[TableStructure]):
         uri = self._partition_paths[0]
         data.to_parquet(uri)
 
-    def read(self, *args: Any, **kwargs: Any) -> pandas.DataFrame:
-        return self.dataframe_adapter.read(*args, **kwargs)
+    def _read(
+        self,
+        paths: List[Path],
+        fields: Optional[List[str]] = None,
+        rows: Optional[slice] = None,
+        filter: Optional[TableFilter] = None,
+    ) -> pandas.DataFrame:
+        """Read the given files as one table, with pyarrow.dataset
+
+        Only the columns requested (and those the filter uses) are read, from
+        only the row groups that span `rows` and whose statistics do not exclude
+        the filter. Rows are then selected by position, and then by value. They
+        keep their index (by default, their position in the table), as with
+        other adapters.
+        """
+        dataset = pyarrow.dataset.dataset(
+            [str(path) for path in paths], format="parquet"
+        )
+        schema = dataset.schema
+        # Read the columns that pandas restores as the index, too.
+        index_columns = [
+            name
+            for name in (schema.pandas_metadata or {}).get("index_columns", [])
+            if isinstance(name, str)
+        ]
+        columns = None
+        if fields is not None:
+            filter_columns = sorted(filter.columns) if filter is not None else []
+            columns = list(dict.fromkeys([*fields, *filter_columns, *index_columns]))
+        elif filter is not None:
+            columns = list(schema.names)
+        for name in columns or ():
+            if name not in schema.names:
+                raise KeyError(name)
+        expression = filter.expression() if filter is not None else None
+        try:
+            table, positions, num_rows = self._read_row_groups(
+                dataset, columns, rows, expression
+            )
+            if rows is not None:
+                start, stop, _ = rows.indices(num_rows)
+                keep = (positions >= start) & (positions < stop)
+                table = table.filter(pyarrow.array(keep))
+                positions = positions[keep]
+            if expression is not None:
+                # Carry the positions through the filter in a column.
+                name = "__position__"
+                while name in table.column_names:
+                    name = f"_{name}_"
+                table = table.append_column(name, pyarrow.array(positions))
+                table = table.filter(expression)
+                positions = table.column(name).to_numpy()
+                table = table.remove_column(table.schema.get_field_index(name))
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as err:
+            if filter is None:
+                raise
+            # e.g. a comparison between a column and a literal of another type
+            raise ValueError(f"Cannot apply filter {filter}: {err}")
+        df = table.to_pandas()
+        if not index_columns:
+            df.index = _range_index(schema, positions, num_rows)
+        if fields is not None:
+            df = df[fields]
+        return df
+
+    @staticmethod
+    def _read_row_groups(
+        dataset: pyarrow.dataset.FileSystemDataset,
+        columns: Optional[List[str]],
+        rows: Optional[slice],
+        expression: Optional[pyarrow.dataset.Expression],
+    ) -> Tuple[pyarrow.Table, numpy.ndarray, int]:
+        """Read the row groups that may hold the rows requested
+
+        Return the table read, the position in the dataset of each of its rows,
+        and the number of rows in the dataset.
+        """
+        start = 0 if rows is None else rows.start or 0
+        stop = None if rows is None else rows.stop
+        if start < 0 or (stop is not None and stop < 0):
+            # Positions from the end need the number of rows: read all groups.
+            start, stop = 0, None
+        tables = []
+        positions = []
+        position = 0
+        for fragment in dataset.get_fragments():
+            candidates = None
+            if expression is not None:
+                # Skip the row groups whose statistics exclude the filter.
+                candidates = {
+                    row_group.id
+                    for piece in fragment.split_by_row_group(
+                        expression, schema=dataset.schema
+                    )
+                    for row_group in piece.row_groups
+                }
+            row_group_ids = []
+            for row_group in fragment.row_groups:
+                end = position + row_group.num_rows
+                if (
+                    end > start
+                    and (stop is None or position < stop)
+                    and (candidates is None or row_group.id in candidates)
+                ):
+                    row_group_ids.append(row_group.id)
+                    positions.append(numpy.arange(position, end))
+                position = end
+            if row_group_ids:
+                tables.append(
+                    fragment.subset(row_group_ids=row_group_ids).to_table(
+                        schema=dataset.schema, columns=columns
+                    )
+                )
+        if tables:
+            table = pyarrow.concat_tables(tables)
+        else:
+            table = dataset.schema.empty_table()
+            if columns is not None:
+                table = table.select(columns)
+        return (
+            table,
+            numpy.concatenate(positions) if positions else numpy.arange(0),
+            position,
+        )
+
+    def _existing_paths(self) -> List[Path]:
+        if not all(Path(path).exists() for path in self._partition_paths):
+            raise ValueError("Not all partitions have been stored.")
+        return self._partition_paths
+
+    def _partition_path(self, partition: int) -> Path:
+        path = self._partition_paths[partition]
+        if not Path(path).exists():
+            raise RuntimeError(f"Partition {partition} has not been stored yet.")
+        return path
 
-    def read_partition(self, *args: Any, **kwargs: Any) -> pandas.DataFrame:
-        return self.dataframe_adapter.read_partition(*args, **kwargs)
+    def read(self, fields: Optional[List[str]] = None) -> pandas.DataFrame:
+        return self._read(self._existing_paths(), fields)
+
+    def read_partition(
+        self, partition: int, fields: Optional[List[str]] = None
+    ) -> pandas.DataFrame:
+        return self._read([self._partition_path(partition)], fields)
+
+    def read_subset(
+        self,
+        fields: Optional[List[str]] = None,
+        rows: Optional[slice] = None,
+        filter: Optional[TableFilter] = None,
+    ) -> pandas.DataFrame:
+        """Read a subset of the rows of the table
+
+        Parameters
+        ----------
+        fields : list of str, optional
+            the columns to read
+        rows : slice, optional
+            the rows to read, by position in the table (across partitions)
+        filter : TableFilter, optional
+            an expression that the rows must satisfy, applied after `rows`
+        """
+        return self._read(self._existing_paths(), fields, rows, filter)
+
+    def read_partition_subset(
+        self,
+        partition: int,
+        fields: Optional[List[str]] = None,
+        rows: Optional[slice] = None,
+        filter: Optional[TableFilter] = None,
+    ) -> pandas.DataFrame:
+        """Read a subset of the rows of one partition
+
+        Parameters
+        ----------
+        partition : int
+            index of the partition to read
+        fields : list of str, optional
+            the columns to read
+        rows : slice, optional
+            the rows to read, by position in the partition
+        filter : TableFilter, optional
+            an expression that the rows must satisfy, applied after `rows`
+        """
+        return self._read([self._partition_path(partition)], fields, rows, filter)
 
     def get(self, key: str) -> Union[ArrayAdapter, None]:
-        return self.dataframe_adapter.get(key)
+        if key not in self.structure().columns:
+            return None
+        return ArrayAdapter.from_array(self.read([key])[key].values)
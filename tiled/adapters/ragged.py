@@ -74,6 +74,17 @@ class RaggedAdapter(Adapter[RaggedStructure]):
         """Read a slice of data from the ragged array, or the entire array."""
         return make_ragged_array(self._array, slice=slice)
 
+    def read_block(self, block: NDBlock, slice: NDSlice | None = None) -> ragged.array:
+        """Read one block (chunk along axis 0) of the ragged array."""
+        chunks0 = self._structure.chunks[0] or ()
+        if not (0 <= block[0] < len(chunks0)) or any(block[1:]):
+            raise IndexError(f"Block {tuple(block)} is out of range")
+        start = sum(chunks0[: block[0]])
+        block_array = make_ragged_array(self._array)[
+            start : start + chunks0[block[0]]  # noqa: E203
+        ]
+        return make_ragged_array(block_array, slice=slice)
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._structure})"
 
@@ -164,18 +175,21 @@ class RaggedSQLAdapter(Adapter[RaggedStructure]):
             specs=node.specs,
         )
 
-    def _load_chunks(self, chunk_indexes: list[int]) -> list[dict[str, Any]]:
+    def _load_chunks(self, chunk_indexes: list[int]) -> pyarrow.Table:
         """Fetch SQL rows for the given chunk_indexes, ordered by chunk_index ASC.
 
         Bypasses ``_read_full_table_or_partition`` so the chunk_index filter
         is pushed into the SQL ``WHERE`` clause instead of being applied in
         Python after a full scan.
         """
-        if not chunk_indexes:
-            return []
         tab = self._tabular_adapter
         schema = tab.structure().arrow_schema_decoded
         req_cols = list(schema.names)
+        target_schema = pyarrow.schema(
+            [schema.field(schema.get_field_index(name)) for name in req_cols]
+        )
+        if not chunk_indexes:
+            return target_schema.empty_table()
         in_list = ", ".join(str(int(i)) for i in chunk_indexes)
         query = (
             "SELECT "
@@ -192,11 +206,20 @@ class RaggedSQLAdapter(Adapter[RaggedStructure]):
             conn.commit()
         if lwr_upr_case_mapping := {c.lower(): c for c in req_cols if c != c.lower()}:
             data = data.rename_columns(lwr_upr_case_mapping)
-        target_schema = pyarrow.schema(
-            [schema.field(schema.get_field_index(name)) for name in req_cols]
-        )
-        rows: list[dict[str, Any]] = data.cast(target_schema).to_pylist()
-        return rows
+        return data.cast(target_schema)
+
+    def _read_chunks(self, chunk_indexes: list[int]) -> awkward.Array:
+        "Read the given chunks (rows of the table) as one awkward array."
+        form = self._structure.awkward_form  # form should be the same for each row
+        table = self._load_chunks(chunk_indexes)
+        if table.num_rows != len(chunk_indexes):
+            raise IndexError(
+                f"Expected {len(chunk_indexes)} chunks of the ragged array, "
+                f"found {table.num_rows}"
+            )
+        lengths = [self._structure.chunks[0][i] for i in chunk_indexes]
+        length, buffers = concatenate_chunk_buffers(form, lengths, table)
+        return awkward.from_buffers(form, length, buffers)
 
     def read(self, slice: NDSlice | None = None) -> CanonicalRaggedArray:
         """Read a slice of data from the ragged array.
@@ -226,25 +249,28 @@ class RaggedSQLAdapter(Adapter[RaggedStructure]):
                     chunk_indexes = selected
                     slc = NDSlice(adjusted[0], *slc[1:])
 
-        rows = self._load_chunks(chunk_indexes)
+        return make_ragged_array(self._read_chunks(chunk_indexes), slice=slc)
 
-        # Each row in the table represents an awkward buffer; concatenate them together
-        form = self._structure.awkward_form  # form should be the same for each row
-        buffers_schema = form.expected_from_buffers()
-        buffers = [
-            {
-                key: numpy.array(row[key], dtype=typ)
-                for key, typ in buffers_schema.items()
-            }
-            for row in rows
-        ]
-        selected_lengths = [chunks0[i] for i in chunk_indexes]
-        awk_arrays = [
-            awkward.from_buffers(form, length, buffer)
-            for length, buffer in zip(selected_lengths, buffers)
-        ]
+    def read_block(
+        self, block: NDBlock, slice: NDSlice | None = None
+    ) -> CanonicalRaggedArray:
+        """Read one block (chunk along axis 0) of the ragged array.
 
-        return make_ragged_array(awkward.concatenate(awk_arrays), slice=slc)
+        Parameters
+        ----------
+        block : NDBlock
+            The index of the block along the first (chunked) dimension, with
+            zeros for any other fixed dimensions.
+        slice : NDSlice, optional
+            A slice to apply within the block.
+        """
+        chunks0 = self._structure.chunks[0] or ()
+        if not (0 <= block[0] < len(chunks0)) or any(block[1:]):
+            raise IndexError(f"Block {tuple(block)} is out of range")
+        return make_ragged_array(
+            self._read_chunks([int(block[0])]),
+            slice=NDSlice(slice) if slice is not None else NDSlice(()),
+        )
 
     def write(self, data: CanonicalRaggedArray) -> None:
         self.write_block(data, block=NDBlock(0))
@@ -353,3 +379,100 @@ class RaggedSQLAdapter(Adapter[RaggedStructure]):
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._structure})"
+
+
+def _chunk_buffers(
+    table: pyarrow.Table, key: str, dtype: numpy.dtype
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Return one buffer column as a flat array, and the bounds of each row in it.
+
+    The values of a list column are contiguous, so this is a view (not a copy)
+    of the data fetched from the database wherever NumPy can share Arrow's
+    memory, i.e. for numbers without nulls.
+    """
+    column = table.column(key)
+    column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    offsets = column.offsets.to_numpy()
+    values = column.values.to_numpy(zero_copy_only=False).astype(dtype, copy=False)
+    flat = values[offsets[0] : offsets[-1]]  # noqa: E203
+    return flat, offsets - offsets[0]
+
+
+def concatenate_chunk_buffers(
+    form: awkward.forms.Form, lengths: list[int], table: pyarrow.Table
+) -> tuple[int, dict[str, numpy.ndarray]]:
+    """Concatenate the awkward buffers stored in consecutive rows of a table.
+
+    Each row of the table holds the buffers of one chunk of a ragged array,
+    one list column per buffer. The chunks are concatenated buffer by buffer,
+    shifting the offsets of each chunk to follow the previous one, rather than
+    by building an awkward array per chunk. Where each chunk's buffers are
+    used whole (as when they were written packed), the data buffers are views
+    of the fetched data.
+
+    Returns
+    -------
+    length : int
+        Top-level array length.
+    buffers : dict[str, numpy.ndarray]
+        Buffers suitable for awkward.from_buffers(form, length, buffers).
+    """
+    dtypes = form.expected_from_buffers()
+    columns = {key: _chunk_buffers(table, key, dtype) for key, dtype in dtypes.items()}
+    buffers = {}
+
+    def chunk(key, i):
+        flat, bounds = columns[key]
+        return flat[bounds[i] : bounds[i + 1]]  # noqa: E203
+
+    def recurse(form, ranges):
+        # ranges holds, per chunk, the (start, stop) of the elements of this
+        # node that the chunk's array uses.
+        if isinstance(form, awkward.forms.NumpyForm):
+            key = f"{form.form_key}-data"
+            inner = int(numpy.prod(form.inner_shape, dtype=numpy.int64))
+            parts = [chunk(key, i) for i in range(len(ranges))]
+            if all(
+                start == 0 and stop * inner == len(part)
+                for (start, stop), part in zip(ranges, parts)
+            ):
+                buffers[key] = columns[key][0]
+            else:
+                buffers[key] = numpy.concatenate(
+                    [
+                        part[start * inner : stop * inner]  # noqa: E203
+                        for (start, stop), part in zip(ranges, parts)
+                    ]
+                )
+            return
+
+        if isinstance(form, awkward.forms.RegularForm):
+            recurse(
+                form.content,
+                [(start * form.size, stop * form.size) for start, stop in ranges],
+            )
+            return
+
+        if isinstance(form, awkward.forms.ListOffsetForm):
+            key = f"{form.form_key}-offsets"
+            parts = []
+            content_ranges = []
+            shift = 0
+            for i, (start, stop) in enumerate(ranges):
+                offsets = chunk(key, i)[start : stop + 1]  # noqa: E203
+                first, last = int(offsets[0]), int(offsets[-1])
+                # Continue from where the previous chunk's content ends.
+                shifted = offsets - (first - shift)
+                parts.append(shifted[1:] if parts else shifted)
+                content_ranges.append((first, last))
+                shift += last - first
+            buffers[key] = numpy.concatenate(
+                parts or [numpy.zeros(1, dtype=dtypes[key])]
+            )
+            recurse(form.content, content_ranges)
+            return
+
+        raise TypeError(f"Unsupported form type: {type(form).__name__}")
+
+    recurse(form, [(0, length) for length in lengths])
+    return sum(lengths), buffers
@@ -2,7 +2,6 @@ import builtins
 import math
 import os
 from abc import abstractmethod
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, List, Optional, Union
 
 import numpy as np
@@ -18,24 +17,17 @@ from ..structures.core import Spec, StructureFamily
 from ..structures.data_source import DataSource
 from ..type_aliases import JSON, EllipsisType
 from ..utils import path_from_uri
+from .io_executor import get_io_executor
 from .utils import force_reshape, grid_shape_for_files
 
-# Concurrency and memory knobs for reads that span many files of a sequence.
-#
-# IO_WORKERS: how many files to read concurrently. Reading a file is I/O-bound
-#   (open + read + decode, releasing the GIL in the C codecs), so a worker count
-#   somewhat above the CPU count keeps the storage busy. Override with
-#   TILED_SEQUENCE_IO_WORKERS.
 # READ_BATCH_BYTES: soft cap on the *full-frame* bytes held in memory at once
-#   while a multi-file read is in flight. A read that touches many files but
-#   keeps only a few pixels of each (e.g. one pixel from every file of a large
-#   stack) reads each file on a worker, reduces the frame, and drops it before
-#   the next, so peak memory stays near `min(IO_WORKERS, READ_BATCH_BYTES /
-#   frame_bytes)` full frames plus the (reduced) result, never the whole stack.
-#   Override with TILED_SEQUENCE_READ_BATCH_BYTES.
-IO_WORKERS = int(
-    os.environ.get("TILED_SEQUENCE_IO_WORKERS") or min(32, (os.cpu_count() or 4) + 4)
-)
+# while a multi-file read is in flight. A read that touches many files but keeps
+# only a few pixels of each (e.g. one pixel from every file of a large stack)
+# reads each file on a worker of the shared I/O pool (see
+# tiled.adapters.io_executor), reduces the frame, and drops it before the next,
+# so peak memory stays near `min(per_request, READ_BATCH_BYTES / frame_bytes)`
+# full frames plus the (reduced) result, never the whole stack. Override with
+# TILED_SEQUENCE_READ_BATCH_BYTES.
 READ_BATCH_BYTES = int(os.environ.get("TILED_SEQUENCE_READ_BATCH_BYTES") or (1 << 30))
 
 
@@ -215,14 +207,11 @@ class FileSequenceAdapter(Adapter[ArrayStructure]):
     def _map_read(self, filepaths: Iterable[str]) -> List[NDArray[Any]]:
         """Read files concurrently via `_read_one`, preserving input order.
 
-        Overlaps the (I/O-bound) per-file reads across `IO_WORKERS` threads.
-        Falls back to a serial map for a single file or when `IO_WORKERS == 1`.
+        Overlaps the (I/O-bound) per-file reads on the shared I/O pool, up to
+        its per-request share of workers. Falls back to a serial map for a
+        single file.
         """
-        filepaths = list(filepaths)
-        if IO_WORKERS <= 1 or len(filepaths) <= 1:
-            return [self._read_one(fp) for fp in filepaths]
-        with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(filepaths))) as ex:
-            return list(ex.map(self._read_one, filepaths))
+        return get_io_executor().map(self._read_one, filepaths)
 
     def _read_selected(
         self,
@@ -243,8 +232,8 @@ class FileSequenceAdapter(Adapter[ArrayStructure]):
         full frame is then dropped. Reducing *before* stacking is what keeps a
         read that touches many files but keeps only a few pixels of each from
         materializing the whole stack -- peak extra memory is about
-        `min(IO_WORKERS, READ_BATCH_BYTES / frame_bytes)` full frames in flight,
-        not `n_files x full_frame`. A single persistent pool reads all files
+        `min(per_request, READ_BATCH_BYTES / frame_bytes)` full frames in
+        flight, not `n_files x full_frame`. The shared I/O pool reads all files
         (no per-batch spin-up/idle-tail), keeping storage continuously busy.
         Returns the reduced frames stacked along a new leading axis: shape
         `(len(file_indices), *frame_slice applied to frame_shape)`.
@@ -261,7 +250,7 @@ class FileSequenceAdapter(Adapter[ArrayStructure]):
         frame_nbytes = max(1, math.prod(frame_shape) * dtype.itemsize)
         # Cap concurrent in-flight full frames so peak memory stays near
         # READ_BATCH_BYTES regardless of how many files the read touches.
-        max_workers = max(1, min(IO_WORKERS, READ_BATCH_BYTES // frame_nbytes))
+        max_in_flight = max(1, READ_BATCH_BYTES // frame_nbytes)
 
         def fill(pos: int) -> None:
             frame = self._read_one(self.filepaths[file_indices[pos]])
@@ -272,15 +261,7 @@ class FileSequenceAdapter(Adapter[ArrayStructure]):
             frame = force_reshape(frame, tuple(frame_shape))
             out[pos] = frame[key] if key else frame
 
-        if max_workers <= 1 or len(file_indices) <= 1:
-            for pos in range(len(file_indices)):
-                fill(pos)
-        else:
-            with ThreadPoolExecutor(
-                max_workers=min(max_workers, len(file_indices))
-            ) as ex:
-                # Consume to propagate any worker exception and wait for all.
-                list(ex.map(fill, range(len(file_indices))))
+        get_io_executor().map(fill, range(len(file_indices)), limit=max_in_flight)
         return out
 
     def metadata(self) -> JSON:
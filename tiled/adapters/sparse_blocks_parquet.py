@@ -20,15 +20,43 @@ from ..structures.data_source import Asset, DataSource
 from ..structures.sparse import COOStructure, SparseStructure
 from ..type_aliases import JSON
 from ..utils import path_from_uri
+from .io_executor import get_io_executor
 from .utils import init_adapter_from_catalog
 
 
-def load_block(uri: str) -> Tuple[List[int], Tuple[NDArray[Any], Any]]:
-    # TODO This can be done without pandas.
-    # Better to use a plain I/O library.
-    df = pandas.read_parquet(path_from_uri(uri))
-    coords = df[df.columns[:-1]].values.T
-    data = df["data"].values
+def load_block(
+    uri: str, ranges: Optional[List[Optional[Tuple[int, int]]]] = None
+) -> Tuple[NDArray[Any], NDArray[Any]]:
+    """Read the coordinates and values of the entries of a block
+
+    If given, `ranges` holds a range (start, stop) of coordinates, or None,
+    for each dimension, and only the entries within them are read: the ranges
+    are pushed down into the Parquet read, skipping row groups whose
+    statistics exclude them.
+    """
+    import pyarrow.compute
+    import pyarrow.dataset
+
+    dataset = pyarrow.dataset.dataset(path_from_uri(uri), format="parquet")
+    # Skip the index of the DataFrame that was written, if it was stored.
+    index_columns = {
+        name
+        for name in (dataset.schema.pandas_metadata or {}).get("index_columns", [])
+        if isinstance(name, str)
+    }
+    names = [name for name in dataset.schema.names if name not in index_columns]
+    coord_names = names[:-1]
+    expression = None
+    for name, span in zip(coord_names, ranges or []):
+        if span is None:
+            continue
+        start, stop = span
+        field = pyarrow.compute.field(name)
+        term = (field >= start) & (field < stop)
+        expression = term if expression is None else expression & term
+    table = dataset.to_table(columns=names, filter=expression)
+    coords = numpy.stack([table[name].to_numpy() for name in coord_names])
+    data = table["data"].to_numpy()
     return coords, data
 
 
@@ -108,21 +136,75 @@ class SparseBlocksParquetAdapter(Adapter[SparseStructure]):
         uri = self.blocks[(0,) * len(self.structure().shape)]
         data.to_parquet(path_from_uri(uri))
 
+    def _block_ranges(
+        self, slice: NDSlice
+    ) -> List[Tuple[Tuple[int, ...], List[Optional[Tuple[int, int]]]]]:
+        """List the blocks that intersect a slice
+
+        For each, give the range (start, stop) of coordinates within the block
+        that the slice spans in each dimension, or None where it spans the
+        whole block.
+        """
+        shape = self._structure.shape
+        # The span of the slice in each dimension
+        spans = []
+        for index, size in zip(slice.expand_for_shape(shape), shape):
+            if isinstance(index, int):
+                index %= size
+                spans.append((index, index + 1))
+                continue
+            selected = range(*index.indices(size))
+            if not selected:
+                return []
+            spans.append(
+                (min(selected[0], selected[-1]), max(selected[0], selected[-1]) + 1)
+            )
+        # The blocks that intersect the span, in each dimension
+        candidates = []
+        for (start, stop), chunks in zip(spans, self._structure.chunks):
+            offsets = numpy.cumsum([0, *chunks])
+            intersecting = []
+            for i, size in enumerate(chunks):
+                if offsets[i] < stop and start < offsets[i + 1]:
+                    lo = int(max(start - offsets[i], 0))
+                    hi = int(min(stop - offsets[i], size))
+                    span = None if (lo, hi) == (0, size) else (lo, hi)
+                    intersecting.append((i, span))
+            candidates.append(intersecting)
+        return [
+            (tuple(i for i, _ in per_dim), [span for _, span in per_dim])
+            for per_dim in itertools.product(*candidates)
+        ]
+
     def read(self, slice: NDSlice = NDSlice(...)) -> sparse.COO:
-        all_coords = []
-        all_data = []
-        for block, uri in self.blocks.items():
-            coords, data = load_block(uri)
-            offsets = []
-            for b, c in zip(block, self.structure().chunks):
-                offset = sum(c[:b])
-                offsets.append(offset)
-            global_coords = coords + [[i] for i in offsets]
-            all_coords.append(global_coords)
-            all_data.append(data)
+        if slice:
+            # Read only the entries of the blocks that the slice intersects.
+            selected = self._block_ranges(slice)
+        else:
+            selected = [(block, None) for block in self.blocks]
+        offsets = [numpy.cumsum([0, *chunks]) for chunks in self._structure.chunks]
+
+        def load(item):
+            block, ranges = item
+            coords, data = load_block(self.blocks[block], ranges)
+            # Offset the coordinates from the block's to the array's.
+            block_offsets = numpy.array([o[b] for o, b in zip(offsets, block)])
+            return coords + block_offsets[:, numpy.newaxis], data
+
+        loaded = get_io_executor().map(load, selected)
+        if not loaded:
+            # The slice selects nothing.
+            data_type = self._structure.data_type
+            dtype = data_type.to_numpy_dtype() if data_type is not None else float
+            loaded = [
+                (
+                    numpy.empty((len(self._structure.shape), 0), dtype=int),
+                    numpy.empty(0, dtype=dtype),
+                )
+            ]
         arr = sparse.COO(
-            data=numpy.concatenate(all_data),
-            coords=numpy.concatenate(all_coords, axis=-1),
+            data=numpy.concatenate([data for _, data in loaded]),
+            coords=numpy.concatenate([coords for coords, _ in loaded], axis=-1),
             shape=self._structure.shape,
         )
         return arr[slice] if slice else arr
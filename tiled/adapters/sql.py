@@ -46,10 +46,15 @@ from ..storage import (
 from ..structures.core import Spec, StructureFamily
 from ..structures.data_source import Asset, DataSource
 from ..structures.table import TableStructure
+from ..table_filter import TableFilter
 from ..type_aliases import JSON
 from .array import ArrayAdapter
+from .sql_ingest import get_ingest_buffer
 
 DIALECTS = Literal["postgresql", "sqlite", "duckdb"]
+# The column by which each dialect orders rows as they were stored
+_ROW_ID = {"sqlite": "rowid", "duckdb": "rowid", "postgresql": "ctid"}
+_REVERSED = {"asc": "DESC", "desc": "ASC"}
 TABLE_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
 COLUMN_NAME_PATTERN = re.compile(r"^[a-zA-Z_].*$")
 FORBIDDEN_CHARACTERS = re.compile(
@@ -278,6 +283,33 @@ class SQLAdapter(Adapter[TableStructure]):
             with conn.cursor() as cursor:
                 cursor.execute(create_index_statement)
 
+            # Create an index that also covers the ordering of the rows, so that
+            # reading a range of rows walks the index in order, rather than
+            # sorting every row of the dataset. (OFFSET still steps over the
+            # entries before the range; the last N rows of a live table are
+            # read by walking the index backwards from the end.) Datasets with different orderings may
+            # share a table, so the index is named for the ordering.
+            if order_by_args := data_source.parameters.get("order_by_args"):
+                for arg in order_by_args:
+                    if arg["column"] not in data_source.structure.columns:
+                        raise ValueError(
+                            f"order_by column '{arg['column']}' is not in the structure columns"
+                        )
+                order_columns = [f'"{arg["column"].lower()}"' for arg in order_by_args]
+                index_name = (
+                    "ordering_index_"
+                    + hashlib.md5(
+                        (table_name + ",".join(order_columns)).encode()
+                    ).hexdigest()[:16]
+                )
+                create_ordering_index_statement = (
+                    f'CREATE INDEX IF NOT EXISTS "{index_name}" '
+                    f'ON "{table_name}"(_dataset_id, _partition_id, '
+                    f"{', '.join(order_columns)})"
+                )
+                with conn.cursor() as cursor:
+                    cursor.execute(create_ordering_index_statement)
+
             if primary_key:
                 pkey_columns = ", ".join([f'"{col.lower()}"' for col in primary_key])
                 create_unique_index_statement = (
@@ -501,67 +533,232 @@ class SQLAdapter(Adapter[TableStructure]):
         }:
             table = table.rename_columns(upr_lwr_case_mapping)
 
-        with closing(self.storage.connect()) as conn:
-            with conn.cursor() as cursor:
-                cursor.adbc_ingest(self.table_name, table, mode="append")
-            conn.commit()
+        # Concurrent appends to this table are committed together.
+        get_ingest_buffer(self.storage, self.table_name).append(self.storage, table)
 
-    def _read_full_table_or_partition(
-        self, fields: Optional[List[str]] = None, partition: Optional[int] = None
-    ) -> pyarrow.Table:
-        """Read the data from the database
-
-        This is a helper function to read the data from the database. The result
-        is a pyarrow table containing rows either from the entire table or from a
-        specific partition. The retained columns are cast to the original type.
+    def _query(
+        self,
+        fields: Optional[List[str]] = None,
+        partition: Optional[int] = None,
+        rows: Optional[slice] = None,
+        filter: Optional[TableFilter] = None,
+    ) -> Tuple[str, List[Any], pyarrow.Schema]:
+        """Build the query reading the data, and the schema of its result
 
         Parameters
         ----------
         fields : optional string to return the data in the specified field.
         partition : optional int to return the data in the specified partition.
+        rows : optional slice selecting rows by position, in the order given by
+            order_by_args (and, across partitions, by partition).
+        filter : optional TableFilter selecting rows by value, applied after rows.
 
         Returns
         -------
-        The concatenated table as pyarrow table.
+        The query, the values of its parameters, and the schema (with the
+        original types and column names) to which its result is cast.
         """
 
         # Make sure that requested columns exist and safe to put in SQL query.
         schema = self.structure().arrow_schema_decoded
         req_cols = set(schema.names).intersection(fields) if fields else schema.names
+        if filter is not None:
+            for name in sorted(filter.columns):
+                if name not in schema.names:
+                    raise KeyError(name)
 
-        query = (
-            "SELECT " + ", ".join([f'"{c.lower()}"' for c in req_cols]) + " "
-            f'FROM "{self.table_name}" '
-            f"WHERE _dataset_id={self.dataset_id} "
-        )
-
+        where = f"WHERE _dataset_id={self.dataset_id} "
         if partition is not None:
-            query += f"AND _partition_id={int(partition)}"
+            where += f"AND _partition_id={int(partition)}"
             order_by_partition = []
         else:
             order_by_partition = [{"column": "_partition_id", "direction": "asc"}]
 
-        if args := self.order_by_args + order_by_partition:
-            query += " ORDER BY " + ", ".join(
-                [f'"{c["column"].lower()}" {c["direction"].upper()}' for c in args]
+        args = self.order_by_args + order_by_partition
+        if rows is not None:
+            # Positions need a total order: break ties (or, without
+            # order_by_args, order rows within a partition) by the order in
+            # which the rows were stored.
+            args = [
+                *args,
+                {"column": _ROW_ID[self.storage.dialect], "direction": "asc"},
+            ]
+
+        def order_by(reverse: bool = False) -> str:
+            if not args:
+                return ""
+            return " ORDER BY " + ", ".join(
+                [
+                    f'"{c["column"].lower()}" '
+                    f'{_REVERSED[c["direction"].lower()] if reverse else c["direction"].upper()}'
+                    for c in args
+                ]
             )
 
+        # Select the rows by position with LIMIT and OFFSET. OFFSET k still
+        # steps over k rows (walking the ordering index, if any), so the last N
+        # rows (a negative start) are instead read by walking the ordering
+        # backwards from the end, with LIMIT N, and put back in order.
+        limit = ""
+        reverse = False
+        if rows is not None:
+            start, stop = rows.start or 0, rows.stop
+            if start < 0 and stop is not None:
+                start, stop, _ = rows.indices(self._num_rows(partition))
+            if start < 0:
+                reverse = True
+                limit = f" LIMIT {-int(start)}"
+            else:
+                # SQLite accepts OFFSET only after a LIMIT, for which -1 means
+                # no limit.
+                if stop is not None:
+                    limit += f" LIMIT {max(0, int(stop) - start)}"
+                elif start and self.storage.dialect == "sqlite":
+                    limit += " LIMIT -1"
+                if start:
+                    limit += f" OFFSET {int(start)}"
+
+        def select(columns: Sequence[str]) -> str:
+            return ", ".join([f'"{c.lower()}"' for c in columns])
+
+        params: List[Any] = []
+        condition_sql = None
+        if filter is not None:
+            condition = filter.compile(_SQLExpression.column)
+            condition_sql, params = condition.render(self.storage.dialect)
+        if rows is None:
+            if condition_sql is not None:
+                where += f" AND {condition_sql}"
+            query = (
+                f'SELECT {select(req_cols)} FROM "{self.table_name}" '
+                f"{where}{order_by()}"
+            )
+        elif condition_sql is None and not reverse:
+            query = (
+                f'SELECT {select(req_cols)} FROM "{self.table_name}" '
+                f"{where}{order_by()}{limit}"
+            )
+        else:
+            # The filter applies to the rows selected by position, and rows
+            # read backwards are put back in order, so select those rows in a
+            # subquery, with the columns that the filter and the ordering need.
+            inner_cols = list(
+                dict.fromkeys(
+                    [
+                        *req_cols,
+                        *(sorted(filter.columns) if filter is not None else []),
+                        *[c["column"] for c in args],
+                    ]
+                )
+            )
+            query = (
+                f"SELECT {select(req_cols)} FROM ("
+                f'SELECT {select(inner_cols)} FROM "{self.table_name}" '
+                f"{where}{order_by(reverse)}{limit}"
+                f") AS selected_rows"
+            )
+            if condition_sql is not None:
+                query += f" WHERE {condition_sql}"
+            query += order_by()
+
+        target_schema = pyarrow.schema(
+            [schema.field(schema.get_field_index(name)) for name in req_cols]
+        )
+        return query, params, target_schema
+
+    def _num_rows(self, partition: Optional[int] = None) -> int:
+        "Count the rows of the dataset, or of one of its partitions"
+        where = f"WHERE _dataset_id={self.dataset_id}"
+        if partition is not None:
+            where += f" AND _partition_id={int(partition)}"
         with closing(self.storage.connect()) as conn:
             with conn.cursor() as cursor:
-                cursor.execute(query)
-                data = cursor.fetch_arrow_table()
+                cursor.execute(f'SELECT COUNT(*) FROM "{self.table_name}" {where}')
+                (num_rows,) = cursor.fetchone()
             conn.commit()
+        return int(num_rows)
 
-        # The database may have stored this in a coarser type, such as
-        # storing uint8 data as int16. Cast it to the original type.
-        # Additionally, back-convert lower case column names to their original names.
-        if lwr_upr_case_mapping := {c.lower(): c for c in req_cols if c != c.lower()}:
-            data = data.rename_columns(lwr_upr_case_mapping)
-        target_schema = pyarrow.schema(
-            [schema.field(schema.get_field_index(name)) for name in req_cols]
+    def _iter_batches(
+        self, query: str, params: List[Any], target_schema: pyarrow.Schema
+    ) -> Iterator[pyarrow.RecordBatch]:
+        # The connection stays open while the batches are consumed, and is
+        # closed when the generator is exhausted or closed.
+        with closing(self.storage.connect()) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params or None)
+                for batch in cursor.fetch_record_batch():
+                    # The database may have stored this in a coarser type, such
+                    # as storing uint8 data as int16. Cast it to the original
+                    # type, and back-convert lower case column names to their
+                    # original names.
+                    yield pyarrow.RecordBatch.from_arrays(
+                        [
+                            column.cast(field.type)
+                            for column, field in zip(batch.columns, target_schema)
+                        ],
+                        schema=target_schema,
+                    )
+            conn.commit()
+
+    def read_batches(
+        self, fields: Optional[List[str]] = None, partition: Optional[int] = None
+    ) -> pyarrow.RecordBatchReader:
+        """Stream the data from the database, batch by batch
+
+        The rows are fetched from the database as the batches are read, so
+        that memory use is bounded by the size of a batch, not of the result.
+
+        Parameters
+        ----------
+        fields : optional string to return the data in the specified field.
+        partition : optional int to return the data in the specified partition.
+
+        Returns
+        -------
+        A reader of record batches, cast to the original types.
+        """
+        query, params, target_schema = self._query(fields, partition)
+        return pyarrow.RecordBatchReader.from_batches(
+            target_schema, self._iter_batches(query, params, target_schema)
         )
 
-        return data.cast(target_schema)
+    def read_partition_batches(
+        self, partition: int, fields: Optional[List[str]] = None
+    ) -> pyarrow.RecordBatchReader:
+        """Stream the data of a given partition, batch by batch
+
+        Parameters
+        ----------
+        partition : int
+        fields : Optional[List[str]]
+            Optional list of field names to select. By default return all.
+
+        Returns
+        -------
+        A reader of record batches, cast to the original types.
+        """
+        return self.read_batches(fields=fields, partition=partition)
+
+    def _read_full_table_or_partition(
+        self, fields: Optional[List[str]] = None, partition: Optional[int] = None
+    ) -> pyarrow.Table:
+        """Read the data from the database
+
+        This is a helper function to read the data from the database. The result
+        is a pyarrow table containing rows either from the entire table or from a
+        specific partition. The retained columns are cast to the original type.
+
+        Parameters
+        ----------
+        fields : optional string to return the data in the specified field.
+        partition : optional int to return the data in the specified partition.
+
+        Returns
+        -------
+        The concatenated table as pyarrow table.
+        """
+
+        return self.read_batches(fields=fields, partition=partition).read_all()
 
     def read(self, fields: Optional[List[str]] = None) -> pandas.DataFrame:
         """Read the concatenated data from the entire table.
@@ -597,6 +794,162 @@ class SQLAdapter(Adapter[TableStructure]):
             fields=fields, partition=partition
         ).to_pandas()
 
+    def _read_subset(
+        self,
+        fields: Optional[List[str]],
+        partition: Optional[int],
+        rows: Optional[slice],
+        filter: Optional[TableFilter],
+    ) -> pandas.DataFrame:
+        query, params, target_schema = self._query(fields, partition, rows, filter)
+        try:
+            table = pyarrow.Table.from_batches(
+                self._iter_batches(query, params, target_schema), target_schema
+            )
+        except adbc_driver_manager.Error as err:
+            if filter is None:
+                raise
+            # For example, the filter compares a column with a value of
+            # another type.
+            raise ValueError(f"Cannot apply filter {str(filter)!r}: {err}")
+        return table.to_pandas()
+
+    def read_subset(
+        self,
+        fields: Optional[List[str]] = None,
+        rows: Optional[slice] = None,
+        filter: Optional[TableFilter] = None,
+    ) -> pandas.DataFrame:
+        """Read a subset of the rows of the entire table.
+
+        The rows are selected in the database, with LIMIT/OFFSET over the
+        ordering given by order_by_args and a parameterized WHERE clause.
+
+        Parameters
+        ----------
+        fields : Optional[List[str]]
+            Optional list of field names to select. By default return all.
+        rows : Optional[slice]
+            The rows to read, by position in the table (across partitions)
+        filter : Optional[TableFilter]
+            An expression that the rows must satisfy, applied after `rows`
+
+        Returns
+        -------
+        The rows as pandas dataframe.
+        """
+
+        return self._read_subset(fields, None, rows, filter)
+
+    def read_partition_subset(
+        self,
+        partition: int,
+        fields: Optional[List[str]] = None,
+        rows: Optional[slice] = None,
+        filter: Optional[TableFilter] = None,
+    ) -> pandas.DataFrame:
+        """Read a subset of the rows of a given partition.
+
+        Parameters
+        ----------
+        partition : int
+        fields : Optional[List[str]]
+            Optional list of field names to select. By default return all.
+        rows : Optional[slice]
+            The rows to read, by position in the partition
+        filter : Optional[TableFilter]
+            An expression that the rows must satisfy, applied after `rows`
+
+        Returns
+        -------
+        The rows as pandas dataframe.
+        """
+
+        return self._read_subset(fields, partition, rows, filter)
+
+
+class _SQLParameter:
+    "The position of a literal value in an _SQLExpression"
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+class _SQLExpression:
+    """A condition for a WHERE clause, compiled from a TableFilter
+
+    Literal values become query parameters; column names are quoted as
+    elsewhere in SQLAdapter (and were validated against the structure).
+    """
+
+    def __init__(self, parts: List[Union[str, _SQLParameter]]) -> None:
+        self.parts = parts
+
+    @classmethod
+    def column(cls, name: str) -> "_SQLExpression":
+        return cls([f'"{name.lower()}"'])
+
+    @staticmethod
+    def _parts(operand: Any) -> List[Union[str, _SQLParameter]]:
+        if isinstance(operand, _SQLExpression):
+            return operand.parts
+        return [_SQLParameter(operand)]
+
+    def _binary(self, operator: str, other: Any) -> "_SQLExpression":
+        return _SQLExpression(
+            ["(", *self.parts, f" {operator} ", *self._parts(other), ")"]
+        )
+
+    def __eq__(self, other: Any) -> "_SQLExpression":  # type: ignore[override]
+        return self._binary("=", other)
+
+    def __ne__(self, other: Any) -> "_SQLExpression":  # type: ignore[override]
+        return self._binary("<>", other)
+
+    def __lt__(self, other: Any) -> "_SQLExpression":
+        return self._binary("<", other)
+
+    def __le__(self, other: Any) -> "_SQLExpression":
+        return self._binary("<=", other)
+
+    def __gt__(self, other: Any) -> "_SQLExpression":
+        return self._binary(">", other)
+
+    def __ge__(self, other: Any) -> "_SQLExpression":
+        return self._binary(">=", other)
+
+    def __and__(self, other: Any) -> "_SQLExpression":
+        return self._binary("AND", other)
+
+    def __or__(self, other: Any) -> "_SQLExpression":
+        return self._binary("OR", other)
+
+    def __invert__(self) -> "_SQLExpression":
+        return _SQLExpression(["(NOT ", *self.parts, ")"])
+
+    def isin(self, values: List[Any]) -> "_SQLExpression":
+        if not values:
+            return _SQLExpression(["(1 = 0)"])
+        parts: List[Union[str, _SQLParameter]] = ["(", *self.parts, " IN ("]
+        for i, value in enumerate(values):
+            if i:
+                parts.append(", ")
+            parts.append(_SQLParameter(value))
+        return _SQLExpression([*parts, "))"])
+
+    def render(self, dialect: str) -> Tuple[str, List[Any]]:
+        "Return the SQL, with placeholders in the dialect's style, and the parameters"
+        text: List[str] = []
+        params: List[Any] = []
+        for part in self.parts:
+            if isinstance(part, _SQLParameter):
+                params.append(part.value)
+                # PostgreSQL numbers its placeholders.
+                text.append(f"${len(params)}" if dialect == "postgresql" else "?")
+            else:
+                text.append(part)
+        return "".join(text), params
+
 
 # Mapping between Arrow types and PostgreSQL column type name.
 ARROW_TO_PG_TYPES: dict[pyarrow.Field, str] = {
@@ -0,0 +1,182 @@
+import os
+import threading
+import time
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow
+
+from ..server.metrics import (
+    SQL_INGEST_BATCH_APPENDS,
+    SQL_INGEST_BATCH_ROWS,
+    SQL_INGEST_FLUSH_DURATION,
+    SQL_INGEST_LATENCY,
+)
+from ..storage import SQLStorage
+
+# Producers that stream data append a small batch of rows per event, and each
+# append used to be a transaction of its own. Appends to the same SQL table
+# now go through a buffer which commits them together (a "group commit"):
+#
+# - While one batch of appends is being written, the appends that arrive are
+#   collected, and then written together in a single ingest and transaction.
+# - An append returns only once its rows are committed, so an acknowledged
+#   append is durable, as before.
+# - The buffer waits up to `max_delay` seconds after the first append of a
+#   batch for more to arrive (by default it does not wait), unless the batch
+#   already holds `max_rows` rows or `max_bytes` bytes.
+#
+# These can be set with the environment variables TILED_SQL_INGEST_MAX_DELAY,
+# TILED_SQL_INGEST_MAX_ROWS, and TILED_SQL_INGEST_MAX_BYTES.
+DEFAULT_MAX_DELAY = float(os.getenv("TILED_SQL_INGEST_MAX_DELAY") or 0)
+DEFAULT_MAX_ROWS = int(os.getenv("TILED_SQL_INGEST_MAX_ROWS") or 100_000)
+DEFAULT_MAX_BYTES = int(os.getenv("TILED_SQL_INGEST_MAX_BYTES") or 64 * 1024**2)
+
+
+class _Append:
+    "One caller's rows, and the outcome of writing them"
+
+    def __init__(self, table: pyarrow.Table) -> None:
+        self.table = table
+        self.received = time.perf_counter()
+        self.error: Optional[BaseException] = None
+
+
+class _Batch:
+    "The appends written together in one transaction"
+
+    def __init__(self) -> None:
+        self.appends: List[_Append] = []
+        self.created = time.monotonic()
+        self.rows = 0
+        self.nbytes = 0
+        self.done = False
+
+
+class IngestBuffer:
+    """Commit concurrent appends to one SQL table together
+
+    Parameters
+    ----------
+    table_name : str
+    max_delay : float, optional
+        Seconds to wait after the first append of a batch for more appends
+    max_rows : int, optional
+        Write a batch without waiting once it holds this many rows
+    max_bytes : int, optional
+        Write a batch without waiting once it holds this many bytes
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.table_name = table_name
+        self.max_delay = max_delay
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self._condition = threading.Condition()
+        self._pending = _Batch()
+        self._flushing = False
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.table_name!r}, max_delay={self.max_delay}, "
+            f"max_rows={self.max_rows}, max_bytes={self.max_bytes})"
+        )
+
+    def _is_full(self, batch: _Batch) -> bool:
+        return batch.rows >= self.max_rows or batch.nbytes >= self.max_bytes
+
+    def append(self, storage: SQLStorage, table: pyarrow.Table) -> None:
+        """Append rows to the table, returning once they are committed
+
+        If writing the rows fails, the exception is raised here (and only to
+        the callers whose rows could not be written).
+        """
+        append = _Append(table)
+        with self._condition:
+            batch = self._pending
+            batch.appends.append(append)
+            batch.rows += table.num_rows
+            batch.nbytes += table.nbytes
+            self._condition.notify_all()
+            while not batch.done:
+                if self._flushing or batch is not self._pending:
+                    # Wait for the batch being written (maybe this one).
+                    self._condition.wait()
+                    continue
+                remaining = batch.created + self.max_delay - time.monotonic()
+                if remaining > 0 and not self._is_full(batch):
+                    self._condition.wait(remaining)
+                    continue
+                # Write this batch, with the appends collected so far.
+                self._pending = _Batch()
+                self._flushing = True
+                break
+        if not batch.done:
+            try:
+                self._flush(storage, batch)
+            finally:
+                with self._condition:
+                    batch.done = True
+                    self._flushing = False
+                    self._condition.notify_all()
+        SQL_INGEST_LATENCY.labels(storage.dialect).observe(
+            time.perf_counter() - append.received
+        )
+        if append.error is not None:
+            raise append.error
+
+    def _flush(self, storage: SQLStorage, batch: _Batch) -> None:
+        dialect = storage.dialect
+        SQL_INGEST_BATCH_APPENDS.labels(dialect).observe(len(batch.appends))
+        SQL_INGEST_BATCH_ROWS.labels(dialect).observe(batch.rows)
+        start = time.perf_counter()
+        try:
+            self._ingest(storage, [append.table for append in batch.appends])
+        except Exception as err:
+            if len(batch.appends) == 1:
+                batch.appends[0].error = err
+            else:
+                # Write the appends one by one, so that an append which cannot
+                # be written (e.g. one that violates a unique index) does not
+                # fail the others.
+                for append in batch.appends:
+                    try:
+                        self._ingest(storage, [append.table])
+                    except Exception as append_err:
+                        append.error = append_err
+        except BaseException as err:
+            for append in batch.appends:
+                append.error = err
+            raise
+        finally:
+            SQL_INGEST_FLUSH_DURATION.labels(dialect).observe(
+                time.perf_counter() - start
+            )
+
+    def _ingest(self, storage: SQLStorage, tables: List[pyarrow.Table]) -> None:
+        table = tables[0] if len(tables) == 1 else pyarrow.concat_tables(tables)
+        # ADBC writes the rows in bulk: with COPY on PostgreSQL, and with
+        # prepared inserts in one transaction on SQLite and DuckDB.
+        with closing(storage.connect()) as conn:
+            with conn.cursor() as cursor:
+                cursor.adbc_ingest(self.table_name, table, mode="append")
+            conn.commit()
+
+
+_buffers: Dict[Tuple[str, str], IngestBuffer] = {}
+_buffers_lock = threading.Lock()
+
+
+def get_ingest_buffer(storage: SQLStorage, table_name: str) -> IngestBuffer:
+    "Return the buffer for appends to a table, creating it on first use."
+    key = (storage.uri, table_name)
+    with _buffers_lock:
+        if key not in _buffers:
+            _buffers[key] = IngestBuffer(table_name)
+        return _buffers[key]
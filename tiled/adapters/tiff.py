@@ -1,6 +1,7 @@
 import builtins
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
+import numpy
 import tifffile
 from numpy._typing import NDArray
 
@@ -14,14 +15,36 @@ from ..structures.data_source import DataSource
 from ..type_aliases import JSON
 from ..utils import path_from_uri
 from .resource_cache import with_resource_cache
-from .sequence import IO_WORKERS, FileSequenceAdapter
+from .sequence import FileSequenceAdapter
 from .utils import force_reshape, init_adapter_from_catalog
 
 
+def memmap_or_read(tif: tifffile.TiffFile) -> NDArray[Any]:
+    """Memory-map the first series of a TIFF file, or decode it
+
+    An uncompressed series stored contiguously is memory-mapped, so that
+    slicing it reads only the pages of the file that hold the selected data.
+    Otherwise (e.g. if it is compressed or tiled) it is decoded whole.
+    """
+    series = tif.series[0]
+    if series.dataoffset is None:
+        return tif.asarray()
+    return numpy.memmap(
+        tif.filehandle.path,
+        dtype=series.dtype.newbyteorder(tif.byteorder),
+        mode="r",
+        offset=series.dataoffset,
+        shape=series.shape,
+    )
+
+
 class TiffAdapter(Adapter[ArrayStructure]):
     """
     Read a TIFF file.
 
+    Uncompressed, contiguous TIFF files are memory-mapped, so reading a slice
+    reads only the parts of the file that it covers.
+
     Examples
     --------
 
@@ -48,7 +71,7 @@ class TiffAdapter(Adapter[ArrayStructure]):
                 )
                 shape = tuple(from_file[0]["shape"])
             else:
-                arr = self._file.asarray()
+                arr = memmap_or_read(self._file)
                 shape = arr.shape
             structure = ArrayStructure(
                 shape=shape,
@@ -79,11 +102,7 @@ class TiffAdapter(Adapter[ArrayStructure]):
         return d
 
     def read(self, slice: NDSlice = NDSlice(...)) -> NDArray[Any]:
-        # TODO Is there support for reading less than the whole array
-        # if we only want a slice? I do not think that is possible with a
-        # single-page TIFF but I'm not sure. Certainly it *is* possible for
-        # multi-page TIFFs.
-        arr = self._file.asarray()
+        arr = memmap_or_read(self._file)
         arr = force_reshape(arr, self._structure.shape)
         return arr[slice] if slice else arr
 
@@ -95,7 +114,7 @@ class TiffAdapter(Adapter[ArrayStructure]):
         if sum(block) != 0:
             raise IndexError(block)
 
-        arr = self._file.asarray()
+        arr = memmap_or_read(self._file)
         arr = force_reshape(arr, self._structure.shape)
         if slice is not None:
             arr = arr[slice]
@@ -106,14 +125,17 @@ class TiffSequenceAdapter(FileSequenceAdapter):
     def _load_from_files(
         self, slice: Union[builtins.slice, int, Iterable[int]] = slice(None)
     ) -> NDArray[Any]:
+        if isinstance(slice, int):
+            return self._read_one(self.filepaths[slice])[None, ...]
         selected = (
             [self.filepaths[i] for i in slice]
             if isinstance(slice, Iterable)
             else self.filepaths[slice]
         )
-        # `ioworkers` lets tifffile read the selected files concurrently (I/O is
-        # the bottleneck for a large stack); default is serial (ioworkers=1).
-        return tifffile.TiffSequence(selected).asarray(ioworkers=IO_WORKERS)
+        # Read the selected files concurrently on the shared I/O pool (I/O is
+        # the bottleneck for a large stack).
+        return numpy.asarray(self._map_read(selected))
 
     def _read_one(self, filepath: str) -> NDArray[Any]:
-        return tifffile.imread(filepath)
+        with tifffile.TiffFile(filepath) as tif:
+            return memmap_or_read(tif)
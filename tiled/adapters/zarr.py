@@ -1,11 +1,26 @@
 # mypy: ignore-errors
+import asyncio
 import builtins
 import copy
+import dataclasses
+import math
 import os
 from importlib.metadata import version
-from typing import Any, Iterator, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 from urllib.parse import quote_plus, urljoin, urlparse
 
+import numpy
 import zarr
 from numpy._typing import NDArray
 from packaging.version import Version
@@ -31,17 +46,179 @@ from ..structures.data_source import Asset, DataSource
 from ..type_aliases import JSON, Chunks
 from ..utils import Conflicts, node_repr, path_from_uri
 from .array import ArrayAdapter
+from .object_cache import ObjectCache, get_object_cache
 
 ZARR_LIB_V2 = Version(version("zarr")) < Version("3")
 if ZARR_LIB_V2:
     from zarr.storage import DirectoryStore as LocalStore
     from zarr.storage import init_array as create_array
 else:
+    import anyio
+    import obstore
     from zarr import create_array
-    from zarr.storage import LocalStore, ObjectStore
+    from zarr.abc.store import (
+        ByteRequest,
+        OffsetByteRequest,
+        RangeByteRequest,
+        SuffixByteRequest,
+    )
+    from zarr.core.buffer import Buffer, BufferPrototype
+    from zarr.storage import LocalStore, ObjectStore, WrapperStore
 
 
 INLINED_DEPTH = int(os.getenv("TILED_HDF5_INLINED_CONTENTS_MAX_DEPTH", "7"))
+# Zarr fetches the chunks that a read touches concurrently, up to this many at
+# once (its "async.concurrency" setting, 10 by default). Object stores serve many
+# concurrent requests well, so this may be raised with TILED_ZARR_CONCURRENCY.
+if not ZARR_LIB_V2 and os.getenv("TILED_ZARR_CONCURRENCY"):
+    zarr.config.set({"async.concurrency": int(os.environ["TILED_ZARR_CONCURRENCY"])})
+
+
+@dataclasses.dataclass
+class ZarrStoragePolicy:
+    """How tiled lays out the Zarr arrays that it creates
+
+    A server sets a policy for its writable storage with the catalog's
+    `storage_policies` (keyed by mimetype, here "application/x-zarr"), and a
+    data source may override any of it with its `storage_policy` parameter.
+    By default, Zarr's own defaults are used.
+
+    Parameters
+    ----------
+    compressors : dict, optional
+        The compressor to use for each kind of data type, keyed by the NumPy
+        dtype kind ("f" for floats, "i" and "u" for integers, "b" for booleans,
+        etc.) or "default". Each is a dict naming the codec and its parameters,
+        e.g. {"name": "blosc", "cname": "zstd", "clevel": 5, "shuffle":
+        "bitshuffle"}, {"name": "zstd", "level": 3}, or {"name": "gzip",
+        "level": 5}, or null for no compression.
+    target_chunk_bytes : int, optional
+        Grow chunks that are smaller than half this size toward it, along the
+        leading dimensions first. Tiny chunks (e.g. one small detector frame
+        each) make for many small files or objects, each with its own overhead.
+    shard_bytes : int, optional
+        With Zarr v3, store chunks together in shards of about this size. Each
+        shard is then a block of the array, so it is written whole, while reads
+        of a slice still fetch only the chunks they need.
+    """
+
+    compressors: Dict[str, Optional[Dict[str, Any]]] = dataclasses.field(
+        default_factory=dict
+    )
+    target_chunk_bytes: Optional[int] = None
+    shard_bytes: Optional[int] = None
+
+    @classmethod
+    def from_json(cls, policy: Dict[str, Any]) -> "ZarrStoragePolicy":
+        fields = {field.name for field in dataclasses.fields(cls)}
+        if unknown := set(policy) - fields:
+            raise ValueError(
+                f"Unknown storage policy settings {sorted(unknown)} for Zarr; "
+                f"expected some of {sorted(fields)}."
+            )
+        for name, spec in policy.get("compressors", {}).items():
+            if spec is not None and spec.get("name") not in _COMPRESSOR_NAMES:
+                raise ValueError(
+                    f"Unsupported compressor {spec!r} for {name!r}; "
+                    f"expected a name in {sorted(_COMPRESSOR_NAMES)}."
+                )
+        return cls(**policy)
+
+    def chunk_shape(
+        self, shape: Tuple[int, ...], chunks: Tuple[int, ...], dtype: numpy.dtype
+    ) -> Tuple[int, ...]:
+        "Return the chunk shape to store, tuning tiny chunks"
+        if (
+            self.target_chunk_bytes is None
+            or 2 * _nbytes(chunks, dtype) >= self.target_chunk_bytes
+        ):
+            return chunks
+        return _grow(shape, chunks, dtype, self.target_chunk_bytes)
+
+    def shard_shape(
+        self, shape: Tuple[int, ...], chunks: Tuple[int, ...], dtype: numpy.dtype
+    ) -> Optional[Tuple[int, ...]]:
+        "Return the shard shape to store, or None for no sharding"
+        if ZARR_LIB_V2 or self.shard_bytes is None:
+            return None
+        shards = _grow(shape, chunks, dtype, self.shard_bytes)
+        return shards if shards != chunks else None
+
+    def compressor(self, dtype: numpy.dtype) -> Union[Dict[str, Any], None, str]:
+        "Return the compressor spec for a data type, or 'auto' for Zarr's default"
+        return self.compressors.get(dtype.kind, self.compressors.get("default", "auto"))
+
+
+_COMPRESSOR_NAMES = {"blosc", "zstd", "gzip"}
+_BLOSC_SHUFFLE_V2 = {"noshuffle": 0, "shuffle": 1, "bitshuffle": 2}
+
+
+def _nbytes(chunks: Tuple[int, ...], dtype: numpy.dtype) -> int:
+    return math.prod(chunks) * dtype.itemsize
+
+
+def _grow(
+    shape: Tuple[int, ...],
+    chunks: Tuple[int, ...],
+    dtype: numpy.dtype,
+    target_bytes: int,
+) -> Tuple[int, ...]:
+    """Grow chunks by whole multiples toward target_bytes, leading dimensions first.
+
+    Each dimension grows at most to cover the whole array.
+    """
+    grown = list(chunks)
+    nbytes = _nbytes(chunks, dtype)
+    if nbytes == 0:
+        return chunks
+    for axis, (size, chunk) in enumerate(zip(shape, chunks)):
+        if nbytes >= target_bytes:
+            break
+        factor = min(target_bytes // nbytes, math.ceil(size / chunk))
+        if factor > 1:
+            grown[axis] = chunk * factor
+            nbytes *= factor
+    return tuple(grown)
+
+
+def _regular_chunks(shape: Tuple[int, ...], chunks: Tuple[int, ...]) -> Chunks:
+    "Split each dimension into chunks of the given size, with any remainder last."
+    result = []
+    for size, chunk in zip(shape, chunks):
+        dim = [chunk] * (size // chunk)
+        if size % chunk:
+            dim.append(size % chunk)
+        result.append(tuple(dim))
+    return tuple(result)
+
+
+def _compressor_kwargs(spec: Union[Dict[str, Any], None, str]) -> Dict[str, Any]:
+    "Translate a compressor spec into keyword arguments for creating an array"
+    if spec == "auto":
+        return {}
+    if ZARR_LIB_V2:
+        import numcodecs
+
+        if spec is None:
+            return {"compressor": None}
+        params = {k: v for k, v in spec.items() if k != "name"}
+        if spec["name"] == "blosc":
+            if "shuffle" in params:
+                params["shuffle"] = _BLOSC_SHUFFLE_V2[params["shuffle"]]
+            return {"compressor": numcodecs.Blosc(**params)}
+        if spec["name"] == "zstd":
+            return {"compressor": numcodecs.Zstd(**params)}
+        return {"compressor": numcodecs.GZip(**params)}
+    from zarr.codecs import BloscCodec, GzipCodec, ZstdCodec
+
+    if spec is None:
+        return {"compressors": None}
+    codec_cls = {"blosc": BloscCodec, "zstd": ZstdCodec, "gzip": GzipCodec}[
+        spec["name"]
+    ]
+    return {
+        "compressors": [codec_cls(**{k: v for k, v in spec.items() if k != "name"})]
+    }
 
 
 class ZarrArrayAdapter(Adapter[ArrayStructure]):
@@ -69,11 +246,22 @@ class ZarrArrayAdapter(Adapter[ArrayStructure]):
     ) -> DataSource[ArrayStructure]:
         data_source = copy.deepcopy(data_source)  # Do not mutate caller input.
 
+        policy = ZarrStoragePolicy.from_json(
+            data_source.parameters.get("storage_policy") or {}
+        )
+        structure = data_source.structure
+        data_type = structure.data_type.to_numpy_dtype()
         # Zarr requires evenly-sized chunks within each dimension.
         # Use the first chunk along each dimension.
-        zarr_chunks = tuple(dim[0] for dim in data_source.structure.chunks)
-        shape = tuple(dim[0] * len(dim) for dim in data_source.structure.chunks)
-        data_type = data_source.structure.data_type.to_numpy_dtype()
+        requested_chunks = tuple(dim[0] for dim in structure.chunks)
+        zarr_chunks = policy.chunk_shape(structure.shape, requested_chunks, data_type)
+        shards = policy.shard_shape(structure.shape, zarr_chunks, data_type)
+        # The blocks of the array are its shards, if sharded, so that each
+        # block is written whole.
+        block_shape = shards or zarr_chunks
+        if block_shape != requested_chunks:
+            structure.chunks = _regular_chunks(structure.shape, block_shape)
+        shape = tuple(dim[0] * len(dim) for dim in structure.chunks)
         data_uri = urljoin(
             storage.uri + "/", "/".join(quote_plus(segment) for segment in path_parts)
         )
@@ -83,7 +271,12 @@ class ZarrArrayAdapter(Adapter[ArrayStructure]):
         else:
             zarr_store = ObjectStore(store=storage.get_obstore_location(data_uri))
 
-        create_array(zarr_store, shape=shape, chunks=zarr_chunks, dtype=data_type)
+        kwargs = _compressor_kwargs(policy.compressor(data_type))
+        if shards is not None:
+            kwargs["shards"] = shards
+        create_array(
+            zarr_store, shape=shape, chunks=zarr_chunks, dtype=data_type, **kwargs
+        )
 
         # Update data source to include the new asset
         data_source.assets.append(
@@ -116,6 +309,24 @@ class ZarrArrayAdapter(Adapter[ArrayStructure]):
         block_slice = block.slice_from_chunks(self.structure().chunks)
         return self._array[self._stencil[block_slice][slice or ...]]
 
+    if not ZARR_LIB_V2:
+        # With zarr-python 3, the server awaits these on its event loop instead
+        # of calling read and read_block from a worker thread. The chunks are
+        # fetched concurrently, with no thread held while waiting on the store.
+
+        async def read_async(self, slice: NDSlice = NDSlice(...)) -> NDArray[Any]:
+            "Read a slice of the array natively with Zarr's async API"
+            return await self._array.async_array.getitem(self._stencil[slice])
+
+        async def read_block_async(
+            self, block: NDBlock, slice: NDSlice = NDSlice(...)
+        ) -> NDArray[Any]:
+            "Read a block of the array natively with Zarr's async API"
+            block_slice = block.slice_from_chunks(self.structure().chunks)
+            return await self._array.async_array.getitem(
+                self._stencil[block_slice][slice or ...]
+            )
+
     def write(self, data: NDArray[Any], slice: NDSlice = NDSlice(...)) -> None:
         if slice:
             raise NotImplementedError
@@ -177,7 +388,9 @@ class ZarrArrayAdapter(Adapter[ArrayStructure]):
         new_chunks = []
         # Zarr has regularly-sized chunks, so no user input is required to
         # simply extend the existing pattern.
-        for chunk_size, size in zip(self._array.chunks, new_shape_tuple):
+        # The blocks of a sharded array are its shards.
+        block_shape = getattr(self._array, "shards", None) or self._array.chunks
+        for chunk_size, size in zip(block_shape, new_shape_tuple):
             dim = [chunk_size] * (size // chunk_size)
             if size % chunk_size:
                 dim.append(size % chunk_size)
@@ -270,6 +483,131 @@ class ZarrGroupAdapter(
         return depth <= INLINED_DEPTH
 
 
+if not ZARR_LIB_V2:
+    # Zarr reads these small documents when opening an array or group. They
+    # are not worth caching, and may be rewritten in place.
+    _METADATA_KEYS = {"zarr.json", ".zarray", ".zattrs", ".zgroup", ".zmetadata"}
+
+    def _byte_range_key(byte_range: Optional[ByteRequest]) -> str:
+        if byte_range is None:
+            return ""
+        if isinstance(byte_range, RangeByteRequest):
+            return f"{byte_range.start}-{byte_range.end}"
+        if isinstance(byte_range, OffsetByteRequest):
+            return f"{byte_range.offset}-"
+        if isinstance(byte_range, SuffixByteRequest):
+            return f"-{byte_range.suffix}"
+        raise TypeError(f"Unsupported byte range {byte_range!r}")
+
+    def _byte_range_option(byte_range: ByteRequest) -> Any:
+        "Express a byte range as the 'range' option of obstore.get"
+        if isinstance(byte_range, RangeByteRequest):
+            return (byte_range.start, byte_range.end)
+        if isinstance(byte_range, OffsetByteRequest):
+            return {"offset": byte_range.offset}
+        if isinstance(byte_range, SuffixByteRequest):
+            return {"suffix": byte_range.suffix}
+        raise TypeError(f"Unsupported byte range {byte_range!r}")
+
+    class CachingObjectStore(WrapperStore[ObjectStore]):
+        """Read the chunks of a Zarr object store through an ObjectCache
+
+        Parameters
+        ----------
+        store : zarr.storage.ObjectStore
+        cache : ObjectCache
+        location : str
+            Identifies the bucket (or container) in the cache, e.g. its URI
+        """
+
+        def __init__(self, store: ObjectStore, cache: ObjectCache, location: str):
+            super().__init__(store)
+            self._cache = cache
+            self._location = location
+
+        def _with_store(self, store: ObjectStore) -> "CachingObjectStore":
+            return type(self)(store, self._cache, self._location)
+
+        def __repr__(self) -> str:
+            return f"{type(self).__name__}({self._store!r}, {self._cache!r})"
+
+        async def get(
+            self,
+            key: str,
+            prototype: BufferPrototype,
+            byte_range: Optional[ByteRequest] = None,
+        ) -> Optional[Buffer]:
+            if key.rsplit("/", 1)[-1] in _METADATA_KEYS:
+                return await self._store.get(key, prototype, byte_range)
+            range_key = _byte_range_key(byte_range)
+            cached = None
+            if not self._cache.revalidate:
+                data = await anyio.to_thread.run_sync(
+                    self._cache.get, self._location, key, range_key
+                )
+                if data is not None:
+                    return prototype.buffer.from_bytes(data)
+            else:
+                cached = await anyio.to_thread.run_sync(
+                    self._cache.lookup, self._location, key, range_key
+                )
+            options: Dict[str, Any] = {}
+            if byte_range is not None:
+                options["range"] = _byte_range_option(byte_range)
+            if cached is not None and cached[0]:
+                # The store sends the data only if the object has changed.
+                options["if_none_match"] = cached[0]
+            try:
+                result = await obstore.get_async(
+                    self._store.store, key, options=options
+                )
+            except obstore.exceptions.NotModifiedError:
+                _, data = cached
+                self._cache.record_hit(data)
+                return prototype.buffer.from_bytes(data)
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                return None
+            except obstore.exceptions.NotSupportedError:
+                # Some stores (Azure) do not support suffix ranges, which the
+                # wrapped store works around without caching.
+                return await self._store.get(key, prototype, byte_range)
+            data = await result.bytes_async()
+            if self._cache.revalidate:
+                self._cache.record_miss()
+            # Store the data under the ETag of the response that carried it,
+            # which cannot be that of an older version of the object. Not
+            # every store reports an ETag, and without one the data cannot be
+            # revalidated.
+            etag = result.meta["e_tag"]
+            if etag is not None or not self._cache.revalidate:
+                await anyio.to_thread.run_sync(
+                    self._cache.put, self._location, key, range_key, etag, data
+                )
+            return prototype.buffer.from_bytes(data)
+
+        async def get_partial_values(
+            self,
+            prototype: BufferPrototype,
+            key_ranges: Iterable[Tuple[str, Optional[ByteRequest]]],
+        ) -> List[Optional[Buffer]]:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.get(key, prototype, byte_range)
+                        for key, byte_range in key_ranges
+                    )
+                )
+            )
+
+        async def set(self, key: str, value: Buffer) -> None:
+            await self._store.set(key, value)
+            await anyio.to_thread.run_sync(self._cache.invalidate, self._location, key)
+
+        async def delete(self, key: str) -> None:
+            await self._store.delete(key)
+            await anyio.to_thread.run_sync(self._cache.invalidate, self._location, key)
+
+
 class ZarrAdapter:
     @classmethod
     def from_catalog(
@@ -292,6 +630,8 @@ class ZarrAdapter:
             storage = cast(ObjectStorage, get_storage(uri))
             _, _, prefix = storage.parse_blob_uri(uri)
             zarr_store = ObjectStore(store=storage.get_obstore_location())
+            if (cache := get_object_cache()) is not None:
+                zarr_store = CachingObjectStore(zarr_store, cache, storage.uri)
             # zarr_obj = zarr.open(store=zarr_store)
 
             if is_container_type:
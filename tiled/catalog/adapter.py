@@ -203,6 +203,7 @@ class Context:
         storage_pool_size=5,
         storage_max_overflow=10,
         webhook_secret_keys: Optional[List[str]] = None,
+        storage_policies: Optional[Dict[str, dict]] = None,
     ):
         self.engine = get_database_engine(database_settings)
         self.database_settings = database_settings
@@ -248,6 +249,9 @@ class Context:
         )
         self.adapters_by_mimetype = merged_adapters_by_mimetype
         self.cache_config = cache_config
+        # Default layout settings for data written by tiled, keyed by the
+        # mimetype of the data source, e.g. {"application/x-zarr": {...}}.
+        self.storage_policies = storage_policies or {}
         self.webhook_secret_keys: List[str] = webhook_secret_keys or []
         self.webhook_dispatcher = None
 
@@ -273,7 +277,12 @@ class Context:
         self.streaming_cache = None
         if self.cache_config:
             uri = self.cache_config.get("uri")
-            if self.cache_config.get("sentinels") or (uri and uri.startswith("redis")):
+            if self.cache_config.get("datastore"):
+                # Explicitly configured, e.g. "redis-streams"
+                pass
+            elif self.cache_config.get("sentinels") or (
+                uri and uri.startswith("redis")
+            ):
                 self.cache_config["datastore"] = "redis"
             elif uri and uri.startswith("memory"):
                 self.cache_config["datastore"] = "memory"
@@ -634,6 +643,26 @@ class CatalogNodeAdapter:
             "the readable storage area for this server."
         )
 
+    async def _infer_properties(self, adapter_cls, data_source):
+        """Add the properties that an adapter derives from an external data source's files.
+
+        Adapters may define a classmethod `infer_properties(data_source)` that
+        inspects the files once, at registration, and returns properties to
+        record alongside the data source -- e.g. per-file geometry that spares
+        opening every file on later reads. Files outside the readable storage
+        are not inspected.
+        """
+        infer_properties = getattr(adapter_cls, "infer_properties", None)
+        if infer_properties is None:
+            return data_source.properties
+        try:
+            for asset in data_source.assets:
+                self._ensure_uri_within_readable_storage(asset.data_uri)
+        except RuntimeError:
+            return data_source.properties
+        inferred = await anyio.to_thread.run_sync(infer_properties, data_source)
+        return {**data_source.properties, **inferred}
+
     async def get_adapter(self):
         (data_source,) = await self.data_sources(include_assets=True)
         try:
@@ -718,9 +747,11 @@ class CatalogNodeAdapter:
         # loads the whole block along the stacking axis and applies any
         # within-block slice AFTER, to the already-loaded data. Convert the block
         # to the equivalent leading-axis slice here (pure; uses structure.chunks).
+        # Blocks along other axes (e.g. of an array chunked in two dimensions)
+        # are left to the full adapter.
         if block is not None:
             if any(block[1:]):
-                raise IndexError(block)
+                return None
             slice = block.slice_from_chunks(structure.chunks)[0]
 
         # File count = number of numbered "data_uris" assets, NOT len(chunks[0]):
@@ -954,6 +985,13 @@ class CatalogNodeAdapter:
                             ),
                         )
                     adapter_cls = STORAGE_ADAPTERS_BY_MIMETYPE[data_source.mimetype]
+                    # The server's storage policy for this mimetype, if any,
+                    # with any settings given by the data source taking precedence.
+                    if data_source.mimetype in self.context.storage_policies:
+                        data_source.parameters["storage_policy"] = {
+                            **self.context.storage_policies[data_source.mimetype],
+                            **data_source.parameters.get("storage_policy", {}),
+                        }
                     # Choose writable storage. Use the first writable storage item
                     # with a scheme that is supported by this adapter.
                     # For back-compat, if an adapter does not declare `supported_storage`
@@ -977,6 +1015,9 @@ class CatalogNodeAdapter:
                         data_source,
                         await self.path_segments() + [key],
                     )
+                    # The storage policy applies to the creation of the
+                    # storage; it is not an argument for reading it back.
+                    data_source.parameters.pop("storage_policy", None)
                 else:
                     if data_source.mimetype not in self.context.adapters_by_mimetype:
                         raise HTTPException(
@@ -986,6 +1027,10 @@ class CatalogNodeAdapter:
                                 "is not one that the Tiled server knows how to read."
                             ),
                         )
+                    data_source.properties = await self._infer_properties(
+                        self.context.adapters_by_mimetype[data_source.mimetype],
+                        data_source,
+                    )
 
                 if data_source.structure is None:
                     structure_id = None
@@ -1817,6 +1862,16 @@ class CatalogContainerAdapter(CatalogNodeAdapter):
         return {"type": "container-schema", "version": 1}
 
 
+def _read_natively(adapter, method):
+    """Return an adapter's read method, preferring its async variant if any
+
+    Adapters that can read on the server's event loop (e.g. Zarr with
+    zarr-python 3) provide `read_async` and `read_block_async`, which are
+    awaited directly instead of running the sync method in a worker thread.
+    """
+    return getattr(adapter, f"{method}_async", None) or getattr(adapter, method)
+
+
 class CatalogArrayAdapter(CatalogNodeAdapter):
     async def read(self, *args, **kwargs):
         if not self.node.data_sources:
@@ -1830,19 +1885,33 @@ class CatalogArrayAdapter(CatalogNodeAdapter):
             slice_ = args[0] if args else kwargs.get("slice", ...)
             adapter = await self._get_lazy_adapter(slice=slice_)
             if adapter is not None:
-                return await ensure_awaitable(adapter.read, *args, **kwargs)
-        return await ensure_awaitable((await self.get_adapter()).read, *args, **kwargs)
+                return await ensure_awaitable(
+                    _read_natively(adapter, "read"), *args, **kwargs
+                )
+        return await ensure_awaitable(
+            _read_natively(await self.get_adapter(), "read"), *args, **kwargs
+        )
 
     async def read_block(self, *args, **kwargs):
         block = args[0] if args else kwargs.get("block")
         if block is not None:
             adapter = await self._get_lazy_adapter(block=block)
             if adapter is not None:
-                return await ensure_awaitable(adapter.read_block, *args, **kwargs)
+                return await ensure_awaitable(
+                    _read_natively(adapter, "read_block"), *args, **kwargs
+                )
         return await ensure_awaitable(
-            (await self.get_adapter()).read_block, *args, **kwargs
+            _read_natively(await self.get_adapter(), "read_block"), *args, **kwargs
         )
 
+    async def read_stored_block(self, block):
+        adapter = await self._get_lazy_adapter(block=block)
+        if adapter is None:
+            adapter = await self.get_adapter()
+        if not hasattr(adapter, "read_stored_block"):
+            return None
+        return await ensure_awaitable(adapter.read_stored_block, block)
+
     async def _stream(self, media_type, entry, body, shape, block=None, offset=None):
         sequence = await self.context.streaming_cache.incr_seq(self.node.id)
         metadata = {
@@ -2091,6 +2160,35 @@ class CatalogTableAdapter(CatalogNodeAdapter):
             (await self.get_adapter()).read_partition, *args, **kwargs
         )
 
+    async def _read_optional(self, method, *args):
+        # Forward a read that only some adapters support, returning None for
+        # the others so that the caller falls back to read or read_partition.
+        adapter = await self.get_adapter()
+        if not hasattr(adapter, method):
+            return None
+        return await ensure_awaitable(getattr(adapter, method), *args)
+
+    async def read_subset(self, *args):
+        return await self._read_optional("read_subset", *args)
+
+    async def read_partition_subset(self, *args):
+        return await self._read_optional("read_partition_subset", *args)
+
+    async def read_table(self, *args):
+        return await self._read_optional("read_table", *args)
+
+    async def read_partition_table(self, *args):
+        return await self._read_optional("read_partition_table", *args)
+
+    async def read_partition_ipc(self, *args):
+        return await self._read_optional("read_partition_ipc", *args)
+
+    async def read_batches(self, *args):
+        return await self._read_optional("read_batches", *args)
+
+    async def read_partition_batches(self, *args):
+        return await self._read_optional("read_partition_batches", *args)
+
     async def write_partition(self, media_type, deserializer, entry, body, partition):
         if self.context.streaming_cache:
             await self._stream(media_type, entry, body, partition, False)
@@ -2459,6 +2557,7 @@ def in_memory(
     top_level_access_blob=None,
     cache_config=None,
     webhook_secret_keys: Optional[List[str]] = None,
+    storage_policies: Optional[Dict[str, dict]] = None,
 ):
     if not named_memory:
         uri = "sqlite:///:memory:"
@@ -2477,6 +2576,7 @@ def in_memory(
         top_level_access_blob=top_level_access_blob,
         cache_config=cache_config,
         webhook_secret_keys=webhook_secret_keys,
+        storage_policies=storage_policies,
     )
 
 
@@ -2543,6 +2643,7 @@ def from_uri(
     storage_pool_size=5,
     catalog_max_overflow=10,
     storage_max_overflow=10,
+    storage_policies: Optional[Dict[str, dict]] = None,
 ):
     uri = ensure_specified_sql_driver(uri)
     if init_if_not_exists:
@@ -2581,6 +2682,7 @@ def from_uri(
         storage_pool_size=storage_pool_size,
         storage_max_overflow=storage_max_overflow,
         webhook_secret_keys=webhook_secret_keys,
+        storage_policies=storage_policies,
     )
     node = RootNode(metadata, specs, top_level_access_blob)
     mount_path = (
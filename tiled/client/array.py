@@ -23,7 +23,7 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
-    from .stream import ArraySubscription
+    from .stream import ArraySubscription, AsyncSubscription
 
 
 class _DaskArrayClient(BaseClient):
@@ -523,6 +523,40 @@ class _DaskArrayClient(BaseClient):
 
         return ArraySubscription(self.context, self.path_parts, executor)
 
+    def subscribe_async(
+        self,
+        start: Optional[int] = None,
+        max_size: int = 1_000_000,
+    ) -> "AsyncSubscription":
+        """
+        Subscribe to streaming updates about this array, on an asyncio event loop.
+
+        Parameters
+        ----------
+        start : int, optional
+            By default, the stream begins from the most recent update. Use this
+            parameter to replay from some earlier update. Use 1 to start from
+            the first item, 0 to start from as far back as available.
+        max_size : int, optional
+            Maximum size in bytes for incoming WebSocket messages. Default is 1 MB.
+
+        Returns
+        -------
+        subscription : AsyncSubscription
+
+        Examples
+        --------
+
+        >>> async for update in x.subscribe_async():
+        ...     print(update)
+        """
+        # Keep this import here to defer the websockets import until/unless needed.
+        from .stream import AsyncSubscription
+
+        return AsyncSubscription(
+            self.context, self.path_parts, start=start, max_size=max_size
+        )
+
 
 # Subclass with a public class that adds the dask-specific methods.
 
@@ -43,7 +43,7 @@ if TYPE_CHECKING:
     import pandas
     import pyarrow
 
-    from .stream import ContainerSubscription
+    from .stream import AsyncSubscription, ContainerSubscription
 
 
 class Container(BaseClient, collections.abc.Mapping, IndexersMixin):
@@ -768,9 +768,10 @@ class Container(BaseClient, collections.abc.Mapping, IndexersMixin):
 
         # Ditto for structure
         if "structure" in document:
-            item["attributes"]["structure"] = STRUCTURE_TYPES[structure_family](
+            structure = STRUCTURE_TYPES[structure_family].from_json(
                 document.pop("structure")
             )
+            item["attributes"]["structure"] = structure
 
         # And for data sources
         if "data_sources" in document:
@@ -914,6 +915,9 @@ class Container(BaseClient, collections.abc.Mapping, IndexersMixin):
             specs=specs,
             access_tags=access_tags,
         )
+        # Write the blocks of the array as the server stores them, which may
+        # differ from the requested chunks, following its storage policy.
+        chunks = client.structure().chunks
         chunked = any(len(dim) > 1 for dim in chunks)
         if not chunked:
             client.write(
@@ -1323,6 +1327,44 @@ class Container(BaseClient, collections.abc.Mapping, IndexersMixin):
             self.structure_clients,
         )
 
+    def subscribe_async(
+        self,
+        start: Optional[int] = None,
+        max_size: int = 1_000_000,
+    ) -> "AsyncSubscription":
+        """
+        Subscribe to streaming updates about this container, on an asyncio event loop.
+
+        Parameters
+        ----------
+        start : int, optional
+            By default, the stream begins from the most recent update. Use this
+            parameter to replay from some earlier update. Use 1 to start from
+            the first item, 0 to start from as far back as available.
+        max_size : int, optional
+            Maximum size in bytes for incoming WebSocket messages. Default is 1 MB.
+
+        Returns
+        -------
+        subscription : AsyncSubscription
+
+        Examples
+        --------
+
+        >>> async for update in x.subscribe_async():
+        ...     print(update)
+        """
+        # Keep this import here to defer the websockets import until/unless needed.
+        from .stream import AsyncSubscription
+
+        return AsyncSubscription(
+            self.context,
+            self.path_parts,
+            structure_clients=self.structure_clients,
+            start=start,
+            max_size=max_size,
+        )
+
 
 def _queries_to_params(*queries):
     "Compute GET params from the queries."
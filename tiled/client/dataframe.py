@@ -21,11 +21,23 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
-    from .stream import TableSubscription
+    from .stream import AsyncSubscription, TableSubscription
 
 _EXTRA_CHARS_PER_ITEM = len("&column=")
 
 
+def _rows_param(rows):
+    "Encode a slice of rows as the 'start:stop' query parameter"
+    if not isinstance(rows, slice):
+        raise TypeError(f"rows must be a slice, not {type(rows).__name__}")
+    if rows.step not in (None, 1) or (rows.stop is not None and rows.stop < 0):
+        raise ValueError(
+            "rows must be a slice with no step, and a non-negative stop "
+            "(a negative start counts from the end)"
+        )
+    return f"{'' if rows.start is None else rows.start}:{'' if rows.stop is None else rows.stop}"
+
+
 class _DaskDataFrameClient(BaseClient):
     "Client-side wrapper around an dataframe-like that returns dask dataframes"
 
@@ -108,7 +120,7 @@ class _DaskDataFrameClient(BaseClient):
     def columns(self):
         return self.structure().columns
 
-    def _get_partition(self, partition, columns):
+    def _get_partition(self, partition, columns, rows=None, filter=None):
         """
         Fetch the actual data for one partition in a partitioned (dask) dataframe.
 
@@ -116,6 +128,10 @@ class _DaskDataFrameClient(BaseClient):
         """
         URL_PATH = self.item["links"]["partition"]
         params = {**parse_qs(urlparse(URL_PATH).query), "partition": partition}
+        if rows is not None:
+            params["rows"] = _rows_param(rows)
+        if filter is not None:
+            params["filter"] = filter
         url_length_for_get_request = len(URL_PATH) + sum(
             _EXTRA_CHARS_PER_ITEM + len(column) for column in (columns or ())
         )
@@ -149,11 +165,14 @@ class _DaskDataFrameClient(BaseClient):
             ps.advance()
         return deserialize_arrow(content)
 
-    def read_partition(self, partition, columns=None):
+    def read_partition(self, partition, columns=None, *, rows=None, filter=None):
         """
         Access one partition in a partitioned (dask) dataframe.
 
-        Optionally select a subset of the columns.
+        Optionally select a subset of the columns, a range of rows (a slice,
+        by position in the partition), and the rows matching a filter
+        expression, such as "x > 3 and name in ['a', 'b']". The server reads
+        only what is selected, where the storage format allows.
         """
         structure = self.structure()
         npartitions = structure.npartitions
@@ -163,14 +182,16 @@ class _DaskDataFrameClient(BaseClient):
         if columns is not None:
             meta = meta[columns]
         return dask.dataframe.from_delayed(
-            [dask.delayed(self._get_partition)(partition, columns)],
+            [dask.delayed(self._get_partition)(partition, columns, rows, filter)],
             meta=meta,
-            divisions=(None,) * (1 + npartitions),
+            divisions=(None, None),
         )
 
-    def read(self, columns=None):
+    def read(self, columns=None, *, filter=None):
         """
-        Access the entire DataFrame. Optionally select a subset of the columns.
+        Access the entire DataFrame. Optionally select a subset of the columns,
+        and the rows matching a filter expression, such as
+        "x > 3 and name in ['a', 'b']".
 
         The result will be internally partitioned with dask.
         """
@@ -183,7 +204,7 @@ class _DaskDataFrameClient(BaseClient):
             meta = meta[columns]
 
         ddf = dask.dataframe.from_map(
-            functools.partial(self._get_partition, columns=columns),
+            functools.partial(self._get_partition, columns=columns, filter=filter),
             range(structure.npartitions),
             meta=meta,
             label=label,
@@ -332,6 +353,40 @@ class _DaskDataFrameClient(BaseClient):
 
         return TableSubscription(self.context, self.path_parts, executor)
 
+    def subscribe_async(
+        self,
+        start: Optional[int] = None,
+        max_size: int = 1_000_000,
+    ) -> "AsyncSubscription":
+        """
+        Subscribe to streaming updates about this table, on an asyncio event loop.
+
+        Parameters
+        ----------
+        start : int, optional
+            By default, the stream begins from the most recent update. Use this
+            parameter to replay from some earlier update. Use 1 to start from
+            the first item, 0 to start from as far back as available.
+        max_size : int, optional
+            Maximum size in bytes for incoming WebSocket messages. Default is 1 MB.
+
+        Returns
+        -------
+        subscription : AsyncSubscription
+
+        Examples
+        --------
+
+        >>> async for update in x.subscribe_async():
+        ...     print(update)
+        """
+        # Keep this import here to defer the websockets import until/unless needed.
+        from .stream import AsyncSubscription
+
+        return AsyncSubscription(
+            self.context, self.path_parts, start=start, max_size=max_size
+        )
+
 
 # Subclass with a public class that adds the dask-specific methods.
 
@@ -349,16 +404,22 @@ class DaskDataFrameClient(_DaskDataFrameClient):
 class DataFrameClient(_DaskDataFrameClient):
     "Client-side wrapper around a dataframe-like that returns in-memory dataframes"
 
-    def read_partition(self, partition, columns=None):
+    def read_partition(self, partition, columns=None, *, rows=None, filter=None):
         """
-        Access one partition of the DataFrame. Optionally select a subset of the columns.
+        Access one partition of the DataFrame. Optionally select a subset of the columns,
+        a range of rows (a slice), and the rows matching a filter expression.
         """
-        return super().read_partition(partition, columns).compute()
+        return (
+            super()
+            .read_partition(partition, columns, rows=rows, filter=filter)
+            .compute()
+        )
 
-    def read(self, columns=None):
+    def read(self, columns=None, *, filter=None):
         """
-        Access the entire DataFrame. Optionally select a subset of the columns.
+        Access the entire DataFrame. Optionally select a subset of the columns,
+        and the rows matching a filter expression.
         """
-        ddf = super().read(columns)
+        ddf = super().read(columns, filter=filter)
         with self.context.tracking_progress(total=ddf.npartitions):
             return ddf.compute()
@@ -208,6 +208,43 @@ class RaggedClient(BaseClient):
 
         return from_zipped_buffers(buffer=content, structure=self.structure())
 
+    def read_block(
+        self, block: Union[int, tuple[int, ...]], slice: Any | None = None
+    ) -> ragged.array:
+        """Read one block (chunk along the first dimension), or a slice of it.
+
+        Reading block by block pages through a large array without requesting
+        it all at once.
+
+        Parameters
+        ----------
+        block: int or tuple[int, ...]
+            The block to read, as in ``write_block``.
+        slice: Any, optional
+            A numpy-style slice, applied within the block.
+        """
+        block_tuple = (block,) if isinstance(block, int) else tuple(block)
+        block_tuple += (0,) * (self.ndim - len(block_tuple))
+        url_path = self.item["links"]["block"]
+        url_params: dict[str, Any] = {
+            **parse_qs(urlparse(url_path).query),
+            "block": ",".join(map(str, block_tuple)),
+        }
+        if slice is not None:
+            url_params.update(**params_from_slice(slice))
+
+        for attempt in retry_context():
+            with attempt:
+                content = handle_error(
+                    self.context.http_client.get(
+                        url_path,
+                        headers={"Accept": "application/zip"},
+                        params=url_params,
+                    )
+                ).read()
+
+        return from_zipped_buffers(buffer=content, structure=self.structure())
+
     def __getitem__(self, _slice: Any) -> ragged.array:
         """
         Access the array with slicing logic.
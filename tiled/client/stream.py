@@ -1,11 +1,12 @@
 import abc
 import concurrent.futures
+import functools
 import inspect
 import logging
 import sys
 import threading
 import weakref
-from typing import Any, Callable, Generic, List, Optional, TypeVar
+from typing import Any, AsyncIterator, Callable, Generic, List, Optional, TypeVar, Union
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -55,7 +56,27 @@ RECEIVE_TIMEOUT = 0.1  # seconds
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["Subscription"]
+__all__ = ["AsyncSubscription", "Subscription"]
+
+
+def _stream_uri(context: Context, segments: List[str]) -> httpx.URL:
+    "Build the websocket URI for streaming updates from a node."
+    params = {"envelope_format": "msgpack"}
+    scheme = "wss" if context.api_uri.scheme == "https" else "ws"
+    node_path = "/".join(f"/{segment}" for segment in segments)
+    uri_path = "/api/v1/stream/single" + node_path
+    return httpx.URL(
+        str(context.api_uri.copy_with(scheme=scheme, path=uri_path)),
+        params=params,
+    )
+
+
+def _is_message_too_big(exc: Exception) -> bool:
+    "Check whether the client closed the connection because a message exceeded max_size."
+    # The client sends close code 1009 when received message exceeds max_size
+    if isinstance(exc, websockets.exceptions.ConnectionClosedError):
+        return bool(getattr(exc, "sent", None)) and exc.sent.code == 1009
+    return False
 
 
 class _TestClientWebsocketWrapper:
@@ -145,6 +166,75 @@ class _RegularWebsocketWrapper:
         self._websocket.close()
 
 
+class _AsyncTestClientWebsocketWrapper:
+    """Wrapper for TestClient websockets, for use on an event loop."""
+
+    def __init__(self, http_client, uri: httpx.URL):
+        # TestClient websockets block, so run them on worker threads.
+        # This is only used for ASGI (tests), where that does not matter.
+        self._wrapper = _TestClientWebsocketWrapper(http_client, uri)
+
+    async def connect(
+        self,
+        api_key: Optional[str],
+        start: Optional[int] = None,
+        max_size: int = 1_000_000,
+    ):
+        """Connect to the websocket."""
+        await anyio.to_thread.run_sync(
+            functools.partial(self._wrapper.connect, api_key, start, max_size=max_size)
+        )
+
+    async def recv(self):
+        """Receive data from websocket, or None if it was closed normally."""
+        return await anyio.to_thread.run_sync(self._wrapper.recv)
+
+    async def close(self):
+        """Close websocket connection."""
+        await anyio.to_thread.run_sync(self._wrapper.close)
+
+
+class _AsyncWebsocketWrapper:
+    """Wrapper for asyncio websockets."""
+
+    def __init__(self, uri: httpx.URL):
+        self._uri = uri
+        self._websocket = None
+
+    async def connect(
+        self,
+        api_key: Optional[str],
+        start: Optional[int] = None,
+        max_size: int = 1_000_000,
+    ):
+        """Connect to the websocket."""
+        from websockets.asyncio.client import connect as async_connect
+
+        params = self._uri.params
+        headers = {}
+        if api_key:
+            headers["Authorization"] = f"Apikey {api_key}"
+        if start is not None:
+            params = params.set("start", start)
+        self._websocket = await async_connect(
+            str(self._uri.copy_with(params=params)),
+            additional_headers=headers,
+            max_size=max_size,
+        )
+
+    async def recv(self):
+        """Receive data from websocket, or None if it was closed normally."""
+        try:
+            return await self._websocket.recv()
+        except websockets.exceptions.ConnectionClosedOK:
+            return None
+
+    async def close(self):
+        """Close websocket connection."""
+        if self._websocket is not None:
+            await self._websocket.close()
+
+
 class CallbackRegistry(Generic[T]):
     """
     Distribute updates to user-provided callback functions.
@@ -278,14 +368,8 @@ class Subscription(abc.ABC):
         self._executor = executor or concurrent.futures.ThreadPoolExecutor(
             max_workers=1
         )
-        params = {"envelope_format": "msgpack"}
-        scheme = "wss" if context.api_uri.scheme == "https" else "ws"
         self._node_path = "/".join(f"/{segment}" for segment in segments)
-        uri_path = "/api/v1/stream/single" + self._node_path
-        self._uri = httpx.URL(
-            str(context.api_uri.copy_with(scheme=scheme, path=uri_path)),
-            params=params,
-        )
+        self._uri = _stream_uri(context, segments)
         self._schema = None
         self._connected_event = threading.Event()
         self._disconnect_lock = threading.Lock()
@@ -336,15 +420,7 @@ class Subscription(abc.ABC):
                 self._connect(start_from, max_size=max_size)
                 self._receive()
             except (websockets.exceptions.ConnectionClosedError, OSError) as exc:
-                # Check if it's a "message too big" error
-                # The client sends close code 1009 when received message exceeds max_size
-                close_code = None
-                if isinstance(exc, websockets.exceptions.ConnectionClosedError):
-                    close_code = (
-                        exc.sent.code if hasattr(exc, "sent") and exc.sent else None
-                    )
-
-                if close_code == 1009:  # MESSAGE_TOO_BIG
+                if _is_message_too_big(exc):
                     logger.error(
                         f"Message exceeds max_size ({max_size} bytes). "
                         f"Subscription will disconnect permanently. "
@@ -640,6 +716,198 @@ class TableSubscription(Subscription):
         self.new_data.process(update)
 
 
+class AsyncSubscription:
+    """
+    Subscribe to streaming updates from a node, on an asyncio event loop.
+
+    Unlike Subscription, this runs no threads and invokes no callbacks.
+    Iterate over it to receive updates. Any number of AsyncSubscriptions can
+    share one event loop.
+
+    If the connection is lost, it reconnects and resumes from the update after
+    the last one received. Iteration ends when the stream is closed by the
+    producer or when the AsyncSubscription is closed.
+
+    Parameters
+    ----------
+    context : tiled.client.Context
+        Provides connection to Tiled server
+    segments : list[str]
+        Path to node of interest, given as a list of path segments
+    structure_clients : dict, optional
+        Used to construct clients for children created in a container
+    start : int, optional
+        By default, the stream begins from the most recent update. Use this
+        parameter to replay from some earlier update. Use 1 to start from
+        the first item, 0 to start from as far back as available (which may
+        be later than the first item), or any positive integer to start
+        from a specific point in the sequence.
+    max_size : int, optional
+        Maximum size in bytes for incoming WebSocket messages. Default is 1 MB.
+        Increase this if you expect to receive large messages.
+
+    Examples
+    --------
+
+    >>> async for update in node.subscribe_async():
+    ...     print(update.sequence)
+
+    Watch many nodes on one event loop.
+
+    >>> async def watch(node):
+    ...     async for update in node.subscribe_async():
+    ...         print(node.uri, update.sequence)
+    >>> await asyncio.gather(*(watch(node) for node in nodes))
+    """
+
+    def __init__(
+        self,
+        context: Context,
+        segments: List[str] = None,
+        structure_clients: dict = None,
+        start: Optional[int] = None,
+        max_size: int = 1_000_000,
+    ):
+        segments = segments or ["/"]
+        self._context = context
+        self._segments = segments
+        self.structure_clients = structure_clients
+        self._start = start
+        self._max_size = max_size
+        self._node_path = "/".join(f"/{segment}" for segment in segments)
+        self._uri = _stream_uri(context, segments)
+        self._last_received_sequence = None  # Track last sequence for reconnection
+        self._closed = False
+        self._iterator = None
+        if getattr(self.context.http_client, "app", None):
+            self._websocket = _AsyncTestClientWebsocketWrapper(
+                context.http_client, self._uri
+            )
+        else:
+            self._websocket = _AsyncWebsocketWrapper(self._uri)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self._node_path} >"
+
+    @property
+    def context(self) -> Context:
+        return self._context
+
+    @property
+    def segments(self) -> List[str]:
+        return self._segments
+
+    def __aiter__(self) -> AsyncIterator[Update]:
+        if self._iterator is not None:
+            raise RuntimeError("An AsyncSubscription can only be iterated once.")
+        self._iterator = self._run()
+        return self._iterator
+
+    async def _run(self) -> AsyncIterator[Update]:
+        """Outer loop - runs for the lifecycle of the AsyncSubscription."""
+        try:
+            while not self._closed:
+                # Resume from last received sequence if reconnecting
+                start_from = (
+                    self._last_received_sequence + 1
+                    if self._last_received_sequence is not None
+                    else self._start
+                )
+                try:
+                    await self._connect(start_from)
+                    # The first message on each new connection is the schema.
+                    schema = None
+                    while not self._closed:
+                        data = await self._websocket.recv()
+                        # Let ConnectionClosedError and OSError propagate
+                        if data is None:
+                            break
+                        try:
+                            if schema is None:
+                                schema = parse_schema(data)
+                                continue
+                            else:
+                                update = parse_update(self, data, schema)
+                        except Exception:
+                            logger.exception(
+                                "A websocket message will be ignored because it "
+                                "could not be parsed."
+                            )
+                            continue
+                        self._last_received_sequence = update.sequence
+                        yield update
+                except (websockets.exceptions.ConnectionClosedError, OSError) as exc:
+                    if _is_message_too_big(exc):
+                        logger.error(
+                            f"Message exceeds max_size ({self._max_size} bytes). "
+                            f"Subscription will disconnect permanently. "
+                            f"Increase max_size to receive large messages."
+                        )
+                        break
+                    # Connection lost, close the websocket and reconnect
+                    try:
+                        await self._websocket.close()
+                    except Exception:
+                        pass  # Ignore errors closing failed connection
+                    continue
+                # Clean shutdown (no exception)
+                break
+        finally:
+            self._closed = True
+            try:
+                await self._websocket.close()
+            except Exception:
+                # Websocket may not have been fully connected
+                pass
+
+    @stamina.retry(
+        on=(websockets.exceptions.ConnectionClosedError, OSError),
+        attempts=TILED_RETRY_ATTEMPTS,
+        wait_max=TILED_RETRY_TIMEOUT,
+    )
+    async def _connect(self, start: Optional[int] = None) -> None:
+        """Connect to websocket with retry."""
+        needs_api_key = self.context.server_info.authentication.providers
+        if needs_api_key:
+            # Request a short-lived API key to use for authenticating the WS connection.
+            # The client is synchronous, so keep it off the event loop.
+            key_info = await anyio.to_thread.run_sync(
+                functools.partial(
+                    self.context.create_api_key,
+                    expires_in=API_KEY_LIFETIME,
+                    note="websocket",
+                )
+            )
+            api_key = key_info["secret"]
+        else:
+            # Use single-user API key or None (if unauthenticated).
+            api_key = self.context.api_key
+
+        await self._websocket.connect(api_key, start, max_size=self._max_size)
+
+        if needs_api_key:
+            # The connection is made, so we no longer need the API key.
+            await anyio.to_thread.run_sync(
+                self.context.revoke_api_key, key_info["first_eight"]
+            )
+
+    async def aclose(self) -> None:
+        "Close the websocket connection, ending iteration."
+        self._closed = True
+        if self._iterator is not None and not self._iterator.ag_running:
+            # Iteration is paused (or never started), so finalize it here.
+            await self._iterator.aclose()
+        else:
+            # Wake the receive loop, which will then finalize itself.
+            await self._websocket.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
 class UnparseableMessage(RuntimeError):
     "Message can be decoded but cannot be interpreted by the application"
     pass
@@ -659,7 +927,9 @@ def parse_schema(data: bytes) -> Schema:
     return cls(**message)
 
 
-def parse_update(subscription: Subscription, data: bytes, schema: Schema) -> Update:
+def parse_update(
+    subscription: Union[Subscription, AsyncSubscription], data: bytes, schema: Schema
+) -> Update:
     "Parse msgpack-encoded bytes into an Update model."
     message = msgpack.unpackb(data)
     try:
@@ -675,7 +945,7 @@ def parse_update(subscription: Subscription, data: bytes, schema: Schema) -> Upd
 
 class LiveChildCreated(ChildCreated):
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    subscription: ContainerSubscription
+    subscription: Union[ContainerSubscription, AsyncSubscription]
 
     def _item(self) -> dict[str, Any]:
         "Utility method for building the dict representation of the node"
@@ -726,12 +996,12 @@ class LiveChildCreated(ChildCreated):
 
 class LiveChildMetadataUpdated(ChildMetadataUpdated):
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    subscription: ContainerSubscription
+    subscription: Union[ContainerSubscription, AsyncSubscription]
 
 
 class LiveArrayData(ArrayData):
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    subscription: ArraySubscription
+    subscription: Union[ArraySubscription, AsyncSubscription]
 
     def data(self):
         "Decode array"
@@ -747,7 +1017,7 @@ class LiveArrayData(ArrayData):
 
 class LiveArrayRef(ArrayRef):
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    subscription: ArraySubscription
+    subscription: Union[ArraySubscription, AsyncSubscription]
 
     def data(self):
         "Fetch array"
@@ -772,7 +1042,7 @@ class LiveArrayRef(ArrayRef):
 
 class LiveTableData(TableData):
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    subscription: TableSubscription
+    subscription: Union[TableSubscription, AsyncSubscription]
 
     def data(self):
         "Get table"
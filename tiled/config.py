@@ -8,7 +8,7 @@ import copy
 from datetime import timedelta
 from functools import cached_property
 from pathlib import Path
-from typing import Annotated, Any, Iterator, Optional, Union
+from typing import Annotated, Any, Iterator, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 from pydantic_settings import (
@@ -71,6 +71,7 @@ class CatalogConfig(BaseSettings):
     storage_pool_size: int = 5
     catalog_max_overflow: int = 10
     storage_max_overflow: int = 10
+    storage_policies: Optional[dict[str, dict]] = None
 
     model_config = SettingsConfigDict(env_prefix="TILED_CATALOG_")
     settings_customise_sources = classmethod(settings_customise_sources)
@@ -250,6 +251,23 @@ class StreamingCacheConfig(BaseSettings):
     # socket_timeout is long: on a silent primary death (no TCP reset) this
     # PING is the client's main timely signal, so it bounds failover detection.
     health_check_interval: int = 10
+    # Maximum number of notifications buffered per websocket subscriber, and
+    # what to do with a subscriber that falls further behind: "disconnect" it
+    # with a resumable close code (it catches up by replaying from its last
+    # sequence), "drop-oldest" buffered messages, or "coalesce" the backlog into
+    # one "array-ref" message pointing at the latest data.
+    subscriber_queue_size: int = 1000
+    slow_subscriber_policy: Literal[
+        "disconnect", "drop-oldest", "coalesce"
+    ] = "disconnect"
+    # The registered streaming datastore to use. If unset, it is inferred from
+    # the connection settings: "redis" for a redis:// uri or sentinels, and
+    # "memory" for a memory:// uri.
+    datastore: Optional[str] = None
+    # Used by the "redis-streams" datastore: the approximate number of messages
+    # retained per node, and how long each blocking XREAD waits.
+    stream_maxlen: int = 10000
+    stream_block_ms: int = 5000
 
     model_config = SettingsConfigDict(env_prefix="TILED_STREAMING_CACHE_")
     settings_customise_sources = classmethod(settings_customise_sources)
@@ -352,6 +370,11 @@ class Config(BaseSettings):
     specs: list[ValidationSpec] = []
     reject_undeclared_specs: bool = False
     expose_raw_assets: bool = True
+    io_workers: Optional[int] = None
+    io_workers_per_request: Optional[int] = None
+    object_cache_directory: Optional[str] = None
+    object_cache_max_bytes: Optional[int] = None
+    object_cache_revalidate: bool = True
     routers: list[EntryPointString] = []
     streaming_cache: Optional[StreamingCacheConfig] = None
     webhooks: Optional[WebhooksConfig] = None
@@ -572,6 +595,11 @@ def construct_build_app_kwargs(config: Config):
         database=config.database,
         reject_undeclared_specs=config.reject_undeclared_specs,
         expose_raw_assets=config.expose_raw_assets,
+        io_workers=config.io_workers,
+        io_workers_per_request=config.io_workers_per_request,
+        object_cache_directory=config.object_cache_directory,
+        object_cache_max_bytes=config.object_cache_max_bytes,
+        object_cache_revalidate=config.object_cache_revalidate,
         metrics=config.metrics,
         webhooks=config.webhooks,
     )
@@ -361,6 +361,10 @@ if modules_available("blosc2"):
                 # This could be memoryview or numpy.ndarray, for example.
                 # Blosc uses item-aware shuffling for improved results.
                 compressed = blosc2.compress(b, typesize=b.itemsize)
+            elif len(b) % 8:
+                # A piece of a streaming response, not a whole number of items
+                # of blosc2's default typesize (8)
+                compressed = blosc2.compress(b, typesize=1)
             else:
                 compressed = blosc2.compress(b)
             self._file.write(compressed)
@@ -20,7 +20,11 @@ from ..utils import (
 def serialize_arrow(mimetype, df, metadata, preserve_index=True):
     import pyarrow
 
+    if isinstance(df, pyarrow.RecordBatchReader):
+        # Send each record batch as it is read.
+        return _stream_arrow(df)
     if isinstance(df, pyarrow.Table):
+        # Write the record batches as they are, e.g. memory-mapped from a file.
         table = df
     elif isinstance(df, dict):
         table = pyarrow.Table.from_pydict(df)
@@ -32,6 +36,46 @@ def serialize_arrow(mimetype, df, metadata, preserve_index=True):
     return memoryview(sink.getvalue())
 
 
+class _ChunkSink(io.RawIOBase):
+    "Collect the bytes written to it until they are drained"
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        chunk = b"".join(self._chunks)
+        self._chunks.clear()
+        return chunk
+
+
+def _stream_arrow(reader):
+    """Yield an Arrow IPC file in pieces, one record batch at a time.
+
+    Closing the generator closes the reader and releases it. A reader made
+    from a Python iterator (e.g. SQLAdapter.read_batches) closes that iterator
+    only when it is released.
+    """
+    import pyarrow
+
+    sink = _ChunkSink()
+    try:
+        with pyarrow.ipc.new_file(sink, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                yield sink.drain()
+        # Closing the writer writes the footer.
+        yield sink.drain()
+    finally:
+        reader.close()
+
+
 @default_deserialization_registry.register(
     StructureFamily.table, APACHE_ARROW_FILE_MIME_TYPE
 )
@@ -47,7 +91,10 @@ def deserialize_arrow(buffer):
 def serialize_parquet(mimetype, df, metadata, preserve_index=True):
     import pyarrow.parquet
 
-    table = pyarrow.Table.from_pandas(df, preserve_index=preserve_index)
+    if isinstance(df, pyarrow.Table):
+        table = df
+    else:
+        table = pyarrow.Table.from_pandas(df, preserve_index=preserve_index)
     sink = pyarrow.BufferOutputStream()
     with pyarrow.parquet.ParquetWriter(sink, table.schema) as writer:
         writer.write_table(table)
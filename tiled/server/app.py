@@ -5,6 +5,7 @@ import logging
 import os
 import secrets
 import sys
+import time
 import urllib.parse
 import warnings
 from contextlib import asynccontextmanager
@@ -38,6 +39,9 @@ from starlette.status import (
 )
 
 from ..access_control.protocols import AccessPolicy
+from ..adapters.io_executor import DEFAULT_MAX_WORKERS, IOExecutor, set_io_executor
+from ..adapters.object_cache import DEFAULT_MAX_BYTES as DEFAULT_OBJECT_CACHE_MAX_BYTES
+from ..adapters.object_cache import ObjectCache, set_object_cache
 from ..authenticators import ProxiedOIDCAuthenticator
 from ..catalog.adapter import WouldDeleteData
 from ..config import (
@@ -66,6 +70,7 @@ from .compression import CompressionMiddleware
 from .protocols import ExternalAuthenticator, InternalAuthenticator
 from .router import get_metrics_router, get_router
 from .settings import Settings, get_settings
+from .streaming import request_received_at
 from .utils import API_KEY_COOKIE_NAME, CSRF_COOKIE_NAME, get_root_url, record_timing
 from .webhook_router import UrlValidator, get_webhook_router
 from .zarr import get_zarr_router_v2, get_zarr_router_v3
@@ -513,6 +518,11 @@ def build_app(
             "exact_count_limit",
             "reject_undeclared_specs",
             "expose_raw_assets",
+            "io_workers",
+            "io_workers_per_request",
+            "object_cache_directory",
+            "object_cache_max_bytes",
+            "object_cache_revalidate",
         ]:
             if server_settings.get(item) is not None:
                 setattr(settings, item, server_settings[item])
@@ -635,6 +645,25 @@ def build_app(
 
         app.state.allow_origins.extend(settings.allow_origins)
 
+        if (
+            settings.io_workers is not None
+            or settings.io_workers_per_request is not None
+        ):
+            set_io_executor(
+                IOExecutor(
+                    settings.io_workers or DEFAULT_MAX_WORKERS,
+                    settings.io_workers_per_request,
+                )
+            )
+        if settings.object_cache_directory is not None:
+            set_object_cache(
+                ObjectCache(
+                    settings.object_cache_directory,
+                    settings.object_cache_max_bytes or DEFAULT_OBJECT_CACHE_MAX_BYTES,
+                    settings.object_cache_revalidate,
+                )
+            )
+
         if settings.database_settings.uri is not None:
             from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -883,6 +912,8 @@ def build_app(
         # estimate it based on request/response time, but if we add more detailed
         # information here we should keep in mind security concerns and perhaps
         # only include this for certain users.
+        # Note when the request arrived, to stamp any streamed messages with it.
+        request_received_at.set(time.time())
         # Initialize a dict that routes and dependencies can stash metrics in.
         metrics = collections.defaultdict(lambda: collections.defaultdict(lambda: 0))
         request.state.metrics = metrics
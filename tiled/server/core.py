@@ -1,10 +1,15 @@
+import asyncio
 import collections.abc
 import dataclasses
+import functools
 import inspect
 import itertools
 import operator
+import os
 import re
+import struct
 import sys
+import time
 import uuid
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
@@ -12,6 +17,7 @@ from hashlib import md5
 from typing import Any, Literal, Optional
 
 import anyio
+import cachetools
 import dateutil.tz
 import jmespath
 import msgpack
@@ -37,6 +43,7 @@ from ..utils import (
 )
 from . import schemas
 from .etag import tokenize
+from .metrics import STREAM_SEND_LATENCY, STREAM_SENT_BYTES_TOTAL
 from .utils import record_timing
 
 del queries
@@ -317,6 +324,9 @@ async def construct_entries_response(
     )
 
 
+# Media types whose serializers write Arrow tables without converting to pandas
+ARROW_TABLE_MEDIA_TYPES = {APACHE_ARROW_FILE_MIME_TYPE, "application/x-parquet"}
+
 DEFAULT_MEDIA_TYPES = {
     StructureFamily.array: {"*/*": "application/octet-stream", "image/*": "image/png"},
     StructureFamily.awkward: {"*/*": "application/zip"},
@@ -436,6 +446,11 @@ async def construct_data_response(
     if filename:
         headers["Content-Disposition"] = f'attachment; filename="{filename}"'
     serializer = serialization_registry.dispatch(spec, base_media_type)
+    if is_arrow_table(payload) and not (
+        spec == StructureFamily.table and base_media_type in ARROW_TABLE_MEDIA_TYPES
+    ):
+        # Only the Arrow-based serializers take an Arrow table as it is.
+        payload = payload.to_pandas()
     # This is the expensive step: actually serialize.
     try:
         if filter_for_access is not None:
@@ -464,6 +479,114 @@ async def construct_data_response(
     )
 
 
+def is_arrow_table(obj) -> bool:
+    # If pyarrow has not been imported yet, obj is not a pyarrow Table, and we
+    # want to avoid triggering a pyarrow import.
+    if "pyarrow" not in sys.modules:
+        return False
+    import pyarrow
+
+    return isinstance(obj, pyarrow.Table)
+
+
+def table_nbytes(table) -> int:
+    "The size in memory of a pandas DataFrame or an Arrow table"
+    if is_arrow_table(table):
+        return table.nbytes
+    return table.memory_usage().sum()
+
+
+def construct_ipc_file_response(arrow_file, request, expires=None, filename=None):
+    "Send an Arrow IPC file as it is stored, skipping deserialization and serialization."
+    request.state.endpoint = "data"
+    headers = {"ETag": arrow_file.etag}
+    if expires is not None:
+        headers["Expires"] = expires.strftime(HTTP_EXPIRES_HEADER_FORMAT)
+    if request.headers.get("If-None-Match", "") == arrow_file.etag:
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return Response(
+        memoryview(arrow_file.data),
+        media_type=APACHE_ARROW_FILE_MIME_TYPE,
+        headers=headers,
+    )
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    Stream a blocking iterator, and close it however the response ends.
+
+    If the client disconnects, Starlette stops iterating without closing the
+    iterator, so whatever it holds (e.g. a database connection) would stay open
+    until it is garbage collected.
+    """
+
+    def __init__(self, content, *args, **kwargs):
+        super().__init__(content, *args, **kwargs)
+        self._content = content
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # The iterator runs in a thread, so close it in one too, even if
+            # this task was cancelled. (A thread that is reading from it is
+            # always waited for before the cancellation gets here.)
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(self._content.close)
+
+
+def construct_batches_response(
+    serialization_registry, reader, metadata, request, expires=None, filename=None
+):
+    """
+    Stream a table in the Arrow format, serializing each record batch as it is read.
+
+    There is no ETag, which would require reading all of the data before
+    sending any of it. The reader is closed, and released, when the response
+    ends, even if the client disconnects first.
+    """
+    request.state.endpoint = "data"
+    headers = {}
+    if expires is not None:
+        headers["Expires"] = expires.strftime(HTTP_EXPIRES_HEADER_FORMAT)
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    serializer = serialization_registry.dispatch(
+        StructureFamily.table, APACHE_ARROW_FILE_MIME_TYPE
+    )
+    return ClosingStreamingResponse(
+        serializer(APACHE_ARROW_FILE_MIME_TYPE, reader, metadata),
+        media_type=APACHE_ARROW_FILE_MIME_TYPE,
+        headers=headers,
+    )
+
+
+def requested_media_types(request, format=None):
+    "List the media types requested by the `format` query parameter, or else the Accept header."
+    if format is not None:
+        media_types = format.split(",")
+    else:
+        media_types = request.headers.get("Accept", "").split(",")
+    return [parse_mimetype(media_type.strip())[0] for media_type in media_types]
+
+
+def construct_stored_chunk_response(stored_chunk, request, expires=None):
+    "Send a chunk as stored in an HDF5 file, with a media type that describes its encoding."
+    request.state.endpoint = "data"
+    with record_timing(request.state.metrics, "tok"):
+        etag = md5(stored_chunk.data).hexdigest()
+    headers = {"ETag": etag}
+    if expires is not None:
+        headers["Expires"] = expires.strftime(HTTP_EXPIRES_HEADER_FORMAT)
+    if request.headers.get("If-None-Match", "") == etag:
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        stored_chunk.data, media_type=stored_chunk.media_type(), headers=headers
+    )
+
+
 async def construct_resource(
     base_url,
     path_parts,
@@ -757,30 +880,149 @@ def json_or_msgpack(
     )
 
 
+# Encoded websocket frames are shared among all subscribers to a node in this
+# process, so that each message is transcoded once rather than once per
+# subscriber. This bounds the bytes held. Override with
+# TILED_STREAM_FRAME_CACHE_BYTES.
+STREAM_FRAME_CACHE_BYTES = int(
+    os.environ.get("TILED_STREAM_FRAME_CACHE_BYTES") or (256 * 1024 * 1024)
+)
+
+# msgpack extension type code, used by the "msgpack-typed" envelope, for a typed
+# array. Its data is a little-endian uint32 header length, then a
+# msgpack-encoded header [dtype, shape] (dtype as a numpy type string such as
+# "<f8"), then the raw C-ordered array buffer.
+NDARRAY_EXT_TYPE = 1
+
+
+def pack_ndarray_ext(dtype, shape, buffer) -> msgpack.ExtType:
+    "Wrap a raw array buffer in a msgpack extension type with its dtype and shape."
+    header = msgpack.packb([dtype.str, list(shape)])
+    return msgpack.ExtType(
+        NDARRAY_EXT_TYPE, struct.pack("<I", len(header)) + header + bytes(buffer)
+    )
+
+
+class EncodedFrameCache:
+    """
+    Share encoded websocket frames among the subscribers to a node.
+
+    Frames are keyed on the message (node, sequence, and timestamp, which
+    distinguishes a restarted sequence), the fields set per subscriber (an
+    array-ref's uri, and the count of messages it coalesces), and the envelope
+    format. Concurrent
+    requests for a frame that is still being encoded wait for the one encoding
+    in flight. Finished frames are held in an LRU cache bounded in bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._frames = cachetools.LRUCache(maxsize=max_bytes, getsizeof=len)
+        self._pending: dict[tuple, asyncio.Future] = {}
+
+    def clear(self):
+        self._frames.clear()
+
+    async def get_or_encode(self, key, encode, offload=False):
+        """
+        Return the frame cached under key, or encode and cache it.
+
+        If offload is True, run encode in a worker thread, off the event loop.
+        """
+        try:
+            return self._frames[key]
+        except KeyError:
+            pass
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            if offload:
+                frame = await anyio.to_thread.run_sync(encode)
+            else:
+                frame = encode()
+        except BaseException as err:
+            future.set_exception(err)
+            # Mark the exception retrieved, in case no one else was waiting.
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+        if len(frame) <= self._frames.maxsize:
+            self._frames[key] = frame
+        future.set_result(frame)
+        return frame
+
+
+_encoded_frames = EncodedFrameCache(STREAM_FRAME_CACHE_BYTES)
+
+
 def get_websocket_envelope_formatter(
-    envelope_format: schemas.EnvelopeFormat, entry, deserialization_registry
+    envelope_format: schemas.EnvelopeFormat,
+    entry,
+    deserialization_registry,
+    node_key: Optional[str] = None,
 ):
+    """
+    Return an async function that encodes a message and sends it to a websocket.
+
+    If node_key, which identifies the node being streamed, is given, encoded
+    messages are cached and shared with other subscribers to the same node.
+    """
+
+    def deserialize_array(metadata, payload_bytes, media_type):
+        structure = entry.structure()
+        deserializer = deserialization_registry.dispatch(
+            StructureFamily.array, media_type
+        )
+        return deserializer(
+            payload_bytes,
+            structure.data_type.to_numpy_dtype(),
+            metadata.get("shape"),
+        )
+
     if envelope_format == "msgpack":
+        binary = True
+        offload = False
 
-        async def stream_msgpack(
-            websocket: WebSocket,
-            metadata: dict,
-            payload_bytes: Optional[bytes],
-        ):
+        def encode(metadata: dict, payload_bytes: Optional[bytes]):
             if payload_bytes is not None:
                 metadata["payload"] = payload_bytes
-            data = msgpack.packb(metadata)
-            await websocket.send_bytes(data)
+            return msgpack.packb(metadata)
 
-        return stream_msgpack
+    elif envelope_format == "msgpack-typed":
+        binary = True
+        offload = True
+
+        def encode(metadata: dict, payload_bytes: Optional[bytes]):
+            if payload_bytes is not None:
+                media_type = metadata.get("mimetype", "application/octet-stream")
+                if metadata.get("type") == "array-data":
+                    dtype = entry.structure().data_type.to_numpy_dtype()
+                    if dtype.fields is None:
+                        # Send a typed buffer that a browser can view directly
+                        # as a TypedArray, rather than opaque bytes.
+                        if media_type == "application/octet-stream":
+                            buffer = payload_bytes
+                        else:
+                            import numpy
+
+                            array = deserialize_array(
+                                metadata, payload_bytes, media_type
+                            )
+                            buffer = numpy.ascontiguousarray(array).data
+                        payload_bytes = pack_ndarray_ext(
+                            dtype, metadata["shape"], buffer
+                        )
+                metadata["payload"] = payload_bytes
+            return msgpack.packb(metadata)
 
     elif envelope_format == "json":
+        binary = False
+        offload = True
 
-        async def stream_json(
-            websocket: WebSocket,
-            metadata: dict,
-            payload_bytes: Optional[bytes],
-        ):
+        def encode(metadata: dict, payload_bytes: Optional[bytes]):
             if payload_bytes is not None:
                 media_type = metadata.get("mimetype") or metadata.get(
                     "content-type", "application/octet-stream"
@@ -806,24 +1048,60 @@ def get_websocket_envelope_formatter(
                     ragged_array = deserializer(payload_bytes, structure)
                     payload_decoded = ragged_array.tolist()
                 else:
-                    structure = entry.structure()
-                    deserializer = deserialization_registry.dispatch(
-                        StructureFamily.array, media_type
-                    )
-                    payload_decoded = deserializer(
-                        payload_bytes,
-                        structure.data_type.to_numpy_dtype(),
-                        metadata.get("shape"),
+                    payload_decoded = deserialize_array(
+                        metadata, payload_bytes, media_type
                     )
                 metadata["payload"] = payload_decoded
             # Convert non-serializable schema objects (e.g. pyarrow.Schema)
             # to their string representation for JSON transport.
             if "arrow_schema" in metadata:
                 metadata["arrow_schema"] = str(metadata["arrow_schema"])
-            data = safe_json_dump(metadata)
-            await websocket.send_text(data.decode())
+            return safe_json_dump(metadata).decode()
+
+    else:
+        raise ValueError(f"Unknown envelope format {envelope_format!r}")
+
+    label = schemas.EnvelopeFormat(envelope_format).value
+    send_latency = STREAM_SEND_LATENCY.labels(envelope_format=label)
+    sent_bytes = STREAM_SENT_BYTES_TOTAL.labels(envelope_format=label)
+
+    async def send(
+        websocket: WebSocket,
+        metadata: dict,
+        payload_bytes: Optional[bytes],
+        replay: bool = False,
+    ):
+        sequence = metadata.get("sequence")
+        received_at = metadata.get("server_received_at")
+        if node_key is None or sequence is None:
+            # Schema messages are per-subscriber and cheap; do not cache.
+            data = encode(metadata, payload_bytes)
+        else:
+            key = (
+                node_key,
+                sequence,
+                metadata.get("timestamp"),
+                # Set per subscriber on array-ref messages
+                metadata.get("uri"),
+                # Set when a backlog is coalesced into an array-ref
+                metadata.get("coalesced"),
+                envelope_format,
+            )
+            data = await _encoded_frames.get_or_encode(
+                key,
+                functools.partial(encode, metadata, payload_bytes),
+                offload=offload and payload_bytes is not None,
+            )
+        if binary:
+            await websocket.send_bytes(data)
+        else:
+            await websocket.send_text(data)
+        sent_bytes.inc(len(data))
+        # Replayed messages are old by design; their latency is not meaningful.
+        if received_at is not None and not replay:
+            send_latency.observe(time.time() - received_at)
 
-        return stream_json
+    return send
 
 
 class UnsupportedMediaTypes(Exception):
@@ -14,6 +14,7 @@ from ..access_control.protocols import AccessPolicy
 from ..adapters.protocols import AnyAdapter
 from ..ndslice import NDBlock, NDSlice
 from ..structures.core import StructureFamily
+from ..table_filter import MAX_FILTER_LENGTH, TableFilter, parse_rows
 from ..type_aliases import AccessTags, Scopes
 from ..utils import BrokenLink
 from .core import NoEntry
@@ -166,6 +167,28 @@ def parse_slice_param(slice: str = Query("", pattern=SLICE_REGEX)):
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+def parse_rows_param(rows: Optional[str] = Query(None, pattern=r"^(-?\d+)?:\d*$")):
+    "Specify and parse a range of table rows, 'start:stop'"
+    if rows is None:
+        return None
+    try:
+        return parse_rows(rows)
+    except ValueError as e:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def parse_filter_param(
+    filter: Optional[str] = Query(None, min_length=1, max_length=MAX_FILTER_LENGTH)
+):
+    "Specify and parse a filter expression over table columns"
+    if filter is None:
+        return None
+    try:
+        return TableFilter(filter)
+    except ValueError as e:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 def expected_shape(
     expected_shape: Optional[str] = Query(
         None, min_length=1, pattern="^[0-9]+(,[0-9]+)*$|^scalar$"
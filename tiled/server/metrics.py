@@ -116,6 +116,119 @@ DB_POOL_AT_MAX_TOTAL = Counter(
     ["uri"],
 )
 
+# Streaming (websocket) subscriber metrics
+STREAM_SUBSCRIBER_QUEUE_DEPTH = Gauge(
+    "tiled_stream_subscriber_queue_depth",
+    "Number of live messages buffered for websocket subscribers, awaiting send",
+    ["node_id"],
+)
+STREAM_DROPPED_TOTAL = Counter(
+    "tiled_stream_dropped_total",
+    "Number of live messages not sent to a slow websocket subscriber, "
+    "by the policy that handled the overflow",
+    ["node_id", "policy"],
+)
+STREAM_SUBSCRIBER_LAG = Histogram(
+    "tiled_stream_subscriber_lag_messages",
+    "Number of newer live messages already received when a message is sent "
+    "to a websocket subscriber",
+    ["node_id"],
+    buckets=[0, 1, 10, 100, 1000, 10_000, float("inf")],
+)
+STREAM_PUBLISH_DURATION = Histogram(
+    "tiled_stream_publish_duration_seconds",
+    "time from the server receiving a streamed message to publishing it "
+    "to the streaming datastore",
+    ["datastore"],
+)
+STREAM_SEND_LATENCY = Histogram(
+    "tiled_stream_send_latency_seconds",
+    "time from the server receiving a streamed message to sending it "
+    "live to a websocket subscriber",
+    ["envelope_format"],
+)
+STREAM_SENT_BYTES_TOTAL = Counter(
+    "tiled_stream_sent_bytes_total",
+    "size of websocket messages sent to subscribers (characters, for text frames)",
+    ["envelope_format"],
+)
+STREAM_REPLAY_DURATION = Histogram(
+    "tiled_stream_replay_duration_seconds",
+    "time spent replaying messages to a websocket subscriber that asked to start "
+    "from an earlier sequence",
+    ["node_id"],
+)
+STREAM_REPLAY_MESSAGES = Histogram(
+    "tiled_stream_replay_messages",
+    "number of messages replayed to a websocket subscriber",
+    ["node_id"],
+    buckets=[0, 1, 10, 100, 1000, 10_000, float("inf")],
+)
+STREAM_SUBSCRIBERS = Gauge(
+    "tiled_stream_subscribers",
+    "Number of connected websocket subscribers",
+    ["node_id"],
+)
+
+# Shared I/O thread pool (tiled.adapters.io_executor) metrics. Reads that wait
+# long for a worker while all workers are busy indicate that storage, rather
+# than CPU, is the bottleneck.
+IO_QUEUE_DEPTH = Gauge(
+    "tiled_io_queue_depth",
+    "Number of file reads submitted to the shared I/O thread pool, waiting for a worker",
+)
+IO_ACTIVE_WORKERS = Gauge(
+    "tiled_io_active_workers",
+    "Number of workers of the shared I/O thread pool that are reading files",
+)
+IO_WAIT_DURATION = Histogram(
+    "tiled_io_wait_duration_seconds",
+    "time file reads spend waiting for a worker of the shared I/O thread pool",
+)
+
+# Appends to SQL tables (tiled.adapters.sql_ingest) are committed in batches.
+# Batches of one append under load indicate that the database commits faster
+# than appends arrive; long flushes indicate that it does not.
+SQL_INGEST_FLUSH_DURATION = Histogram(
+    "tiled_sql_ingest_flush_duration_seconds",
+    "time spent writing and committing a batch of appends to an SQL table",
+    ["dialect"],
+)
+SQL_INGEST_LATENCY = Histogram(
+    "tiled_sql_ingest_latency_seconds",
+    "time from receiving an append to an SQL table to committing it",
+    ["dialect"],
+)
+SQL_INGEST_BATCH_APPENDS = Histogram(
+    "tiled_sql_ingest_batch_appends",
+    "number of appends to an SQL table committed together",
+    ["dialect"],
+    buckets=[1, 2, 5, 10, 20, 50, 100, 1000, float("inf")],
+)
+SQL_INGEST_BATCH_ROWS = Histogram(
+    "tiled_sql_ingest_batch_rows",
+    "number of rows appended to an SQL table in one commit",
+    ["dialect"],
+    buckets=[1, 10, 100, 1000, 10_000, 100_000, 1_000_000, float("inf")],
+)
+
+# Object storage read-through cache (see tiled.adapters.object_cache)
+OBJECT_CACHE_REQUESTS = Counter(
+    "tiled_object_cache_requests_total",
+    "reads of object storage looked up in the local disk cache, by result",
+    ["result"],
+)
+OBJECT_CACHE_BYTES = Counter(
+    "tiled_object_cache_bytes_total",
+    "bytes served from the local disk cache (hit) or read from object storage "
+    "into it (miss)",
+    ["result"],
+)
+OBJECT_CACHE_EVICTIONS = Counter(
+    "tiled_object_cache_evictions_total",
+    "entries removed from the local disk cache to keep it within its budget",
+)
+
 # Initialize labels in advance so that the metrics exist (and can be used in
 # dashboards and alerts) even if they have not yet occurred.
 for code in ["200", "304", "500"]:
@@ -141,6 +254,9 @@ for code in ["200", "304", "500"]:
             COMPRESSION_RATIO.labels(
                 code=code, method="GET", endpoint=endpoint, encoding=encoding
             )
+for envelope_format in ["json", "msgpack", "msgpack-typed"]:
+    STREAM_SEND_LATENCY.labels(envelope_format=envelope_format)
+    STREAM_SENT_BYTES_TOTAL.labels(envelope_format=envelope_format)
 
 
 def capture_request_metrics(request, response):
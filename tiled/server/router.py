@@ -48,12 +48,20 @@ from tiled.server.protocols import ExternalAuthenticator, InternalAuthenticator
 from tiled.server.schemas import Principal
 
 from .. import __version__
+from ..hdf5_filters import HDF5_CHUNK_MIME_TYPE
 from ..links import links_for_node
 from ..ndslice import NDBlock, NDSlice
 from ..stream_messages import ArrayPatch
 from ..structures.core import Spec, StructureFamily
+from ..table_filter import TableFilter, columns_to_read, select_rows
 from ..type_aliases import AccessTags, Scopes
-from ..utils import BrokenLink, ensure_awaitable, patch_mimetypes, path_from_uri
+from ..utils import (
+    APACHE_ARROW_FILE_MIME_TYPE,
+    BrokenLink,
+    ensure_awaitable,
+    patch_mimetypes,
+    path_from_uri,
+)
 from ..validation_registration import ValidationError, ValidationRegistry
 from . import schemas
 from ._backcompat import (
@@ -80,13 +88,18 @@ from .core import (
     UnsupportedMediaTypes,
     WrongTypeForRoute,
     apply_search,
+    construct_batches_response,
     construct_data_response,
     construct_entries_response,
+    construct_ipc_file_response,
     construct_resource,
     construct_revisions_response,
+    construct_stored_chunk_response,
     get_websocket_envelope_formatter,
     json_or_msgpack,
+    requested_media_types,
     resolve_media_type,
+    table_nbytes,
 )
 from .dependencies import (
     PaginationParams,
@@ -95,6 +108,8 @@ from .dependencies import (
     get_root_tree,
     offset_param,
     parse_block_param,
+    parse_filter_param,
+    parse_rows_param,
     parse_slice_param,
     patch_offset_param,
     patch_shape_param,
@@ -598,6 +613,30 @@ def get_router(
                 ),
             )
 
+        # Send a block that lines up with an HDF5 chunk as stored, if the client
+        # can decode it, skipping the HDF5 filter pipeline on the server.
+        if (
+            ndim > 0
+            and not slice
+            and hasattr(entry, "read_stored_block")
+            and HDF5_CHUNK_MIME_TYPE in requested_media_types(request, format)
+        ):
+            with record_timing(request.state.metrics, "read"):
+                stored_chunk = await ensure_awaitable(entry.read_stored_block, block)
+            if stored_chunk is not None:
+                if stored_chunk.nbytes > settings.response_bytesize_limit:
+                    raise HTTPException(
+                        status_code=HTTP_400_BAD_REQUEST,
+                        detail=(
+                            f"Response would exceed {settings.response_bytesize_limit}."
+                        ),
+                    )
+                return construct_stored_chunk_response(
+                    stored_chunk,
+                    request,
+                    expires=getattr(entry, "content_stale_at", None),
+                )
+
         if ndim == 0:
             # Handle special case of numpy scalar.
             with record_timing(request.state.metrics, "read"):
@@ -684,10 +723,13 @@ def get_router(
             with record_timing(request.state.metrics, "read"):
                 array = await ensure_awaitable(entry.read, slice)
             if structure_family == StructureFamily.array:
-                # Force dask or PIMS or ... to do I/O. Ensure dtype is preserved.
-                array = numpy.asarray(
-                    array, dtype=entry.structure().data_type.to_numpy_dtype()
-                )
+                dtype = entry.structure().data_type.to_numpy_dtype()
+                # Memory-mapped arrays are passed through: they are serialized
+                # without a copy, and their ETag is derived from the file
+                # instead of by hashing the data.
+                if not (isinstance(array, numpy.memmap) and array.dtype == dtype):
+                    # Force dask or PIMS or ... to do I/O. Ensure dtype is preserved.
+                    array = numpy.asarray(array, dtype=dtype)
         except IndexError:
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST, detail="Block index out of range"
@@ -823,13 +865,13 @@ def get_router(
             },
             getattr(websocket.app.state, "access_policy", None),
         )
-        formatter = get_websocket_envelope_formatter(
-            envelope_format, entry, deserialization_registry
-        )
         base_websocket_url = URL(get_base_url_websocket(websocket))
         scheme = "https" if base_websocket_url.scheme == "wss" else "http"
         path_parts = [segment for segment in path.split("/") if segment]
         path_str = "/".join(path_parts)
+        formatter = get_websocket_envelope_formatter(
+            envelope_format, entry, deserialization_registry, node_key=path_str
+        )
         uri = f"{base_websocket_url.replace(scheme=scheme)}/array/full/{path_str}"
         handler = entry.make_ws_handler(websocket, formatter, uri)
         await handler(start, already_accepted=needs_first_message_auth)
@@ -905,6 +947,106 @@ def get_router(
                 status_code=HTTP_406_NOT_ACCEPTABLE, detail=err.args[0]
             ) from err
 
+    @router.get(
+        "/ragged/block/{path:path}",
+        response_model=schemas.Response,
+        name="ragged block",
+    )
+    async def get_ragged_block(
+        request: Request,
+        path: str,
+        block: NDBlock = Depends(parse_block_param),
+        slice: NDSlice = Depends(parse_slice_param),
+        format: Optional[str] = None,
+        filename: Optional[str] = None,
+        settings: Settings = Depends(get_settings),
+        principal: Optional[Principal] = Depends(get_current_principal),
+        root_tree=Depends(get_root_tree),
+        session_state: dict = Depends(get_session_state),
+        authn_access_tags: Optional[AccessTags] = Depends(get_current_access_tags),
+        authn_scopes: Scopes = Depends(get_current_scopes),
+        _=Security(check_scopes, scopes=["read:data"]),
+    ):
+        """
+        Fetch a block (chunk along the first dimension) of a ragged array.
+        """
+        entry = await get_entry(
+            path=path,
+            security_scopes=["read:data"],
+            principal=principal,
+            authn_access_tags=authn_access_tags,
+            authn_scopes=authn_scopes,
+            root_tree=root_tree,
+            session_state=session_state,
+            metrics=request.state.metrics,
+            structure_families={StructureFamily.ragged},
+            access_policy=getattr(request.app.state, "access_policy", None),
+        )
+        if not hasattr(entry, "read_block"):
+            raise HTTPException(
+                status_code=HTTP_405_METHOD_NOT_ALLOWED,
+                detail="This node does not support reading blocks of ragged array data.",
+            )
+        chunks = entry.structure().chunks
+        if len(block) != len(chunks):
+            raise HTTPException(
+                status_code=HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=(
+                    f"Block parameter must have {len(chunks)} comma-separated "
+                    "parameters, corresponding to the dimensions of this array."
+                ),
+            )
+
+        from ..structures.ragged import CanonicalRaggedArray, RaggedSlicingError
+
+        try:
+            with record_timing(request.state.metrics, "read"):
+                array: CanonicalRaggedArray = await ensure_awaitable(
+                    entry.read_block, block, slice
+                )
+        except IndexError as err:
+            raise HTTPException(
+                status_code=HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=(
+                    f"Block parameter {block} is out of range for the chunks "
+                    f"{chunks[0]} of the first dimension."
+                ),
+            ) from err
+        except RaggedSlicingError as err:
+            raise HTTPException(
+                status_code=HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=(
+                    "Cannot apply the requested slice to the given ragged array. "
+                    "Try reading the entire block and slice it on the client side instead."
+                ),
+            ) from err
+
+        if array._impl.nbytes > settings.response_bytesize_limit:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Response would exceed {settings.response_bytesize_limit}. "
+                    "Use slicing ('?slice=...') to request smaller chunks."
+                ),
+            )
+        try:
+            with record_timing(request.state.metrics, "pack"):
+                return await construct_data_response(
+                    entry.structure_family,
+                    serialization_registry,
+                    array,
+                    entry.metadata(),
+                    request,
+                    format,
+                    specs=getattr(entry, "specs", []),
+                    expires=getattr(entry, "content_stale_at", None),
+                    filename=filename,
+                )
+        except UnsupportedMediaTypes as err:
+            raise HTTPException(
+                status_code=HTTP_406_NOT_ACCEPTABLE, detail=err.args[0]
+            ) from err
+
     @router.put("/ragged/full/{path:path}")
     async def put_ragged_full(
         request: Request,
@@ -1057,6 +1199,8 @@ def get_router(
         partition: int,
         column: Optional[List[str]] = Query(None, min_length=1),
         field: Optional[List[str]] = Query(None, min_length=1, deprecated=True),
+        rows: Optional[slice] = Depends(parse_rows_param),
+        table_filter: Optional[TableFilter] = Depends(parse_filter_param),
         format: Optional[str] = None,
         filename: Optional[str] = None,
         settings: Settings = Depends(get_settings),
@@ -1106,6 +1250,8 @@ def get_router(
             partition=partition,
             entry=entry,
             column=(column or field),
+            rows=rows,
+            table_filter=table_filter,
             format=format,
             filename=filename,
             settings=settings,
@@ -1121,6 +1267,8 @@ def get_router(
         request: Request,
         partition: int,
         column: Optional[List[str]] = Body(None, min_length=1),
+        rows: Optional[slice] = Depends(parse_rows_param),
+        table_filter: Optional[TableFilter] = Depends(parse_filter_param),
         format: Optional[str] = None,
         filename: Optional[str] = None,
         settings: Settings = Depends(get_settings),
@@ -1151,11 +1299,44 @@ def get_router(
             partition=partition,
             entry=entry,
             column=column,
+            rows=rows,
+            table_filter=table_filter,
             format=format,
             filename=filename,
             settings=settings,
         )
 
+    def prefers_arrow(entry, request, format):
+        """
+        Whether the client prefers a table in the Arrow format.
+
+        If so (and no spec of the entry overrides the Arrow format) the table
+        can be sent as the Arrow IPC file that stores it, or streamed batch by
+        batch, if the adapter supports that.
+        """
+        media_type = serialization_registry.resolve_alias(
+            requested_media_types(request, format)[0]
+        )
+        if media_type not in {APACHE_ARROW_FILE_MIME_TYPE, "*/*", ""}:
+            return False
+        return not any(
+            spec.name in serialization_registry.structure_families
+            and APACHE_ARROW_FILE_MIME_TYPE
+            in serialization_registry.media_types(spec.name)
+            for spec in getattr(entry, "specs", [])
+        )
+
+    async def read_optional(entry, method, *args):
+        """
+        Call a read method that only some adapters support.
+
+        Return None if the adapter does not support it, so that the caller
+        falls back to a read that all adapters support.
+        """
+        if not hasattr(entry, method):
+            return None
+        return await ensure_awaitable(getattr(entry, method), *args)
+
     async def table_partition(
         request: Request,
         partition: int,
@@ -1164,15 +1345,59 @@ def get_router(
         format: Optional[str],
         filename: Optional[str],
         settings: Settings,
+        rows: Optional[slice] = None,
+        table_filter: Optional[TableFilter] = None,
     ):
         """
         Fetch a partition (continuous block of rows) from a DataFrame.
         """
+        df = arrow_file = reader = None
         try:
             # The singular/plural mismatch here of "fields" and "field" is
             # due to the ?field=A&field=B&field=C... encodes in a URL.
             with record_timing(request.state.metrics, "read"):
-                df = await ensure_awaitable(entry.read_partition, partition, column)
+                if rows is None and table_filter is None:
+                    if prefers_arrow(entry, request, format):
+                        if column is None:
+                            # The file that stores the partition, sent as it is
+                            arrow_file = await read_optional(
+                                entry, "read_partition_ipc", partition
+                            )
+                        if arrow_file is None:
+                            # Record batches, sent as they are read
+                            reader = await read_optional(
+                                entry, "read_partition_batches", partition, column
+                            )
+                    if arrow_file is None and reader is None:
+                        # An Arrow table, sent without converting to pandas
+                        df = await read_optional(
+                            entry, "read_partition_table", partition, column
+                        )
+                        if df is None:
+                            df = await ensure_awaitable(
+                                entry.read_partition, partition, column
+                            )
+                else:
+                    # Only the rows selected
+                    df = await read_optional(
+                        entry,
+                        "read_partition_subset",
+                        partition,
+                        column,
+                        rows,
+                        table_filter,
+                    )
+                    if df is None:
+                        df = await ensure_awaitable(
+                            entry.read_partition,
+                            partition,
+                            columns_to_read(column, table_filter),
+                        )
+                        df = select_rows(df, column, rows, table_filter)
+        except ValueError as err:
+            if table_filter is None:
+                raise
+            raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(err))
         except IndexError:
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST, detail="Partition out of range"
@@ -1182,7 +1407,18 @@ def get_router(
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST, detail=f"No such field {key}."
             )
-        if df.memory_usage().sum() > settings.response_bytesize_limit:
+        if reader is not None:
+            # The stream is not held in memory, so it is not subject to the limit.
+            return construct_batches_response(
+                serialization_registry,
+                reader,
+                entry.metadata(),
+                request,
+                expires=getattr(entry, "content_stale_at", None),
+                filename=filename,
+            )
+        nbytes = arrow_file.data.size if arrow_file is not None else table_nbytes(df)
+        if nbytes > settings.response_bytesize_limit:
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST,
                 detail=(
@@ -1191,6 +1427,13 @@ def get_router(
                     "request a smaller chunks."
                 ),
             )
+        if arrow_file is not None:
+            return construct_ipc_file_response(
+                arrow_file,
+                request,
+                expires=getattr(entry, "content_stale_at", None),
+                filename=filename,
+            )
         try:
             with record_timing(request.state.metrics, "pack"):
                 return await construct_data_response(
@@ -1216,6 +1459,8 @@ def get_router(
         request: Request,
         path: str,
         column: Optional[List[str]] = Query(None, min_length=1),
+        rows: Optional[slice] = Depends(parse_rows_param),
+        table_filter: Optional[TableFilter] = Depends(parse_filter_param),
         format: Optional[str] = None,
         filename: Optional[str] = None,
         settings: Settings = Depends(get_settings),
@@ -1245,6 +1490,8 @@ def get_router(
             request=request,
             entry=entry,
             column=column,
+            rows=rows,
+            table_filter=table_filter,
             format=format,
             filename=filename,
             settings=settings,
@@ -1259,6 +1506,8 @@ def get_router(
         request: Request,
         path: str,
         column: Optional[List[str]] = Body(None, min_length=1),
+        rows: Optional[slice] = Depends(parse_rows_param),
+        table_filter: Optional[TableFilter] = Depends(parse_filter_param),
         format: Optional[str] = None,
         filename: Optional[str] = None,
         settings: Settings = Depends(get_settings),
@@ -1288,6 +1537,8 @@ def get_router(
             request=request,
             entry=entry,
             column=column,
+            rows=rows,
+            table_filter=table_filter,
             format=format,
             filename=filename,
             settings=settings,
@@ -1300,19 +1551,61 @@ def get_router(
         format: Optional[str],
         filename: Optional[str],
         settings: Settings,
+        rows: Optional[slice] = None,
+        table_filter: Optional[TableFilter] = None,
     ):
         """
         Fetch the data for the given table.
         """
+        data = arrow_file = reader = None
         try:
             with record_timing(request.state.metrics, "read"):
-                data = await ensure_awaitable(entry.read, column)
+                if rows is None and table_filter is None:
+                    if prefers_arrow(entry, request, format):
+                        if column is None and entry.structure().npartitions == 1:
+                            # The file that stores the table, sent as it is
+                            arrow_file = await read_optional(
+                                entry, "read_partition_ipc", 0
+                            )
+                        if arrow_file is None:
+                            # Record batches, sent as they are read
+                            reader = await read_optional(entry, "read_batches", column)
+                    if arrow_file is None and reader is None:
+                        # An Arrow table, sent without converting to pandas
+                        data = await read_optional(entry, "read_table", column)
+                        if data is None:
+                            data = await ensure_awaitable(entry.read, column)
+                else:
+                    # Only the rows selected
+                    data = await read_optional(
+                        entry, "read_subset", column, rows, table_filter
+                    )
+                    if data is None:
+                        data = await ensure_awaitable(
+                            entry.read, columns_to_read(column, table_filter)
+                        )
+                        data = select_rows(data, column, rows, table_filter)
+        except ValueError as err:
+            if table_filter is None:
+                raise
+            raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(err))
         except KeyError as err:
             (key,) = err.args
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST, detail=f"No such field {key}."
             )
-        if data.memory_usage().sum() > settings.response_bytesize_limit:
+        if reader is not None:
+            # The stream is not held in memory, so it is not subject to the limit.
+            return construct_batches_response(
+                serialization_registry,
+                reader,
+                entry.metadata(),
+                request,
+                expires=getattr(entry, "content_stale_at", None),
+                filename=filename,
+            )
+        nbytes = arrow_file.data.size if arrow_file is not None else table_nbytes(data)
+        if nbytes > settings.response_bytesize_limit:
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST,
                 detail=(
@@ -1321,6 +1614,13 @@ def get_router(
                     "request a smaller chunks."
                 ),
             )
+        if arrow_file is not None:
+            return construct_ipc_file_response(
+                arrow_file,
+                request,
+                expires=getattr(entry, "content_stale_at", None),
+                filename=filename,
+            )
         try:
             with record_timing(request.state.metrics, "pack"):
                 return await construct_data_response(
@@ -1912,9 +2212,8 @@ def get_router(
         links = links_for_node(
             structure_family, structure, get_base_url(request), path + f"/{node.key}"
         )
-        data_sources_dump = [
-            ds.model_dump() for ds in await node.data_sources(include_assets=True)
-        ]
+        data_sources = await node.data_sources(include_assets=True)
+        data_sources_dump = [ds.model_dump() for ds in data_sources]
         strip_asset_fields_for_client(
             data_sources_dump, parse_python_tiled_client_version(request)
         )
@@ -1923,6 +2222,13 @@ def get_router(
             "links": links,
             "data_sources": data_sources_dump,
         }
+        # The storage may be laid out differently than requested (e.g. with
+        # larger chunks, following the server's storage policy).
+        if structure is not None and (
+            data_sources[0].model_dump(mode="json")["structure"]
+            != body.data_sources[0].model_dump(mode="json")["structure"]
+        ):
+            response_data["structure"] = data_sources_dump[0]["structure"]
         if metadata_modified:
             response_data["metadata"] = metadata
         if access_blob_modified:
@@ -629,6 +629,10 @@ SearchResponse = Response[
 class EnvelopeFormat(str, enum.Enum):
     json = "json"
     msgpack = "msgpack"
+    # Like msgpack, but array payloads are msgpack extension types carrying the
+    # dtype and shape with the raw buffer, which browsers can view as typed
+    # arrays. See tiled.server.core.NDARRAY_EXT_TYPE.
+    msgpack_typed = "msgpack-typed"
 
 
 class EventType(str, enum.Enum):
@@ -55,6 +55,15 @@ class Settings(BaseSettings):
     storage_max_overflow: int = 10
     database_init_if_not_exists: bool = False
     expose_raw_assets: bool = True
+    # Size of the thread pool shared by all reads that span many files, and
+    # the share of it that one read may use (see tiled.adapters.io_executor)
+    io_workers: Optional[int] = None
+    io_workers_per_request: Optional[int] = None
+    # Local disk cache of reads from object storage, disabled unless a
+    # directory is given (see tiled.adapters.object_cache)
+    object_cache_directory: Optional[str] = None
+    object_cache_max_bytes: Optional[int] = None
+    object_cache_revalidate: bool = True
 
     model_config = SettingsConfigDict(
         env_prefix="TILED_",
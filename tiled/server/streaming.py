@@ -1,6 +1,11 @@
 import asyncio
+import collections
+import contextvars
+import dataclasses
 import itertools
 import logging
+import os
+import time
 import weakref
 from collections import defaultdict
 from datetime import datetime
@@ -14,9 +19,25 @@ from redis.asyncio.sentinel import Sentinel
 
 from ..ndslice import NDSlice
 from ..utils import safe_json_dump as _safe_json_dump
+from .metrics import (
+    STREAM_DROPPED_TOTAL,
+    STREAM_PUBLISH_DURATION,
+    STREAM_REPLAY_DURATION,
+    STREAM_REPLAY_MESSAGES,
+    STREAM_SUBSCRIBER_LAG,
+    STREAM_SUBSCRIBER_QUEUE_DEPTH,
+    STREAM_SUBSCRIBERS,
+)
 
 logger = logging.getLogger(__name__)
 
+# The time (in seconds since the UNIX epoch) at which the server received the
+# request being handled. The application sets this as each request arrives,
+# before authenticating it and reading its body.
+request_received_at: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "request_received_at", default=None
+)
+
 
 def _build_redis_client(settings: Dict[str, Any]) -> redis.Redis:
     """Build the async Redis client for the streaming datastore.
@@ -122,12 +143,24 @@ class StreamingCache:
                 f"Unknown backend '{datastore_name}'. Available backends: {sorted(_DATASTORES)}"
             )
         self._datastore = datastore_cls(self._config)
+        self._publish_duration = STREAM_PUBLISH_DURATION.labels(
+            datastore=datastore_name
+        )
 
     async def incr_seq(self, node_id: str) -> int:
         return await self._datastore.incr_seq(node_id)
 
-    async def set(self, node_id, sequence, metadata, payload=None):
+    async def set(self, node_id, sequence, metadata, payload=None, received_at=None):
+        # Stamp the message with the time at which the server received it, so
+        # that subscribers can compute end-to-end latency: by default, the time
+        # at which the request being handled arrived.
+        if received_at is None:
+            received_at = request_received_at.get()
+        if received_at is None:
+            received_at = time.time()
+        metadata["server_received_at"] = received_at
         await self._datastore.set(node_id, sequence, metadata, payload)
+        self._publish_duration.observe(time.time() - received_at)
 
     @property
     def client(self):
@@ -167,8 +200,9 @@ class PubSub:
           within the same process.
     """
 
-    def __init__(self):
+    def __init__(self, maxsize: int = 0):
         self._topics: dict[str, set[weakref.ref[asyncio.Queue]]] = defaultdict(set)
+        self._maxsize = maxsize
 
     def _cleanup(self, topic: str, ref: weakref.ref) -> None:
         # Remove references that were GC'd or explicitly unsubscribed.
@@ -191,7 +225,7 @@ class PubSub:
                     )
 
     def subscribe(self, topic: str):
-        q = asyncio.Queue()
+        q = asyncio.Queue(maxsize=self._maxsize)
         self_ref = weakref.ref(self)
 
         def _cleanup_cb(_ref: Optional[weakref.ref] = None):
@@ -212,11 +246,409 @@ class PubSub:
         return gen()
 
 
+def _replace_queue_contents(q: asyncio.Queue, item) -> None:
+    "Discard everything waiting in q and leave item as its only entry."
+    while not q.empty():
+        q.get_nowait()
+    q.put_nowait(item)
+
+
+class RedisPubSubMultiplexer:
+    """
+    Share one Redis pub/sub connection among all subscribers in a process.
+
+    Each websocket subscriber would otherwise open its own pub/sub connection
+    and SUBSCRIBE, so N viewers of one node meant N Redis connections per
+    worker and N parses of every notification. This class holds a single
+    pub/sub connection, SUBSCRIBEs to each channel when its first local
+    subscriber arrives, UNSUBSCRIBEs when its last one leaves (reference
+    counting), and fans parsed notifications out to per-subscriber queues, in
+    the manner of PubSub.
+
+    The queues are not bounded here: each websocket handler moves what arrives
+    straight into its SubscriberBuffer, which is bounded and applies the slow
+    subscriber policy.
+
+    If the shared connection fails, every subscriber's iterator raises the
+    error, and the next subscription opens a fresh connection.
+
+    Thread-safety: This class is NOT thread-safe and is intended for use within
+    a single asyncio event loop (i.e., within a single thread).
+    """
+
+    def __init__(self, client: redis.Redis):
+        self._client = client
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._channels: dict[str, set[asyncio.Queue]] = {}
+
+    @property
+    def channels(self) -> dict[str, int]:
+        "Map each subscribed channel to its number of local subscribers"
+        return {channel: len(queues) for channel, queues in self._channels.items()}
+
+    async def subscribe(self, channel: str):
+        """
+        Subscribe to a channel.
+
+        Returns an async iterator of sequence numbers published on the channel
+        and an async cleanup callback that unsubscribes it.
+        """
+        q = asyncio.Queue()
+        async with self._lock:
+            queues = self._channels.get(channel)
+            if queues is None:
+                await self._start(channel)
+                queues = self._channels[channel] = set()
+            queues.add(q)
+
+        async def gen():
+            while True:
+                item = await q.get()
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+
+        async def cleanup():
+            await self._unsubscribe(channel, q)
+
+        return gen(), cleanup
+
+    async def _unsubscribe(self, channel: str, q: asyncio.Queue):
+        async with self._lock:
+            queues = self._channels.get(channel)
+            if queues is None or q not in queues:
+                # Already dropped, e.g. after a connection failure.
+                return
+            queues.discard(q)
+            if not queues:
+                del self._channels[channel]
+                await self._stop(channel)
+
+    async def _start(self, channel: str):
+        "Start reading a channel, for its first local subscriber"
+        if self._pubsub is None:
+            self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(channel)
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read(self._pubsub))
+
+    async def _stop(self, channel: str):
+        "Stop reading a channel, once its last local subscriber has left"
+        try:
+            await self._pubsub.unsubscribe(channel)
+        except Exception as e:
+            logger.warning(f"Error unsubscribing from {channel}: {e}")
+
+    def _fanout(self, channel: str, sequence: int) -> int:
+        "Put a sequence on each subscriber's queue; return how many there are."
+        queues = self._channels.get(channel, ())
+        for q in queues:
+            q.put_nowait(sequence)
+        return len(queues)
+
+    async def _read(self, pubsub):
+        # Runs until no channels remain subscribed, at which point listen()
+        # returns; the next subscribe() starts a new reader.
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                try:
+                    sequence = int(message["data"])
+                except Exception as e:
+                    logger.exception(f"Error parsing live message: {e}")
+                    continue
+                self._fanout(channel, sequence)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"Shared Redis subscription failed: {e}")
+            async with self._lock:
+                channels, self._channels = self._channels, {}
+                if self._pubsub is pubsub:
+                    self._pubsub = None
+            for queues in channels.values():
+                for q in queues:
+                    _replace_queue_contents(q, e)
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+    async def aclose(self):
+        async with self._lock:
+            if self._reader is not None:
+                self._reader.cancel()
+                try:
+                    await self._reader
+                except asyncio.CancelledError:
+                    pass
+                self._reader = None
+            if self._pubsub is not None:
+                await self._pubsub.aclose()
+                self._pubsub = None
+            self._channels.clear()
+
+
+class RedisStreamsMultiplexer(RedisPubSubMultiplexer):
+    """
+    Share one blocking XREAD reader per Redis Stream among all subscribers in
+    a process.
+
+    Each websocket subscriber would otherwise issue its own blocking XREAD, so
+    N viewers of one node meant N Redis connections per worker and N transfers
+    of every message. This reads each stream once, from the first local
+    subscriber to the last, and fans sequence numbers out to per-subscriber
+    queues as RedisPubSubMultiplexer does (with the same handling of
+    failures). Channels are stream keys.
+
+    The entries read are held, whole, until every subscriber has taken them
+    (see take), so that subscribers need not fetch them again. At most
+    ``max_entries`` are held per stream: subscribers that skip entries, or fall
+    behind, fetch older ones from Redis instead.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        block_ms: int = 5_000,
+        max_entries: int = 100,
+    ):
+        super().__init__(client)
+        self._block_ms = block_ms
+        self._max_entries = max_entries
+        self._readers: dict[str, asyncio.Task] = {}
+        # Map each stream to {sequence: [entry, subscribers yet to take it]}.
+        self._entries: dict[str, collections.OrderedDict] = {}
+
+    def take(self, stream: str, sequence: int) -> Optional[dict]:
+        "Return an entry read live from a stream, if it is still held, or None."
+        entries = self._entries.get(stream)
+        held = entries.get(sequence) if entries is not None else None
+        if held is None:
+            return None
+        held[1] -= 1
+        if held[1] <= 0:
+            del entries[sequence]
+        return held[0]
+
+    async def _start(self, stream: str):
+        # Start from the end of the stream as it is now, so that only messages
+        # appended after subscribing are delivered live. ("$" is not used
+        # because re-issuing it after a timeout would skip any messages
+        # appended in between.)
+        last_id = "0-0"
+        entries = await self._client.xrevrange(stream, count=1)
+        if entries:
+            last_id = entries[0][0]
+        self._entries[stream] = collections.OrderedDict()
+        self._readers[stream] = asyncio.create_task(self._read_stream(stream, last_id))
+
+    async def _stop(self, stream: str):
+        reader = self._readers.pop(stream)
+        self._entries.pop(stream, None)
+        reader.cancel()
+        try:
+            await reader
+        except asyncio.CancelledError:
+            pass
+
+    async def _read_stream(self, stream: str, last_id):
+        entries = self._entries[stream]
+        try:
+            while True:
+                response = await self._client.xread(
+                    {stream: last_id}, block=self._block_ms
+                )
+                for _, stream_entries in response:
+                    for entry_id, mapping in stream_entries:
+                        last_id = entry_id
+                        sequence = int(mapping[b"sequence"])
+                        entries[sequence] = [mapping, self._fanout(stream, sequence)]
+                        while len(entries) > self._max_entries:
+                            entries.popitem(last=False)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"Shared Redis stream reader failed on {stream}: {e}")
+            async with self._lock:
+                queues = self._channels.pop(stream, set())
+                if self._readers.get(stream) is asyncio.current_task():
+                    del self._readers[stream]
+                    self._entries.pop(stream, None)
+            for q in queues:
+                _replace_queue_contents(q, e)
+
+    async def aclose(self):
+        async with self._lock:
+            for stream in list(self._readers):
+                await self._stop(stream)
+            self._channels.clear()
+
+
 # Sentinel pushed onto the live-event buffer when the live subscription drops
 # (e.g. a Redis failover). It signals the handler to close the socket abnormally
 # so the client reconnects and replays any sequences missed during the outage.
 _LIVE_SUBSCRIPTION_LOST = object()
 
+# Sentinel left on a subscriber's buffer, under the "disconnect" policy, when
+# the subscriber falls too far behind. The handler closes the socket with a
+# resumable close code, and the client replays from its last sequence.
+_SUBSCRIBER_TOO_SLOW = object()
+
+SLOW_SUBSCRIBER_POLICIES = ("disconnect", "drop-oldest", "coalesce")
+
+# The metrics labeled by node. Their series for a node are removed when its last
+# websocket subscriber in this process leaves, so that a long-running server
+# does not export a series for every node that was ever streamed.
+_NODE_METRICS = (
+    STREAM_SUBSCRIBER_QUEUE_DEPTH,
+    STREAM_SUBSCRIBER_LAG,
+    STREAM_SUBSCRIBERS,
+    STREAM_REPLAY_DURATION,
+    STREAM_REPLAY_MESSAGES,
+)
+_subscribers_per_node: collections.Counter = collections.Counter()
+
+
+def _add_node_subscriber(node_id: str) -> None:
+    _subscribers_per_node[node_id] += 1
+
+
+def _remove_node_subscriber(node_id: str) -> None:
+    _subscribers_per_node[node_id] -= 1
+    if _subscribers_per_node[node_id] > 0:
+        return
+    del _subscribers_per_node[node_id]
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        # prometheus_client cannot remove series in multiprocess mode.
+        return
+    for metric in _NODE_METRICS:
+        metric.remove(node_id)
+    for policy in SLOW_SUBSCRIBER_POLICIES:
+        STREAM_DROPPED_TOTAL.remove(node_id, policy)
+
+
+@dataclasses.dataclass
+class _Coalesced:
+    "Stands in for the latest sequence plus the backlog skipped to reach it."
+    sequence: int
+    skipped: int
+
+
+class SubscriberBuffer:
+    """
+    Bounded buffer of live sequence numbers awaiting send to one subscriber.
+
+    Putting never blocks, so a slow subscriber cannot stall the live source
+    feeding it. When the buffer is full, the policy decides what gives:
+
+    - "disconnect" discards the backlog and leaves a marker telling the
+      handler to close the websocket with a resumable close code, so that the
+      client reconnects and replays from its last received sequence.
+    - "drop-oldest" discards the oldest buffered message.
+    - "coalesce" collapses the whole backlog into one marker for the latest
+      sequence, which the handler sends as an "array-ref" pointing at the
+      latest data (for arrays; other nodes fall back to "disconnect").
+
+    A maxsize of 0 means unbounded.
+    """
+
+    def __init__(self, node_id, maxsize: int = 0, policy: str = "disconnect"):
+        if policy not in SLOW_SUBSCRIBER_POLICIES:
+            raise ValueError(
+                f"Unknown slow subscriber policy {policy!r}. "
+                f"Options are: {SLOW_SUBSCRIBER_POLICIES}"
+            )
+        self.maxsize = maxsize
+        self.policy = policy
+        self.latest = 0  # newest sequence put so far
+        self.too_slow = False
+        self._items = collections.deque()
+        self._nonempty = asyncio.Event()
+        self._depth = STREAM_SUBSCRIBER_QUEUE_DEPTH.labels(node_id=str(node_id))
+        self._dropped = STREAM_DROPPED_TOTAL.labels(node_id=str(node_id), policy=policy)
+
+    def __len__(self):
+        return len(self._items)
+
+    def _clear(self) -> int:
+        skipped = 0
+        for item in self._items:
+            if isinstance(item, _Coalesced):
+                skipped += item.skipped + 1
+            elif isinstance(item, int):
+                skipped += 1
+        self._depth.dec(len(self._items))
+        self._items.clear()
+        return skipped
+
+    def put(self, item) -> None:
+        if isinstance(item, int):
+            self.latest = max(self.latest, item)
+            if self.too_slow:
+                # The subscriber is being disconnected; nothing more is sent.
+                self._dropped.inc()
+                return
+            if self.maxsize and len(self._items) >= self.maxsize:
+                if self.policy == "disconnect":
+                    self._dropped.inc(self._clear() + 1)
+                    self.too_slow = True
+                    item = _SUBSCRIBER_TOO_SLOW
+                elif self.policy == "drop-oldest":
+                    self._items.popleft()
+                    self._depth.dec()
+                    self._dropped.inc()
+                else:  # coalesce
+                    skipped = self._clear()
+                    self._dropped.inc(skipped)
+                    item = _Coalesced(sequence=item, skipped=skipped)
+        self._items.append(item)
+        self._depth.inc()
+        self._nonempty.set()
+
+    async def get(self):
+        while not self._items:
+            self._nonempty.clear()
+            await self._nonempty.wait()
+        self._depth.dec()
+        return self._items.popleft()
+
+    def close(self) -> None:
+        "Release anything still buffered, e.g. when the subscriber goes away."
+        self._clear()
+
+
+def _coalesce(metadata, coalesced):
+    """
+    Turn the latest message into an array-ref standing in for a skipped backlog.
+
+    Only a message that covers the whole array can stand in for everything
+    before it, so return None for anything else.
+    """
+    if metadata.get("type") == "array-data":
+        if metadata.get("block") is not None or metadata.get("offset") is not None:
+            return None
+    elif metadata.get("type") == "array-ref":
+        if metadata.get("patch"):
+            return None
+    else:
+        return None
+    return {
+        "type": "array-ref",
+        "sequence": metadata["sequence"],
+        "timestamp": metadata["timestamp"],
+        "data_source": metadata.get("data_source"),
+        "patch": None,
+        "shape": metadata["shape"],
+        "coalesced": coalesced.skipped,
+    }
+
 
 def _make_ws_handler_common(
     *,
@@ -230,6 +662,9 @@ def _make_ws_handler_common(
     live_sequence_source: Callable[
         [], Any
     ],  # returns (AsyncIterator[int], Optional[Callable[[], Awaitable[None]]])
+    buffer_size: int = 0,
+    get_range_func: Optional[Callable[[int, int], Any]] = None,
+    slow_subscriber_policy: str = "disconnect",
 ):
     """
     Create a websocket handler that implements the streaming protocol for a node.
@@ -238,9 +673,10 @@ def _make_ws_handler_common(
     ----------
     websocket : fastapi.WebSocket
         The websocket connection to communicate with the client.
-    formatter : Callable[[Any, Any, Optional[int]], Awaitable[None]]
+    formatter : Callable[..., Awaitable[None]]
         Async function to serialize and send data to the websocket.
-        Typically, it takes (websocket, data, sequence).
+        It takes (websocket, metadata, payload_bytes) and an optional keyword
+        argument replay, which is True for messages sent during replay.
     uri : str
         The URI identifying the resource being streamed.
     node_id : str
@@ -254,6 +690,16 @@ def _make_ws_handler_common(
     live_sequence_source : Callable[[], Tuple[AsyncIterator[int], Optional[Callable[[], Awaitable[None]]]]]
         Function returning an async iterator of new sequence numbers as they become available,
         and optionally a cleanup callback to be awaited when the stream ends.
+    buffer_size : int, optional
+        Maximum number of live sequence numbers buffered for this websocket while
+        it is busy sending. 0 means unbounded.
+    get_range_func : Callable[[int, int], AsyncIterator[Tuple[bytes, bytes]]], optional
+        Function yielding (payload, metadata) for every message from a start to
+        a stop sequence number, inclusive, for datastores that can replay a range
+        in one query. If not given, replay calls get_func once per sequence.
+    slow_subscriber_policy : str, optional
+        What to do when the buffer is full: "disconnect" (the default),
+        "drop-oldest", or "coalesce". See SubscriberBuffer.
 
     Returns
     -------
@@ -275,6 +721,21 @@ def _make_ws_handler_common(
     """
 
     async def handler(sequence: Optional[int] = None, already_accepted: bool = False):
+        # Look up the metrics' series only once the subscriber is counted, so
+        # that they are not removed, by another subscriber leaving, while in use.
+        _add_node_subscriber(str(node_id))
+        subscribers = STREAM_SUBSCRIBERS.labels(node_id=str(node_id))
+        subscribers.inc()
+        try:
+            await serve(sequence, already_accepted)
+        finally:
+            subscribers.dec()
+            _remove_node_subscriber(str(node_id))
+
+    async def serve(sequence: Optional[int], already_accepted: bool):
+        lag = STREAM_SUBSCRIBER_LAG.labels(node_id=str(node_id))
+        replay_duration = STREAM_REPLAY_DURATION.labels(node_id=str(node_id))
+        replay_messages = STREAM_REPLAY_MESSAGES.labels(node_id=str(node_id))
         if not already_accepted:
             await websocket.accept()
         end_stream = asyncio.Event()
@@ -282,19 +743,32 @@ def _make_ws_handler_common(
         # Send schema to provide client context to interpret what follows.
         await formatter(websocket, schema, None)
 
-        async def stream_data(sequence):
+        replayed = 0
+
+        async def stream_data(sequence, coalesced=None, replay=False):
             """Helper function to stream a specific sequence number to a websocket"""
 
             key = f"data:{node_id}:{sequence}"
             payload_bytes, metadata_bytes = await get_func(key, "payload", "metadata")
+            return await send_data(payload_bytes, metadata_bytes, coalesced, replay)
+
+        async def send_data(
+            payload_bytes, metadata_bytes, coalesced=None, replay=False
+        ):
+            nonlocal replayed
             if metadata_bytes is None:
                 # This means that the data is no longer available (either expired or not found)
-                return
+                return True
             metadata = orjson.loads(metadata_bytes)
             if metadata.get("end_of_stream"):
                 # This means that the stream is closed by the producer
                 end_stream.set()
-                return
+                return True
+            if coalesced is not None:
+                metadata = _coalesce(metadata, coalesced)
+                if metadata is None:
+                    return False
+                payload_bytes = None
             if metadata.get("type") == "array-ref":
                 if metadata.get("patch"):
                     s = ",".join(
@@ -307,18 +781,23 @@ def _make_ws_handler_common(
                 else:
                     s = ",".join(f":{dim}" for dim in metadata["shape"])
                     metadata["uri"] = f"{uri}?slice={s}"
-            await formatter(websocket, metadata, payload_bytes)
+            await formatter(websocket, metadata, payload_bytes, replay=replay)
+            if replay:
+                replayed += 1
+            return True
 
         # Setup buffer
-        stream_buffer = asyncio.Queue()
+        stream_buffer = SubscriberBuffer(
+            node_id, maxsize=buffer_size, policy=slow_subscriber_policy
+        )
 
         live_iter, live_cleanup = await live_sequence_source()
 
         async def buffer_live_events():
-            """Function that adds currently streaming data to an asyncio.Queue"""
+            """Function that adds currently streaming data to a SubscriberBuffer"""
             try:
                 async for live_seq in live_iter:
-                    await stream_buffer.put(live_seq)
+                    stream_buffer.put(live_seq)
             except asyncio.CancelledError:
                 # Task cancelled during shutdown.
                 pass
@@ -328,7 +807,7 @@ def _make_ws_handler_common(
                 )
                 # Enqueue a sentinel to wake the main loop, which is otherwise
                 # blocked forever on an empty buffer now that this task has died.
-                await stream_buffer.put(_LIVE_SUBSCRIPTION_LOST)
+                stream_buffer.put(_LIVE_SUBSCRIPTION_LOST)
             finally:
                 if live_cleanup is not None:
                     await live_cleanup()
@@ -340,8 +819,17 @@ def _make_ws_handler_common(
             # If a sequence number is passed, replay old data
             current_seq = last_sent = int(await current_sequence_getter())
             logger.debug("Replaying old data...")
-            for s in range(sequence, current_seq + 1):
-                await stream_data(s)
+            replay_start = time.perf_counter()
+            if get_range_func is None:
+                for s in range(sequence, current_seq + 1):
+                    await stream_data(s, replay=True)
+            else:
+                async for payload_bytes, metadata_bytes in get_range_func(
+                    sequence, current_seq
+                ):
+                    await send_data(payload_bytes, metadata_bytes, replay=True)
+            replay_duration.observe(time.perf_counter() - replay_start)
+            replay_messages.observe(replayed)
         # Finally stream all buffered data into the websocket
         try:
             while not end_stream.is_set():
@@ -355,10 +843,24 @@ def _make_ws_handler_common(
                     await websocket.close(code=1012, reason="Live subscription lost")
                     return
 
+                if live_seq is _SUBSCRIBER_TOO_SLOW:
+                    # 1013 (Try Again Later) is also abnormal, so the client
+                    # reconnects and resumes from its last received sequence.
+                    await websocket.close(code=1013, reason="Subscriber too slow")
+                    return
+
+                if isinstance(live_seq, _Coalesced):
+                    if not await stream_data(live_seq.sequence, coalesced=live_seq):
+                        await websocket.close(code=1013, reason="Subscriber too slow")
+                        return
+                    last_sent = live_seq.sequence
+                    continue
+
                 # Skip duplicates or already replayed messages
                 if live_seq <= last_sent:
                     continue
 
+                lag.observe(stream_buffer.latest - live_seq)
                 await stream_data(live_seq)
                 last_sent = live_seq
 
@@ -368,6 +870,7 @@ def _make_ws_handler_common(
         finally:
             live_task.cancel()
             await live_task
+            stream_buffer.close()
 
     return handler
 
@@ -417,7 +920,11 @@ class TTLCacheDatastore(StreamingDatastore):
         self._data_cache = cachetools.TTLCache(
             maxsize=maxsize, ttl=self._settings.get("data_ttl", 2592000)
         )
-        self._pubsub = PubSub()
+        self.subscriber_queue_size = self._settings.get("subscriber_queue_size", 1000)
+        self.slow_subscriber_policy = self._settings.get(
+            "slow_subscriber_policy", "disconnect"
+        )
+        self._pubsub = PubSub(maxsize=self.subscriber_queue_size)
 
     @property
     def client(self):
@@ -485,6 +992,8 @@ class TTLCacheDatastore(StreamingDatastore):
             get_func=self.get,
             current_sequence_getter=current_sequence_getter,
             live_sequence_source=live_sequence_source,
+            buffer_size=self.subscriber_queue_size,
+            slow_subscriber_policy=self.slow_subscriber_policy,
         )
 
 
@@ -495,6 +1004,12 @@ class RedisStreamingDatastore(StreamingDatastore):
         self._client = _build_redis_client(settings)
         self.data_ttl = self._settings["data_ttl"]
         self.seq_ttl = self._settings["seq_ttl"]
+        self.subscriber_queue_size = self._settings.get("subscriber_queue_size", 1000)
+        self.slow_subscriber_policy = self._settings.get(
+            "slow_subscriber_policy", "disconnect"
+        )
+        # One pub/sub connection per process, shared by all websocket clients.
+        self._multiplexer = RedisPubSubMultiplexer(self._client)
 
     @property
     def client(self) -> redis.Redis:
@@ -553,22 +1068,7 @@ class RedisStreamingDatastore(StreamingDatastore):
             return int(current_seq) if current_seq is not None else 0
 
         async def live_sequence_source():
-            pubsub = self.client.pubsub()
-            await pubsub.subscribe(f"notify:{node_id}")
-
-            async def live_iter():
-                async for message in pubsub.listen():
-                    if message.get("type") == "message":
-                        try:
-                            yield int(message["data"])
-                        except Exception as e:
-                            logger.exception(f"Error parsing live message: {e}")
-
-            async def cleanup():
-                await pubsub.unsubscribe(f"notify:{node_id}")
-                await pubsub.aclose()
-
-            return live_iter(), cleanup
+            return await self._multiplexer.subscribe(f"notify:{node_id}")
 
         return _make_ws_handler_common(
             websocket=websocket,
@@ -579,4 +1079,235 @@ class RedisStreamingDatastore(StreamingDatastore):
             get_func=self.get,
             current_sequence_getter=current_sequence_getter,
             live_sequence_source=live_sequence_source,
+            buffer_size=self.subscriber_queue_size,
+            slow_subscriber_policy=self.slow_subscriber_policy,
+        )
+
+
+# Append one message to a node's stream with the entry ID "<sequence>-0", so
+# that XRANGE can seek straight to a sequence number. The sequence number is
+# not assigned here but by incr_seq, beforehand (see RedisStreamsDatastore), so
+# writers may append out of order. If a concurrent writer has
+# already appended a later sequence, stream IDs must still increase, so the
+# message is appended just after the last entry instead, and its entry ID is
+# recorded in a sorted set of late entries, scored by sequence number, where
+# lookups by sequence find it. The "sequence" field always holds the true
+# sequence number.
+#
+# KEYS: stream key, sequence counter key, late entries key
+# ARGV: sequence, maxlen, data_ttl, seq_ttl, field, value, [field, value, ...]
+_XADD_SEQUENCE_SCRIPT = """
+local id = ARGV[1] .. '-0'
+local late = false
+local last = redis.call('XREVRANGE', KEYS[1], '+', '-', 'COUNT', 1)
+if #last > 0 then
+    local ms, seq = string.match(last[1][1], '(%d+)-(%d+)')
+    if tonumber(ms) >= tonumber(ARGV[1]) then
+        id = ms .. '-' .. (tonumber(seq) + 1)
+        late = true
+    end
+end
+redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[2], id, unpack(ARGV, 5))
+if late then
+    redis.call('ZADD', KEYS[3], ARGV[1], id)
+    redis.call('ZREMRANGEBYRANK', KEYS[3], 0, -1 - tonumber(ARGV[2]))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+redis.call('EXPIRE', KEYS[3], ARGV[3])
+return id
+"""
+
+
+@register_datastore("redis-streams")
+class RedisStreamsDatastore(StreamingDatastore):
+    """
+    A Redis-backed streaming datastore that keeps each node's messages in a
+    Redis Stream.
+
+    Compared with the "redis" datastore, which stores each message in its own
+    hash with its own EXPIRE and PUBLISHes a notification, this:
+
+    - appends each message with a single scripted XADD (one round trip),
+    - replays history with one XRANGE over the requested sequence range,
+    - delivers live messages by blocking XREAD, with no separate pub/sub and
+      one reader per stream per process (see RedisStreamsMultiplexer), and
+    - bounds memory by length (approximate MAXLEN trimming) rather than by
+      per-message TTL.
+
+    Stream entry IDs are "<sequence>-0", so replaying from a sequence number is
+    an O(log n) seek. Sequence numbers are not assigned atomically with the
+    XADD, because the StreamingDatastore protocol assigns them in a separate
+    step: callers get one from incr_seq (an INCR, as for the "redis"
+    datastore) and build the message around it before calling set. So
+    concurrent writers may append out of order. A sequence written after a
+    later one is appended under the next free ID and indexed by its sequence
+    number in a sorted set (trimmed to ``stream_maxlen``), so that it is still
+    found, and replayed in order.
+    The stream key expires after ``data_ttl`` seconds without writes, so
+    abandoned streams are still culled.
+
+    Configuration:
+        settings: dict with, in addition to the Redis connection settings used
+        by the "redis" datastore, the following keys:
+            - data_ttl (int): Seconds an idle stream is retained.
+            - seq_ttl (int): Seconds an idle sequence counter is retained.
+            - stream_maxlen (int, optional): Approximate number of messages
+              retained per node. Defaults to 10000.
+            - stream_block_ms (int, optional): Milliseconds each blocking XREAD
+              waits before re-issuing. Defaults to 5000.
+
+    Requires Redis >= 5.0.
+    """
+
+    def __init__(self, settings: Dict[str, Any]):
+        self._settings = settings
+        self._client = _build_redis_client(settings)
+        self.data_ttl = self._settings["data_ttl"]
+        self.seq_ttl = self._settings["seq_ttl"]
+        self.maxlen = self._settings.get("stream_maxlen") or 10_000
+        self.block_ms = self._settings.get("stream_block_ms") or 5_000
+        self.subscriber_queue_size = self._settings.get("subscriber_queue_size", 1000)
+        self.slow_subscriber_policy = self._settings.get(
+            "slow_subscriber_policy", "disconnect"
+        )
+        self._xadd = self._client.register_script(_XADD_SEQUENCE_SCRIPT)
+        # One blocking XREAD per stream per process, shared by all websocket
+        # clients of the node.
+        self._multiplexer = RedisStreamsMultiplexer(
+            self._client, block_ms=self.block_ms
+        )
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._client
+
+    async def incr_seq(self, node_id: str) -> int:
+        return await self.client.incr(f"sequence:{node_id}")
+
+    async def _append(self, node_id, sequence, mapping, seq_ttl):
+        fields = [item for pair in mapping.items() for item in pair]
+        await self._xadd(
+            keys=[f"stream:{node_id}", f"sequence:{node_id}", f"late:{node_id}"],
+            args=[sequence, self.maxlen, self.data_ttl, seq_ttl, *fields],
+        )
+
+    async def set(self, node_id, sequence, metadata, payload=None):
+        mapping = {
+            "sequence": sequence,
+            "metadata": safe_json_dump(metadata),
+        }
+        if payload:
+            mapping["payload"] = payload
+        await self._append(node_id, sequence, mapping, self.seq_ttl)
+
+    async def close(self, node_id):
+        # Increment the counter for this node.
+        sequence = await self.incr_seq(node_id)
+        # Append a special message (end_of_stream) that will signal
+        # any open clients to close.
+        metadata = {
+            "timestamp": datetime.now().isoformat(),
+            "end_of_stream": True,
+        }
+        mapping = {"sequence": sequence, "metadata": safe_json_dump(metadata)}
+        # Expire the sequence more aggressively, as the "redis" datastore does.
+        await self._append(node_id, sequence, mapping, 1 + self.data_ttl)
+
+    async def _entry(self, key, entry_id):
+        entries = await self.client.xrange(key, min=entry_id, max=entry_id, count=1)
+        return entries[0][1] if entries else None
+
+    async def get(self, key, *fields):
+        # Keys have the form data:{node_id}:{sequence}, as for the other
+        # datastores.
+        _, node_id, sequence = key.rsplit(":", 2)
+        mapping = await self._entry(f"stream:{node_id}", f"{sequence}-0")
+        if mapping is None:
+            # A message written late is stored under a later entry ID.
+            late = await self.client.zrangebyscore(
+                f"late:{node_id}", sequence, sequence, start=0, num=1
+            )
+            if late:
+                mapping = await self._entry(f"stream:{node_id}", late[0])
+        if mapping is None:
+            return [None for _ in fields]
+        return [mapping.get(field.encode()) for field in fields]
+
+    async def get_range(self, node_id, start, stop):
+        """
+        Yield (payload, metadata) for each message from sequence start to stop.
+
+        Messages are yielded in order of sequence number, with those written
+        late merged in from the index of late entries.
+        """
+        key = f"stream:{node_id}"
+        late = [
+            (int(score), entry_id)
+            for entry_id, score in await self.client.zrangebyscore(
+                f"late:{node_id}", start, stop, withscores=True
+            )
+        ]
+        late.sort()
+        late.reverse()  # to pop the lowest sequence first
+
+        async def late_before(sequence):
+            while late and late[-1][0] < sequence:
+                _, entry_id = late.pop()
+                mapping = await self._entry(key, entry_id)
+                if mapping is not None:
+                    yield mapping
+
+        min_id = f"{start}-0"
+        while True:
+            entries = await self.client.xrange(
+                key, min=min_id, max=f"{stop}-0", count=100
+            )
+            for entry_id, mapping in entries:
+                if not entry_id.endswith(b"-0"):
+                    # Written late; yielded in order, from the index.
+                    continue
+                async for late_mapping in late_before(int(mapping[b"sequence"])):
+                    yield late_mapping.get(b"payload"), late_mapping.get(b"metadata")
+                yield mapping.get(b"payload"), mapping.get(b"metadata")
+            if len(entries) < 100:
+                break
+            # Continue exclusively after the last entry returned.
+            min_id = f"({entries[-1][0].decode()}"
+        async for late_mapping in late_before(stop + 1):
+            yield late_mapping.get(b"payload"), late_mapping.get(b"metadata")
+
+    def make_ws_handler(self, websocket, formatter, uri, node_id, schema):
+        stream = f"stream:{node_id}"
+
+        async def get_func(key, *fields):
+            # Live entries arrive whole from the shared XREAD; do not fetch
+            # them again.
+            mapping = self._multiplexer.take(stream, int(key.rsplit(":", 1)[1]))
+            if mapping is None:
+                return await self.get(key, *fields)
+            return [mapping.get(field.encode()) for field in fields]
+
+        def get_range_func(start, stop):
+            return self.get_range(node_id, start, stop)
+
+        async def current_sequence_getter():
+            current_seq = await self.client.get(f"sequence:{node_id}")
+            return int(current_seq) if current_seq is not None else 0
+
+        async def live_sequence_source():
+            return await self._multiplexer.subscribe(stream)
+
+        return _make_ws_handler_common(
+            websocket=websocket,
+            formatter=formatter,
+            uri=uri,
+            node_id=node_id,
+            schema=schema,
+            get_func=get_func,
+            current_sequence_getter=current_sequence_getter,
+            live_sequence_source=live_sequence_source,
+            buffer_size=self.subscriber_queue_size,
+            slow_subscriber_policy=self.slow_subscriber_policy,
+            get_range_func=get_range_func,
         )
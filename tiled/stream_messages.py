@@ -56,6 +56,8 @@ class TableSchema(Schema):
 class Update(BaseModel):
     sequence: int = Field(gt=0)
     timestamp: datetime
+    # When the server received the message, in seconds since the UNIX epoch
+    server_received_at: Optional[float] = None
 
 
 class ChildCreated(Update):
@@ -94,11 +96,15 @@ class ArrayPatch(BaseModel):
 
 class ArrayRef(Update):
     type: Literal["array-ref"] = "array-ref"
-    data_source: DataSource[ArrayStructure]
+    # data_source is None when this reference was coalesced from array-data.
+    data_source: Optional[DataSource[ArrayStructure]]
     patch: Optional[ArrayPatch]
     uri: Optional[str]
     shape: tuple[int, ...]
     data_type: Union[BuiltinDtype, StructDtype]
+    # The number of earlier updates, skipped because the subscriber fell
+    # behind, that this reference to the latest data stands in for.
+    coalesced: int = 0
 
 
 class TableData(Update):
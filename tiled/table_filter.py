@@ -0,0 +1,231 @@
+"""
+Select the rows of a table: by position, with `?rows=start:stop` (`?rows=-N:`
+for the last N rows), and by value, with `?filter=<expression>`.
+
+A filter expression is a restricted Python expression over column names:
+comparisons (==, !=, <, <=, >, >=, chained as in `0 < x <= 10`), membership
+(`x in [1, 2, 3]`, `x not in ("a", "b")`), boolean columns, and `and`, `or`,
+`not`, with parentheses. Literals are numbers, strings, and True/False. Nothing
+else parses: no attributes, calls, or subscripts. For example,
+
+    energy > 1.5 and detector in ["a", "b"] and not saturated
+
+An expression compiles both to a pyarrow.compute expression, which adapters
+reading with pyarrow.dataset push down to the file format (skipping Parquet row
+groups whose statistics exclude it), and to a mask over a pandas DataFrame.
+"""
+
+import ast
+import operator
+import re
+from typing import Any, Callable, FrozenSet, List, Optional
+
+MAX_FILTER_LENGTH = 4096
+MAX_FILTER_DEPTH = 64
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+_ROWS_PATTERN = re.compile(r"^\s*(-?\d+|)\s*:\s*(\d*)\s*$")
+
+
+class TableFilter:
+    """A filter expression over the columns of a table
+
+    Parameters
+    ----------
+    text : str
+        The expression; see the module docstring for the grammar
+
+    Raises
+    ------
+    ValueError
+        If the expression does not parse or uses anything outside the grammar
+    """
+
+    def __init__(self, text: str) -> None:
+        if len(text) > MAX_FILTER_LENGTH:
+            raise ValueError(
+                f"Filter expression is longer than {MAX_FILTER_LENGTH} characters."
+            )
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+        except (SyntaxError, RecursionError):
+            raise ValueError(f"Could not parse filter expression {text!r}.")
+        self.text = text
+        self._body = tree.body
+        columns: List[str] = []
+        # Validate the whole expression up front, recording the columns it uses.
+        self.compile(lambda name: columns.append(name) or _Placeholder())
+        self.columns: FrozenSet[str] = frozenset(columns)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.text!r})"
+
+    def __str__(self) -> str:
+        return self.text
+
+    def expression(self):
+        "Compile to a pyarrow.compute.Expression"
+        import pyarrow.compute
+
+        return self.compile(pyarrow.compute.field)
+
+    def mask(self, df):
+        "Compile to a boolean Series selecting the rows of a pandas DataFrame"
+        return self.compile(df.__getitem__)
+
+    def apply(self, df):
+        "Select the rows of a pandas DataFrame that match"
+        try:
+            return df[self.mask(df)]
+        except TypeError as err:
+            raise ValueError(f"Cannot apply filter {self.text!r}: {err}")
+
+    def compile(self, field: Callable[[str], Any]) -> Any:
+        """Compile with `field(name)` standing in for each column
+
+        The objects that `field` returns must support the comparison operators,
+        `&`, `|`, and `~` (as pyarrow.compute expressions and pandas Series do)
+        and an `isin(values)` method.
+        """
+        return _compile(self._body, field)
+
+
+class _Placeholder:
+    "Stands in for a column while validating an expression"
+
+    def __getattr__(self, name):
+        return lambda *args: self
+
+    def __eq__(self, other):
+        return self
+
+    def __ne__(self, other):
+        return self
+
+    __lt__ = __le__ = __gt__ = __ge__ = __eq__
+    __and__ = __or__ = __rand__ = __ror__ = __eq__
+
+    def __invert__(self):
+        return self
+
+
+def _literal(node: ast.AST) -> Any:
+    if isinstance(node, ast.Constant) and isinstance(
+        node.value, (bool, int, float, str)
+    ):
+        return node.value
+    if (
+        isinstance(node, ast.UnaryOp)
+        and isinstance(node.op, (ast.USub, ast.UAdd))
+        and isinstance(node.operand, ast.Constant)
+        and isinstance(node.operand.value, (int, float))
+        and not isinstance(node.operand.value, bool)
+    ):
+        value = node.operand.value
+        return -value if isinstance(node.op, ast.USub) else value
+    raise ValueError(f"Unsupported term in filter expression: {ast.unparse(node)!r}")
+
+
+def _operand(node: ast.AST, field: Callable[[str], Any]) -> Any:
+    if isinstance(node, ast.Name):
+        return field(node.id)
+    return _literal(node)
+
+
+def _compile(node: ast.AST, field: Callable[[str], Any], depth: int = 0) -> Any:
+    if depth > MAX_FILTER_DEPTH:
+        raise ValueError("Filter expression is nested too deeply.")
+    if isinstance(node, ast.BoolOp):
+        combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        result = _compile(node.values[0], field, depth + 1)
+        for value in node.values[1:]:
+            result = combine(result, _compile(value, field, depth + 1))
+        return result
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return ~_compile(node.operand, field, depth + 1)
+    if isinstance(node, ast.Name):
+        # A boolean column
+        return field(node.id)
+    if isinstance(node, ast.Compare):
+        result = None
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                if not isinstance(left, ast.Name) or not isinstance(
+                    right, (ast.List, ast.Tuple, ast.Set)
+                ):
+                    raise ValueError(
+                        "Membership in a filter expression must be tested as "
+                        "'column in [value, ...]'."
+                    )
+                term = field(left.id).isin([_literal(elt) for elt in right.elts])
+                if isinstance(op, ast.NotIn):
+                    term = ~term
+            elif type(op) in _COMPARISONS:
+                if not (isinstance(left, ast.Name) or isinstance(right, ast.Name)):
+                    raise ValueError(
+                        "Each comparison in a filter expression must involve a column."
+                    )
+                term = _COMPARISONS[type(op)](
+                    _operand(left, field), _operand(right, field)
+                )
+            else:
+                raise ValueError(
+                    f"Unsupported comparison in filter expression: {ast.unparse(node)!r}"
+                )
+            result = term if result is None else result & term
+            left = right
+        return result
+    raise ValueError(f"Unsupported term in filter expression: {ast.unparse(node)!r}")
+
+
+def parse_rows(text: str) -> slice:
+    """Parse a range of rows, 'start:stop', with either bound optional
+
+    A negative start counts from the end, as in a slice: '-10:' is the last 10
+    rows. Raises ValueError if the text is not of that form.
+    """
+    match = _ROWS_PATTERN.match(text)
+    if match is None:
+        raise ValueError(
+            f"Could not parse rows {text!r}; expected 'start:stop' "
+            "with integers, non-negative except for start."
+        )
+    start, stop = (int(bound) if bound else None for bound in match.groups())
+    return slice(start, stop)
+
+
+def columns_to_read(
+    fields: Optional[List[str]], filter: Optional[TableFilter]
+) -> Optional[List[str]]:
+    "Return the columns that must be read to select `fields` with `filter`"
+    if fields is None or filter is None:
+        return fields
+    return list(dict.fromkeys([*fields, *sorted(filter.columns)]))
+
+
+def select_rows(
+    df,
+    fields: Optional[List[str]] = None,
+    rows: Optional[slice] = None,
+    filter: Optional[TableFilter] = None,
+):
+    """Select rows of a pandas DataFrame by position, and then by value
+
+    The DataFrame must include the columns returned by `columns_to_read`; only
+    `fields` (if given) are returned.
+    """
+    if rows is not None:
+        df = df.iloc[rows]
+    if filter is not None:
+        df = filter.apply(df)
+    if fields is not None:
+        df = df[fields]
+    return df